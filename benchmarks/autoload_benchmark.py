@@ -0,0 +1,215 @@
+"""Autoload benchmark on synthetic BIG-IP devices.
+
+Every device size is discovered in a separate process against the in-process
+SNMP replay agent. Wall time of the discovery, peak RSS of the process and the
+number of SNMP round trips are written to results/<version>.json and compared
+with the results of the previous versions.
+
+    python benchmarks/autoload_benchmark.py --sizes 100 1000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import TYPE_CHECKING
+
+BENCHMARKS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARKS_FOLDER))
+sys.path.insert(0, BENCHMARKS_FOLDER)
+
+from synthetic_device import generate_device  # noqa: E402
+
+from cloudshell.shell.standards.networking.autoload_model import (  # noqa: E402
+    NetworkingResourceModel,
+)
+
+from cloudshell.f5.autoload.f5_generic_snmp_autoload import (  # noqa: E402
+    F5FirewallGenericSNMPAutoload,
+    PortDiscoveryEngine,
+)
+from cloudshell.f5.flows.f5_autoload_flow import (  # noqa: E402
+    BigIPAutoloadFlow,
+    prepare_mib_view,
+)
+from cloudshell.f5.snmp.mib_profile import MibProfile  # noqa: E402
+from cloudshell.f5.snmp.replay_agent import (  # noqa: E402
+    ReplaySnmpConfigurator,
+    SnmpReplayAgent,
+)
+
+if TYPE_CHECKING:
+    from typing import Dict, List
+
+SIZES = (100, 1000, 10000, 50000)
+RESULTS_FOLDER = os.path.join(BENCHMARKS_FOLDER, "results")
+VERSION_FILE = os.path.join(os.path.dirname(BENCHMARKS_FOLDER), "version.txt")
+# relative growth reported as a regression
+THRESHOLDS = {"wall_time": 0.2, "peak_rss_kb": 0.1, "round_trips": 0.0}
+
+
+def get_peak_rss_kb() -> int:
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes on Linux
+    return peak_rss // 1024 if sys.platform == "darwin" else peak_rss
+
+
+def run_autoload(
+    interfaces: int,
+    port_engine: str,
+    mib_profile: str,
+    parallel_discovery: bool,
+    latency: float,
+) -> dict:
+    """Discover the synthetic device, runs in the separate process."""
+    # autoload logs aren't a part of the measured work
+    logger = logging.getLogger("autoload_benchmark.autoload")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    agent = SnmpReplayAgent(generate_device(interfaces), latency=latency)
+    rss_before_kb = get_peak_rss_kb()
+    resource_model = NetworkingResourceModel("bigip", "F5 BIG-IP Shell", "CS_Router")
+    with agent, ReplaySnmpConfigurator(agent, logger).get_service() as snmp_service:
+        prepare_mib_view(
+            snmp_service, BigIPAutoloadFlow.MIB_CACHES[MibProfile(mib_profile)], logger
+        )
+        start_time = time.perf_counter()
+        details = F5FirewallGenericSNMPAutoload(
+            snmp_service,
+            logger,
+            parallel_discovery=parallel_discovery,
+            port_engine=PortDiscoveryEngine(port_engine),
+        ).discover(["BIG-IP"], resource_model)
+        wall_time = time.perf_counter() - start_time
+    return {
+        "interfaces": interfaces,
+        "wall_time": round(wall_time, 3),
+        "peak_rss_kb": get_peak_rss_kb(),
+        "dataset_rss_kb": rss_before_kb,
+        "round_trips": agent.requests,
+        "resources": len(details.resources),
+    }
+
+
+def get_version() -> str:
+    with open(VERSION_FILE) as version_file:
+        return version_file.read().strip()
+
+
+def version_key(version: str) -> tuple:
+    return tuple(int(part) if part.isdigit() else 0 for part in version.split("."))
+
+
+def get_scenario(options: argparse.Namespace) -> str:
+    mode = "parallel" if options.parallel else "serial"
+    return f"{options.engine}-{options.profile}-{mode}"
+
+
+def load_results() -> Dict[str, dict]:
+    """Load stored results by version."""
+    results = {}
+    if os.path.isdir(RESULTS_FOLDER):
+        for file_name in sorted(os.listdir(RESULTS_FOLDER)):
+            if file_name.endswith(".json"):
+                with open(os.path.join(RESULTS_FOLDER, file_name)) as results_file:
+                    results[file_name[: -len(".json")]] = json.load(results_file)
+    return results
+
+
+def find_regressions(baseline: List[dict], current: List[dict]) -> List[str]:
+    baseline = {result["interfaces"]: result for result in baseline}
+    regressions = []
+    for result in current:
+        previous = baseline.get(result["interfaces"])
+        if not previous:
+            continue
+        for metric, threshold in THRESHOLDS.items():
+            if result[metric] > previous[metric] * (1 + threshold):
+                regressions.append(
+                    f"{result['interfaces']} interfaces: {metric} "
+                    f"{previous[metric]} -> {result[metric]}"
+                )
+    return regressions
+
+
+def main(args: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the autoload on synthetic BIG-IP devices"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument(
+        "--engine", default=PortDiscoveryEngine.IF_MIB.value, help="port engine"
+    )
+    parser.add_argument("--profile", default=MibProfile.FULL.value)
+    parser.add_argument("--parallel", action="store_true")
+    parser.add_argument("--latency", type=float, default=0.0, help="per PDU, s")
+    parser.add_argument("--baseline", help="version to compare with")
+    parser.add_argument("--no-save", action="store_true")
+    options = parser.parse_args(args)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logger = logging.getLogger(__name__)
+
+    version = get_version()
+    scenario = get_scenario(options)
+    current = []
+    for size in options.sizes:
+        # a new process per size, so the peak RSS belongs to this size only
+        with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as executor:
+            result = executor.submit(
+                run_autoload,
+                size,
+                options.engine,
+                options.profile,
+                options.parallel,
+                options.latency,
+            ).result()
+        current.append(result)
+        logger.info(
+            f"{scenario} {size} interfaces: {result['wall_time']}s, "
+            f"{result['peak_rss_kb']} KB peak RSS, "
+            f"{result['round_trips']} round trips"
+        )
+
+    stored = load_results()
+    # the latest version released before the current one by default
+    baseline_version = options.baseline or next(
+        (
+            name
+            for name in sorted(stored, key=version_key, reverse=True)
+            if version_key(name) < version_key(version)
+            and scenario in stored[name]["scenarios"]
+        ),
+        None,
+    )
+    regressions = []
+    if baseline_version and scenario in stored.get(baseline_version, {}).get(
+        "scenarios", {}
+    ):
+        regressions = find_regressions(
+            stored[baseline_version]["scenarios"][scenario], current
+        )
+        logger.info(f"Compared with {baseline_version}: {len(regressions)} regressions")
+        for regression in regressions:
+            logger.warning(f"  {regression}")
+
+    if not options.no_save:
+        results = stored.get(version, {"version": version, "scenarios": {}})
+        results["python"] = platform.python_version()
+        results["machine"] = platform.machine()
+        results["scenarios"][scenario] = current
+        os.makedirs(RESULTS_FOLDER, exist_ok=True)
+        with open(os.path.join(RESULTS_FOLDER, f"{version}.json"), "w") as file_:
+            json.dump(results, file_, indent=2, sort_keys=True)
+            file_.write("\n")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""Memory of the IF-MIB port records on synthetic BIG-IP devices.
+
+The autoload is run once with the records of the generic SnmpIfTable and once
+with the compact records of F5SnmpIfTable, each in a separate process. The
+Python memory allocated by the discovery and still held by the autoload and
+the resource model at its end is traced with tracemalloc.
+
+    python benchmarks/memory_benchmark.py --sizes 1000 5000
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import logging
+import os
+import sys
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import TYPE_CHECKING
+
+BENCHMARKS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARKS_FOLDER))
+sys.path.insert(0, BENCHMARKS_FOLDER)
+
+from autoload_benchmark import RESULTS_FOLDER, get_version, load_results  # noqa: E402
+from synthetic_device import generate_device  # noqa: E402
+
+from cloudshell.shell.standards.networking.autoload_model import (  # noqa: E402
+    NetworkingResourceModel,
+)
+from cloudshell.snmp.autoload.snmp_if_table import SnmpIfTable  # noqa: E402
+
+from cloudshell.f5.autoload.f5_generic_snmp_autoload import (  # noqa: E402
+    F5FirewallGenericSNMPAutoload,
+)
+from cloudshell.f5.autoload.snmp_if_table import F5SnmpIfTable  # noqa: E402
+from cloudshell.f5.flows.f5_autoload_flow import (  # noqa: E402
+    BigIPAutoloadFlow,
+    prepare_mib_view,
+)
+from cloudshell.f5.snmp.mib_profile import MibProfile  # noqa: E402
+from cloudshell.f5.snmp.replay_agent import (  # noqa: E402
+    ReplaySnmpConfigurator,
+    SnmpReplayAgent,
+)
+
+if TYPE_CHECKING:
+    from typing import List
+
+SIZES = (1000, 5000)
+
+
+class GenericRecordsIfTable(F5SnmpIfTable):
+    """F5SnmpIfTable with the generic records keeping the walked ifTable."""
+
+    IF_PORT = SnmpIfTable.IF_PORT
+    IF_PORT_CHANNEL = SnmpIfTable.IF_PORT_CHANNEL
+
+    def _get_if_entities(self):
+        if_table = self._if_table
+        super(GenericRecordsIfTable, self)._get_if_entities()
+        self._if_table = if_table
+
+
+class _Autoload(F5FirewallGenericSNMPAutoload):
+    def __init__(self, snmp_handler, logger, if_table_class):
+        super(_Autoload, self).__init__(snmp_handler, logger)
+        self._if_table_class = if_table_class
+
+
+IF_TABLES = {"generic": GenericRecordsIfTable, "compact": F5SnmpIfTable}
+
+
+def run_autoload(interfaces: int, records: str) -> dict:
+    """Discover the synthetic device, runs in the separate process."""
+    logger = logging.getLogger("memory_benchmark.autoload")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    agent = SnmpReplayAgent(generate_device(interfaces))
+    resource_model = NetworkingResourceModel("bigip", "F5 BIG-IP Shell", "CS_Router")
+    with agent, ReplaySnmpConfigurator(agent, logger).get_service() as snmp_service:
+        prepare_mib_view(
+            snmp_service, BigIPAutoloadFlow.MIB_CACHES[MibProfile.FULL], logger
+        )
+        autoload = _Autoload(snmp_service, logger, IF_TABLES[records])
+        gc.collect()
+        tracemalloc.start()
+        autoload.discover(["BIG-IP"], resource_model)
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        ports = len(autoload.if_table_service.if_ports)
+    return {
+        "interfaces": interfaces,
+        "records": records,
+        "ports": ports,
+        "retained_kb": retained // 1024,
+        "peak_kb": peak // 1024,
+    }
+
+
+def main(args: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare the memory of the generic and compact port records"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--no-save", action="store_true")
+    options = parser.parse_args(args)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logger = logging.getLogger(__name__)
+
+    current = []
+    for size in options.sizes:
+        results = {}
+        for records in IF_TABLES:
+            with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as executor:
+                results[records] = executor.submit(run_autoload, size, records).result()
+            current.append(results[records])
+        generic, compact = results["generic"], results["compact"]
+        reduction = 1 - compact["retained_kb"] / generic["retained_kb"]
+        logger.info(
+            f"{size} interfaces: retained {generic['retained_kb']} KB -> "
+            f"{compact['retained_kb']} KB ({reduction:.0%} less), peak "
+            f"{generic['peak_kb']} KB -> {compact['peak_kb']} KB"
+        )
+
+    if not options.no_save:
+        version = get_version()
+        results = load_results().get(version, {"version": version, "scenarios": {}})
+        results["memory"] = current
+        os.makedirs(RESULTS_FOLDER, exist_ok=True)
+        with open(os.path.join(RESULTS_FOLDER, f"{version}.json"), "w") as file_:
+            json.dump(results, file_, indent=2, sort_keys=True)
+            file_.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""Synthetic BIG-IP SNMP datasets for the autoload benchmarks."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pysnmp.proto import rfc1902
+
+if TYPE_CHECKING:
+    from typing import Dict, Tuple
+
+IF_ENTRY = (1, 3, 6, 1, 2, 1, 2, 2, 1)
+IF_X_ENTRY = (1, 3, 6, 1, 2, 1, 31, 1, 1, 1)
+SYS_INTERFACE_ENTRY = (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1)
+SYS_IFX_STAT_ENTRY = (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3, 1)
+SYS_TRUNK_ENTRY = (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12, 1, 2, 1)
+SYS_TRUNK_CFG_MEMBER_ENTRY = (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12, 3, 2, 1)
+SYS_CLUSTER_ENTRY = (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1, 2, 1)
+SYS_CLUSTER_MBR_ENTRY = (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 2, 2, 1)
+SYS_MULTI_HOST_ENTRY = (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 4, 2, 1)
+SYS_MULTI_HOST_CPU_ENTRY = (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1)
+SYS_SW_STATUS_ENTRY = (1, 3, 6, 1, 4, 1, 3375, 2, 1, 9, 4, 2, 1)
+# BIG-IP Virtual Edition
+SYS_OBJECT_ID = "1.3.6.1.4.1.3375.2.1.3.4.43"
+PORTS_PER_SLOT = 48
+TRUNK_MEMBERS = 2
+CPUS_PER_BLADE = 24
+
+ETHERNET_CSMACD = 6
+L2_VLAN = 135
+IEEE_802_3_AD_LAG = 161
+
+
+def string_index(name: str) -> Tuple[int, ...]:
+    return (len(name),) + tuple(name.encode())
+
+
+def get_interface_name(number: int, blades: int = 0) -> str:
+    if blades:
+        # VIPRION interfaces are spread over the blades, e.g. 2/1.3
+        port, blade = divmod(number, blades)
+        return f"{blade + 1}/1.{port + 1}"
+    slot, port = divmod(number, PORTS_PER_SLOT)
+    return f"{slot + 1}.{port + 1}"
+
+
+def generate_device(
+    interfaces: int, vlans: int = None, trunks: int = None, blades: int = 0
+) -> Dict[Tuple[int, ...], rfc1902.ObjectSyntax]:
+    """Generate var-binds of the BIG-IP with the interfaces, VLANs and trunks.
+
+    Every interface is present in IF-MIB and in the F5 interface tables, the
+    first interfaces are members of the trunks. By default there is a VLAN
+    per 10 interfaces and a trunk per 20 interfaces. With blades the device
+    is a VIPRION cluster, the interfaces are spread over the blades.
+    """
+    vlans = interfaces // 10 if vlans is None else vlans
+    trunks = interfaces // 20 if trunks is None else trunks
+    var_binds = {
+        (1, 3, 6, 1, 2, 1, 1, 1, 0): rfc1902.OctetString(
+            "Linux bigip1 3.10.0 BIG-IP 16.1.3 x86_64"
+        ),
+        (1, 3, 6, 1, 2, 1, 1, 2, 0): rfc1902.ObjectName(SYS_OBJECT_ID),
+        (1, 3, 6, 1, 2, 1, 1, 3, 0): rfc1902.TimeTicks(360000),
+        (1, 3, 6, 1, 2, 1, 1, 4, 0): rfc1902.OctetString("admin"),
+        (1, 3, 6, 1, 2, 1, 1, 5, 0): rfc1902.OctetString("bigip1"),
+        (1, 3, 6, 1, 2, 1, 1, 6, 0): rfc1902.OctetString("lab"),
+        (1, 3, 6, 1, 2, 1, 31, 1, 5, 0): rfc1902.TimeTicks(100),
+        (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 1, 0): rfc1902.Integer32(interfaces),
+    }
+
+    def add_if_entry(if_index, name, if_type, mtu, speed, mac):
+        var_binds[IF_ENTRY + (1, if_index)] = rfc1902.Integer32(if_index)
+        var_binds[IF_ENTRY + (2, if_index)] = rfc1902.OctetString(name)
+        var_binds[IF_ENTRY + (3, if_index)] = rfc1902.Integer32(if_type)
+        var_binds[IF_ENTRY + (4, if_index)] = rfc1902.Integer32(mtu)
+        var_binds[IF_ENTRY + (6, if_index)] = rfc1902.OctetString(mac)
+        var_binds[IF_X_ENTRY + (1, if_index)] = rfc1902.OctetString(name)
+        var_binds[IF_X_ENTRY + (15, if_index)] = rfc1902.Gauge32(speed)
+        var_binds[IF_X_ENTRY + (18, if_index)] = rfc1902.OctetString("")
+
+    for number in range(interfaces):
+        name = get_interface_name(number, blades)
+        mac = bytes([0, 1, 0xD7]) + number.to_bytes(3, "big")
+        add_if_entry(number + 1, name, ETHERNET_CSMACD, 1500, 10000, mac)
+        index = string_index(name)
+        var_binds[SYS_INTERFACE_ENTRY + (1,) + index] = rfc1902.OctetString(name)
+        var_binds[SYS_INTERFACE_ENTRY + (4,) + index] = rfc1902.Integer32(10000)
+        var_binds[SYS_INTERFACE_ENTRY + (5,) + index] = rfc1902.Integer32(2)
+        var_binds[SYS_INTERFACE_ENTRY + (6,) + index] = rfc1902.OctetString(mac)
+        var_binds[SYS_INTERFACE_ENTRY + (7,) + index] = rfc1902.Integer32(1500)
+        var_binds[SYS_INTERFACE_ENTRY + (17,) + index] = rfc1902.Integer32(0)
+        var_binds[SYS_IFX_STAT_ENTRY + (1,) + index] = rfc1902.OctetString(name)
+        var_binds[SYS_IFX_STAT_ENTRY + (14,) + index] = rfc1902.Gauge32(10000)
+        var_binds[SYS_IFX_STAT_ENTRY + (17,) + index] = rfc1902.OctetString(
+            f"port {name}"
+        )
+
+    for number in range(trunks):
+        name = f"trunk{number + 1}"
+        index = string_index(name)
+        var_binds[SYS_TRUNK_ENTRY + (1,) + index] = rfc1902.OctetString(name)
+        var_binds[SYS_TRUNK_ENTRY + (2,) + index] = rfc1902.Integer32(0)
+        var_binds[SYS_TRUNK_ENTRY + (3,) + index] = rfc1902.OctetString(
+            bytes([0, 1, 0xD7, 0xFF]) + number.to_bytes(2, "big")
+        )
+        var_binds[SYS_TRUNK_ENTRY + (5,) + index] = rfc1902.Integer32(20000)
+        add_if_entry(interfaces + number + 1, name, IEEE_802_3_AD_LAG, 1500, 20000, b"")
+        for member in range(TRUNK_MEMBERS):
+            member_number = number * TRUNK_MEMBERS + member
+            if member_number >= interfaces:
+                break
+            member_name = get_interface_name(member_number, blades)
+            member_index = index + string_index(member_name)
+            var_binds[
+                SYS_TRUNK_CFG_MEMBER_ENTRY + (1,) + member_index
+            ] = rfc1902.OctetString(name)
+            var_binds[
+                SYS_TRUNK_CFG_MEMBER_ENTRY + (2,) + member_index
+            ] = rfc1902.OctetString(member_name)
+
+    for number in range(vlans):
+        if_index = interfaces + trunks + number + 1
+        add_if_entry(if_index, f"/Common/vlan{number + 1}", L2_VLAN, 1500, 0, b"")
+
+    if blades:
+        cluster_index = string_index("default")
+        var_binds[SYS_CLUSTER_ENTRY + (15,) + cluster_index] = rfc1902.Integer32(1)
+    for slot_id in range(1, blades + 1):
+        member_index = cluster_index + (slot_id,)
+        var_binds[SYS_CLUSTER_MBR_ENTRY + (3,) + member_index] = rfc1902.Integer32(1)
+        var_binds[SYS_CLUSTER_MBR_ENTRY + (7,) + member_index] = rfc1902.Integer32(1)
+        var_binds[SYS_CLUSTER_MBR_ENTRY + (8,) + member_index] = rfc1902.Integer32(3)
+        host_index = string_index(f"blade{slot_id}")
+        var_binds[SYS_MULTI_HOST_ENTRY + (2,) + host_index] = rfc1902.Counter64(
+            64 * 2**30
+        )
+        for cpu in range(CPUS_PER_BLADE):
+            var_binds[
+                SYS_MULTI_HOST_CPU_ENTRY + (3,) + host_index + (cpu + 1,)
+            ] = rfc1902.Integer32(cpu)
+        for volume, active in (("HD1.1", 1), ("HD1.2", 0)):
+            sw_index = (slot_id,) + string_index(volume)
+            var_binds[SYS_SW_STATUS_ENTRY + (3,) + sw_index] = rfc1902.OctetString(
+                "BIG-IP"
+            )
+            var_binds[SYS_SW_STATUS_ENTRY + (4,) + sw_index] = rfc1902.OctetString(
+                "16.1.3" if active else "15.1.8"
+            )
+            var_binds[SYS_SW_STATUS_ENTRY + (5,) + sw_index] = rfc1902.OctetString(
+                "0.0.12"
+            )
+            var_binds[SYS_SW_STATUS_ENTRY + (6,) + sw_index] = rfc1902.Integer32(active)
+
+    return var_binds
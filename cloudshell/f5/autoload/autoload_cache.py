@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from typing import TYPE_CHECKING
+
+from cloudshell.shell.core.driver_context import (
+    AutoLoadAttribute,
+    AutoLoadDetails,
+    AutoLoadResource,
+)
+from cloudshell.snmp.core.domain.snmp_oid import SnmpMibObject
+
+from cloudshell.f5.snmp.mib_cache import (
+    CACHE_DIR_MODE,
+    get_user_cache_dir,
+    is_private_dir,
+    write_atomic,
+)
+
+if TYPE_CHECKING:
+    from typing import Optional
+
+    from cloudshell.shell.standards.autoload_generic_models import GenericResourceModel
+    from cloudshell.snmp.core.snmp_service import SnmpService
+
+AUTOLOAD_CACHE_DIR_ENV = "CLOUDSHELL_F5_AUTOLOAD_CACHE_DIR"
+
+SYS_UP_TIME = SnmpMibObject("SNMPv2-MIB", "sysUpTime", "0")
+IF_TABLE_LAST_CHANGE = SnmpMibObject("IF-MIB", "ifTableLastChange", "0")
+SYS_INTERFACE_NUMBER = SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysInterfaceNumber", "0")
+
+
+def read_change_markers(snmp_service: SnmpService) -> Optional[dict]:
+    """Read cheap values which change together with the device port layout.
+
+    :return: None if any of the markers isn't available
+    """
+    markers = {}
+    up_time = snmp_service.get_property(SYS_UP_TIME).raw_value
+    if up_time is None:
+        return
+    # sysUpTime is in hundredths of a second
+    markers["boot_time"] = time.time() - int(up_time) / 100
+    for name, snmp_oid in (
+        ("if_table_last_change", IF_TABLE_LAST_CHANGE),
+        ("interface_number", SYS_INTERFACE_NUMBER),
+    ):
+        value = snmp_service.get_property(snmp_oid).raw_value
+        if value is None:
+            return
+        markers[name] = int(value)
+    return markers
+
+
+class AutoloadCache(object):
+    """Autoload details of the devices stored on disk with their change markers.
+
+    The cache folder is created private to the user in the user cache folder,
+    the cache is skipped if the folder is owned or writable by someone else.
+    """
+
+    # allowed drift of the boot time calculated from sysUpTime, seconds
+    BOOT_TIME_TOLERANCE = 10
+
+    def __init__(self, cache_dir: str = None):
+        self._cache_dir = cache_dir
+        self._is_private = None
+
+    @property
+    def cache_dir(self) -> str:
+        return (
+            self._cache_dir
+            or os.environ.get(AUTOLOAD_CACHE_DIR_ENV)
+            or os.path.join(get_user_cache_dir(), "cloudshell-f5-autoload-cache")
+        )
+
+    @property
+    def is_private(self) -> bool:
+        """Check the cache folder can be trusted, creating it if needed."""
+        if self._is_private is None:
+            try:
+                os.makedirs(self.cache_dir, mode=CACHE_DIR_MODE, exist_ok=True)
+            except OSError:
+                self._is_private = False
+            else:
+                self._is_private = is_private_dir(self.cache_dir)
+        return self._is_private
+
+    @staticmethod
+    def get_key(address: str, resource_model: GenericResourceModel, **options) -> str:
+        """Get cache key of the device and the resource it is loaded into.
+
+        :param options: discovery options the details depend on
+        """
+        key = "|".join(
+            map(
+                str,
+                (
+                    address,
+                    resource_model.name,
+                    resource_model.shell_name,
+                    resource_model.family_name,
+                    resource_model.cs_resource_id,
+                    *(f"{name}={value}" for name, value in sorted(options.items())),
+                ),
+            )
+        )
+        return hashlib.sha1(key.encode()).hexdigest()
+
+    def get(self, key: str, markers: dict) -> Optional[AutoLoadDetails]:
+        """Get cached details if the device didn't change since they were stored."""
+        if not self.is_private:
+            return
+        try:
+            with open(self._get_path(key)) as cache_file:
+                data = json.load(cache_file)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or not self.is_same_device_state(
+            data.get("markers"), markers
+        ):
+            return
+        try:
+            return AutoLoadDetails(
+                [AutoLoadResource(**resource) for resource in data["resources"]],
+                [AutoLoadAttribute(**attribute) for attribute in data["attributes"]],
+            )
+        except (KeyError, TypeError):
+            # written by another version or partially
+            return
+
+    def store(self, key: str, markers: dict, details: AutoLoadDetails) -> None:
+        if not self.is_private:
+            return
+        data = {
+            "markers": markers,
+            "resources": [vars(resource) for resource in details.resources],
+            "attributes": [vars(attribute) for attribute in details.attributes],
+        }
+        write_atomic(self._get_path(key), json.dumps(data).encode())
+
+    def invalidate(self, key: str) -> None:
+        if not self.is_private:
+            return
+        try:
+            os.remove(self._get_path(key))
+        except FileNotFoundError:
+            pass
+
+    def is_same_device_state(self, cached: Optional[dict], current: dict) -> bool:
+        if not cached or set(cached) != set(current):
+            return False
+        for name, value in current.items():
+            if name == "boot_time":
+                if abs(cached[name] - value) > self.BOOT_TIME_TOLERANCE:
+                    return False
+            elif cached[name] != value:
+                return False
+        return True
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".json")
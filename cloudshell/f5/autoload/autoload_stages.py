@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from cloudshell.shell.core.driver_context import (
+    AutoLoadAttribute,
+    AutoLoadDetails,
+    AutoLoadResource,
+)
+from cloudshell.shell.standards.core.autoload.utils import (
+    AutoloadDetailsBuilder,
+    get_unique_id,
+    is_module_without_children,
+)
+
+if TYPE_CHECKING:
+    from typing import Iterator, Set, Tuple
+
+    from cloudshell.shell.standards.autoload_generic_models import GenericResourceModel
+    from cloudshell.shell.standards.core.autoload.resource_model import AbstractResource
+
+
+class AutoloadStage(Enum):
+    SYSTEM = "system"
+    CHASSIS = "chassis"
+    MODULES = "modules"
+    PORTS = "ports"
+    PORT_CHANNELS = "port-channels"
+    # details of the previous autoload, the device didn't change since then
+    CACHED = "cached"
+
+
+def merge_details(*details: AutoLoadDetails) -> AutoLoadDetails:
+    merged = AutoLoadDetails([], [])
+    for stage_details in details:
+        merged.resources.extend(stage_details.resources)
+        merged.attributes.extend(stage_details.attributes)
+    return merged
+
+
+class StagedDetailsBuilder(AutoloadDetailsBuilder):
+    """Builds autoload details of the resource model part by part.
+
+    Every stage contains the resources of the stage types connected to the
+    model since the previous stage and not built yet, so the stages together
+    are the same resources and attributes AutoloadDetailsBuilder builds at once.
+    """
+
+    def __init__(self, resource_model: GenericResourceModel):
+        super(StagedDetailsBuilder, self).__init__(
+            resource_model, filter_empty_modules=True, use_new_unique_id=True
+        )
+        entities = resource_model.entities
+        self._stage_types = {
+            AutoloadStage.CHASSIS: (entities.Chassis,),
+            AutoloadStage.MODULES: (
+                entities.Module,
+                entities.SubModule,
+                entities.PowerPort,
+            ),
+            AutoloadStage.PORTS: (entities.Port,),
+            AutoloadStage.PORT_CHANNELS: (entities.PortChannel,),
+        }
+        self._built: Set[int] = set()
+
+    def build_root(self) -> AutoLoadDetails:
+        """Build attributes of the root resource."""
+        return self._build_node(self.resource_model)
+
+    def build_stage(self, stage: AutoloadStage) -> AutoLoadDetails:
+        resource_types = self._stage_types[stage]
+        details = AutoLoadDetails([], [])
+        for resource in self._iter_resources(self.resource_model):
+            if id(resource) not in self._built and isinstance(resource, resource_types):
+                self._built.add(id(resource))
+                node_details = self._build_node(resource)
+                details.resources.extend(node_details.resources)
+                details.attributes.extend(node_details.attributes)
+        return details
+
+    def iter_stages(
+        self, *stages: AutoloadStage
+    ) -> Iterator[Tuple[AutoloadStage, AutoLoadDetails]]:
+        """Build the stages in order, skipping the stages without resources."""
+        for stage in stages:
+            details = self.build_stage(stage)
+            if details.resources:
+                yield stage, details
+
+    def _iter_resources(self, resource: AbstractResource) -> Iterator[AbstractResource]:
+        for child_resource in resource.extract_sub_resources():
+            if self._filter_empty_modules and is_module_without_children(
+                child_resource
+            ):
+                continue
+            yield child_resource
+            yield from self._iter_resources(child_resource)
+
+    def _build_node(self, resource: AbstractResource) -> AutoLoadDetails:
+        """Build the resource without its sub resources."""
+        resource.shell_name = resource.shell_name or self.resource_model.shell_name
+        relative_address = str(resource.relative_address)
+        details = AutoLoadDetails([], [])
+        if relative_address:
+            details.resources.append(
+                AutoLoadResource(
+                    model=resource.cloudshell_model_name,
+                    name=resource.name,
+                    relative_address=relative_address,
+                    unique_identifier=get_unique_id(self._cs_resource_id, resource),
+                )
+            )
+        details.attributes.extend(
+            AutoLoadAttribute(
+                relative_address=relative_address,
+                attribute_name=str(name),
+                attribute_value=str(value),
+            )
+            for name, value in resource.attributes.items()
+            if value is not None
+        )
+        return details
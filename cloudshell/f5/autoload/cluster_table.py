@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from pyasn1.type import univ
+
+from cloudshell.snmp.core.domain.snmp_oid import SnmpMibObject, SnmpRawOid
+
+from cloudshell.f5.snmp.index_codec import INTEGER, STRING, get_index_codec, join_index
+from cloudshell.f5.snmp.prefetched_snmp_service import get_row_value, get_table_walker
+
+if TYPE_CHECKING:
+    from logging import Logger
+    from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+    from cloudshell.snmp.core.domain.snmp_response import SnmpResponse
+    from cloudshell.snmp.core.snmp_service import SnmpService
+
+CLUSTER_COLUMNS = (SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysClusterPriSlotId"),)
+CLUSTER_MEMBER_COLUMNS = (
+    SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysClusterMbrAvailabilityState"),
+    SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysClusterMbrLicensed"),
+    SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysClusterMbrState"),
+)
+# host IDs are taken from the index, a single column is enough
+MULTI_HOST_COLUMNS = (SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysMultiHostTotal"),)
+CLUSTER_TABLE_COLUMNS = CLUSTER_COLUMNS + CLUSTER_MEMBER_COLUMNS + MULTI_HOST_COLUMNS
+# clusters and hosts are indexed by the name, members by the cluster and the slot
+CLUSTER_INDEX = (STRING,)
+CLUSTER_MEMBER_INDEX = (STRING, INTEGER)
+MULTI_HOST_INDEX = (STRING,)
+
+# columns walked per blade, the index of both tables starts with the blade,
+# so the rows of the blade are a subtree of the column
+BLADE_CPU_COLUMN = SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysMultiHostCpuId")
+BLADE_SOFTWARE_COLUMNS = (
+    SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysSwStatusProduct"),
+    SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysSwStatusVersion"),
+    SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysSwStatusBuild"),
+    SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysSwStatusActive"),
+)
+
+# interfaces of the VIPRION blades are named <slot>/<port>, e.g. 1/1.1
+BLADE_PORT_NAME = re.compile(r"^(?P<slot_id>\d+)/")
+# multi-host IDs of the VIPRION blades are named after the slot, e.g. blade1
+BLADE_HOST_ID = re.compile(r"(?P<slot_id>\d+)$")
+
+
+def get_port_slot_id(port_name: str) -> Optional[int]:
+    """Get the slot of the blade the interface belongs to."""
+    match = BLADE_PORT_NAME.match(port_name)
+    return int(match.group("slot_id")) if match else None
+
+
+class F5Blade(object):
+    """VIPRION blade, a member of the cluster."""
+
+    __slots__ = (
+        "slot_id",
+        "cluster_name",
+        "host_id",
+        "availability",
+        "licensed",
+        "state",
+        "memory",
+        "cpu_count",
+        "product",
+        "version",
+        "build",
+    )
+
+    def __init__(self, slot_id: int, cluster_name: str, row: dict):
+        self.slot_id = slot_id
+        self.cluster_name = cluster_name
+        self.host_id = None
+        self.availability = get_row_value(row, "sysClusterMbrAvailabilityState")
+        self.licensed = get_row_value(row, "sysClusterMbrLicensed") == "true"
+        self.state = get_row_value(row, "sysClusterMbrState")
+        self.memory = 0
+        self.cpu_count = 0
+        self.product = ""
+        self.version = ""
+        self.build = ""
+
+    def set_software(self, volumes: Iterable[dict]) -> None:
+        """Set the software of the active one of the sysSwStatusTable rows."""
+        for row in volumes:
+            if get_row_value(row, "sysSwStatusActive") == "true":
+                self.product = get_row_value(row, "sysSwStatusProduct")
+                self.version = get_row_value(row, "sysSwStatusVersion")
+                self.build = get_row_value(row, "sysSwStatusBuild")
+                return
+
+    def __str__(self):
+        return (
+            f"blade {self.slot_id} ({self.state or 'unknown'}, "
+            f"{self.availability or 'unknown'}): {self.cpu_count} CPUs, "
+            f"{self.product} {self.version} {self.build}".rstrip()
+        )
+
+
+class F5ClusterTable(object):
+    """Blades of the VIPRION chassis from the cluster tables.
+
+    sysClusterTable, sysClusterMbrTable and sysMultiHostTable are walked
+    first, then the CPU and the software subtrees of every blade are walked
+    concurrently, so the time doesn't grow with the number of slots. Devices
+    which aren't clustered have no blades.
+    """
+
+    BLADE = F5Blade
+
+    def __init__(
+        self, snmp_service: SnmpService, logger: Logger, max_concurrency: int = 1
+    ):
+        self._snmp = snmp_service
+        self._logger = logger
+        self._max_concurrency = max_concurrency
+        self.primary_slots: Dict[str, int] = {}
+        self.blades: Dict[int, F5Blade] = {}
+        self._blade_tables_loaded = False
+        self._load_snmp_tables()
+
+    def _load_snmp_tables(self):
+        table_walker = get_table_walker(self._snmp, self._logger)
+        columns = table_walker.walk_many(CLUSTER_TABLE_COLUMNS, self._max_concurrency)
+        columns = dict(zip(CLUSTER_TABLE_COLUMNS, columns))
+
+        for snmp_oid_obj in CLUSTER_COLUMNS:
+            for (cluster_name,), response in self._iter_indexed(
+                snmp_oid_obj, columns[snmp_oid_obj], CLUSTER_INDEX
+            ):
+                self.primary_slots[cluster_name] = int(response.safe_value or 0)
+
+        members: Dict[Tuple[str, int], dict] = defaultdict(dict)
+        for snmp_oid_obj in CLUSTER_MEMBER_COLUMNS:
+            for (cluster_name, slot_id), response in self._iter_indexed(
+                snmp_oid_obj, columns[snmp_oid_obj], CLUSTER_MEMBER_INDEX
+            ):
+                members[cluster_name, slot_id][snmp_oid_obj.object_name] = response
+        for (cluster_name, slot_id), row in sorted(members.items()):
+            self.blades[slot_id] = self.BLADE(slot_id, cluster_name, row)
+
+        for snmp_oid_obj in MULTI_HOST_COLUMNS:
+            for (host_id,), response in self._iter_indexed(
+                snmp_oid_obj, columns[snmp_oid_obj], MULTI_HOST_INDEX
+            ):
+                match = BLADE_HOST_ID.search(host_id)
+                blade = self.blades.get(int(match.group("slot_id"))) if match else None
+                if blade is None:
+                    self._logger.debug(f"Host {host_id} isn't a blade")
+                    continue
+                blade.host_id = host_id
+                blade.memory = int(response.safe_value or 0)
+        self._logger.info(
+            f"sysClusterMbrTable loaded, {len(self.blades)} blades in "
+            f"{len(self.primary_slots)} clusters"
+        )
+
+    @property
+    def blade_columns(self) -> List[SnmpRawOid]:
+        """Subtrees of the blades walked by load_blade_tables."""
+        columns = []
+        for slot_id, blade in sorted(self.blades.items()):
+            if blade.host_id is not None:
+                columns.append(
+                    self._get_subtree(
+                        BLADE_CPU_COLUMN, join_index((blade.host_id,), MULTI_HOST_INDEX)
+                    )
+                )
+            columns.extend(
+                self._get_subtree(snmp_oid_obj, (slot_id,))
+                for snmp_oid_obj in BLADE_SOFTWARE_COLUMNS
+            )
+        return columns
+
+    def load_blade_tables(self) -> None:
+        """Walk the CPU and the software subtrees of the blades concurrently."""
+        if self._blade_tables_loaded or not self.blades:
+            return
+        self._blade_tables_loaded = True
+        table_walker = get_table_walker(self._snmp, self._logger)
+        blade_columns = self.blade_columns
+        subtrees = dict(
+            zip(
+                (column.get_oid(self._snmp._snmp_engine) for column in blade_columns),
+                table_walker.walk_many(blade_columns, self._max_concurrency),
+            )
+        )
+        for slot_id, blade in self.blades.items():
+            if blade.host_id is not None:
+                blade.cpu_count = len(
+                    self._get_rows(
+                        subtrees,
+                        BLADE_CPU_COLUMN,
+                        join_index((blade.host_id,), MULTI_HOST_INDEX),
+                    )
+                )
+            volumes: Dict[Tuple[int, ...], dict] = defaultdict(dict)
+            for snmp_oid_obj in BLADE_SOFTWARE_COLUMNS:
+                for volume, response in self._get_rows(
+                    subtrees, snmp_oid_obj, (slot_id,)
+                ).items():
+                    volumes[volume][snmp_oid_obj.object_name] = response
+            blade.set_software(volumes.values())
+            self._logger.debug(f"Loaded {blade}")
+        self._logger.info(f"Blade tables loaded, {len(blade_columns)} subtrees")
+
+    def _get_rows(
+        self,
+        subtrees: Dict[str, List[SnmpResponse]],
+        snmp_oid_obj: SnmpMibObject,
+        index: Tuple[int, ...],
+    ) -> Dict[Tuple[int, ...], SnmpResponse]:
+        """Get the responses of the subtree by the rest of their index."""
+        subtree_oid = univ.ObjectIdentifier(
+            self._get_subtree(snmp_oid_obj, index).get_oid(self._snmp._snmp_engine)
+        )
+        return {
+            tuple(response._raw_oid[len(subtree_oid) :]): response
+            for response in subtrees.get(str(subtree_oid), [])
+        }
+
+    def _get_subtree(
+        self, snmp_oid_obj: SnmpMibObject, index: Sequence[int]
+    ) -> SnmpRawOid:
+        column_oid = snmp_oid_obj.get_oid(self._snmp._snmp_engine)
+        return SnmpRawOid(".".join(map(str, (column_oid, *index))))
+
+    def _iter_indexed(
+        self,
+        snmp_oid_obj: SnmpMibObject,
+        responses: List[SnmpResponse],
+        layout: Sequence[str],
+    ) -> Iterator[Tuple[tuple, SnmpResponse]]:
+        """Split the index into the parts of the layout, strings are decoded."""
+        column_oid = univ.ObjectIdentifier(
+            snmp_oid_obj.get_oid(self._snmp._snmp_engine)
+        )
+        codec = get_index_codec(layout)
+        for response in responses:
+            index = tuple(response._raw_oid[len(column_oid) :])
+            try:
+                parts = codec.split(index)
+            except IndexError:
+                self._logger.debug(
+                    f"Unexpected index {index} of {snmp_oid_obj.object_name}"
+                )
+                continue
+            yield tuple(
+                part.decode("utf-8", "replace") if isinstance(part, bytes) else part
+                for part in parts
+            ), response
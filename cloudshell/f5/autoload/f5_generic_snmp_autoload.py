@@ -1,17 +1,305 @@
 # #!/usr/bin/python
 # # -*- coding: utf-8 -*-
 #
+import re
+from contextlib import contextmanager
+from enum import Enum
+
+from cloudshell.snmp.autoload.constants import entity_constants
+from cloudshell.snmp.autoload.core.snmp_autoload_error import GeneralAutoloadError
 from cloudshell.snmp.autoload.generic_snmp_autoload import GenericSNMPAutoload
+from cloudshell.snmp.autoload.helper.snmp_autoload_helper import log_autoload_details
+from cloudshell.snmp.core.domain.snmp_oid import SnmpMibObject
 
+from cloudshell.f5.autoload.autoload_stages import AutoloadStage, StagedDetailsBuilder
+from cloudshell.f5.autoload.cluster_table import (
+    CLUSTER_TABLE_COLUMNS,
+    F5ClusterTable,
+    get_port_slot_id,
+)
 from cloudshell.f5.autoload.snmp_if_table import F5SnmpIfTable
+from cloudshell.f5.autoload.sys_interface_table import F5SysInterfaceTable
+from cloudshell.f5.autoload.trunk_table import F5TrunkPortChannel
+from cloudshell.f5.snmp.prefetched_snmp_service import PrefetchedSnmpService
+from cloudshell.f5.snmp.walk_stats import WalkStatsRecorder
+
+# entity columns read by the generic autoload, walked concurrently together with
+# the port columns of the port discovery engine in the parallel discovery mode
+PREFETCH_COLUMNS = (
+    entity_constants.ENTITY_POSITION.get_snmp_mib_oid(),
+    entity_constants.ENTITY_DESCRIPTION.get_snmp_mib_oid(),
+    entity_constants.ENTITY_NAME.get_snmp_mib_oid(),
+    entity_constants.ENTITY_PARENT_ID.get_snmp_mib_oid(),
+    entity_constants.ENTITY_CLASS.get_snmp_mib_oid(),
+    entity_constants.ENTITY_VENDOR_TYPE.get_snmp_mib_oid(),
+    entity_constants.ENTITY_MODEL.get_snmp_mib_oid(),
+    entity_constants.ENTITY_SERIAL.get_snmp_mib_oid(),
+    entity_constants.ENTITY_OS_VERSION.get_snmp_mib_oid(),
+    entity_constants.ENTITY_HW_VERSION.get_snmp_mib_oid(),
+    # scalars read by the system info
+    SnmpMibObject("SNMPv2-MIB", "system"),
+)
+
+
+class PortDiscoveryEngine(Enum):
+    IF_MIB = "if-mib"
+    SYS_INTERFACE = "sys-interface"
+
+
+PORT_DISCOVERY_TABLES = {
+    PortDiscoveryEngine.IF_MIB: F5SnmpIfTable,
+    PortDiscoveryEngine.SYS_INTERFACE: F5SysInterfaceTable,
+}
 
 
 class F5FirewallGenericSNMPAutoload(GenericSNMPAutoload):
+    # requests in flight to one device in the parallel discovery mode
+    MAX_CONCURRENT_WALKS = 4
+
+    def __init__(
+        self,
+        snmp_handler,
+        logger,
+        parallel_discovery=False,
+        max_concurrent_walks=MAX_CONCURRENT_WALKS,
+        port_engine=PortDiscoveryEngine.IF_MIB,
+        cluster_discovery=False,
+    ):
+        """Init autoload.
+
+        :param bool parallel_discovery: walk independent tables concurrently
+            before building the resource model
+        :param int max_concurrent_walks: per device limit of concurrent walks
+        :param PortDiscoveryEngine port_engine: tables the ports are built from
+        :param bool cluster_discovery: model the VIPRION blades as the modules
+            holding their ports, ports of the devices which aren't clustered
+            are built as before
+        """
+        super(F5FirewallGenericSNMPAutoload, self).__init__(snmp_handler, logger)
+        self._parallel_discovery = parallel_discovery
+        self._max_concurrent_walks = max_concurrent_walks
+        self._if_table_class = PORT_DISCOVERY_TABLES[PortDiscoveryEngine(port_engine)]
+        self._cluster_discovery = cluster_discovery
+        self._cluster_table = None
+        self._port_channels_built = False
+        self.walk_stats = WalkStatsRecorder(snmp_handler)
+        # WalkSummary of the discovery, set when it finishes
+        self.walk_summary = None
+
     @property
     def if_table_service(self):
         if not self._if_table:
-            self._if_table = F5SnmpIfTable(
+            self._if_table = self._if_table_class(
                 snmp_handler=self.snmp_handler, logger=self.logger
             )
 
         return self._if_table
+
+    @property
+    def prefetch_columns(self):
+        """Columns read by the discovery with the port discovery engine."""
+        columns = self._if_table_class.PREFETCH_COLUMNS + PREFETCH_COLUMNS
+        if self._cluster_discovery:
+            columns += CLUSTER_TABLE_COLUMNS
+        return columns
+
+    def discover(
+        self, supported_os, resource_model, validate_module_id_by_port_name=False
+    ):
+        with self._recording_walk_stats():
+            if self._parallel_discovery and resource_model:
+                self._prefetch_tables()
+            if self._cluster_discovery and resource_model:
+                self._prefetch_blades()
+            return super(F5FirewallGenericSNMPAutoload, self).discover(
+                supported_os, resource_model, validate_module_id_by_port_name
+            )
+
+    def discover_stages(self, supported_os, resource_model):
+        """Discover the device yielding the resources as soon as they are built.
+
+        Yields (AutoloadStage, AutoLoadDetails) pairs: the root attributes
+        first, then the chassis, modules and ports of ENTITY-MIB after its
+        walk, then the blades, the ports and port channels after the port
+        tables walk.
+        Parents are always yielded before their sub resources. walk_summary
+        is set when the generator is exhausted or closed.
+        """
+        with self._recording_walk_stats():
+            yield from self._discover_stages(supported_os, resource_model)
+
+    def _discover_stages(self, supported_os, resource_model):
+        if self._parallel_discovery:
+            self._prefetch_tables()
+        if self._cluster_discovery:
+            self._prefetch_blades()
+        self._resource_model = resource_model
+        if not self.system_info_service.is_valid_device_os(supported_os):
+            raise GeneralAutoloadError("Unsupported device OS")
+
+        self.logger.info("Start SNMP discovery process in stages")
+        builder = StagedDetailsBuilder(resource_model)
+        self.system_info_service.fill_attributes(resource_model)
+        yield AutoloadStage.SYSTEM, builder.build_root()
+
+        entity_chassis_tree_dict = self.entity_table_service.chassis_structure_dict
+        if entity_chassis_tree_dict:
+            self._build_structure(entity_chassis_tree_dict.values(), resource_model)
+            yield from self._log_stages(
+                builder.iter_stages(
+                    AutoloadStage.CHASSIS, AutoloadStage.MODULES, AutoloadStage.PORTS
+                )
+            )
+
+        if self._if_ports_in_entity:
+            self._get_port_channels(resource_model)
+        else:
+            self._add_ports_from_iftable()
+        yield from self._log_stages(
+            builder.iter_stages(
+                AutoloadStage.CHASSIS,
+                AutoloadStage.MODULES,
+                AutoloadStage.PORTS,
+                AutoloadStage.PORT_CHANNELS,
+            )
+        )
+
+    @contextmanager
+    def _recording_walk_stats(self):
+        self.walk_stats.start()
+        try:
+            yield
+        finally:
+            self.walk_stats.stop()
+            self.walk_summary = self.walk_stats.summary
+            self.logger.info(str(self.walk_summary))
+
+    def _log_stages(self, stages):
+        for stage, details in stages:
+            self.logger.info(
+                f"Discovered {stage.value} stage: {len(details.resources)} resources"
+            )
+            log_autoload_details(self.logger, details)
+            yield stage, details
+
+    def _prefetch_tables(self):
+        self.logger.info(
+            f"Prefetching tables, up to {self._max_concurrent_walks} concurrent walks"
+        )
+        snmp_handler = PrefetchedSnmpService(self.snmp_handler, self.logger)
+        snmp_handler.prefetch(self.prefetch_columns, self._max_concurrent_walks)
+        self.snmp_handler = snmp_handler
+
+    def _prefetch_blades(self):
+        """Read the cluster tables, then walk the blades and the ports at once.
+
+        The subtrees of every blade are walked concurrently together with the
+        port and media columns of the port discovery engine which are not
+        prefetched yet.
+        """
+        snmp_handler = self.snmp_handler
+        if not isinstance(snmp_handler, PrefetchedSnmpService):
+            snmp_handler = PrefetchedSnmpService(snmp_handler, self.logger)
+        self._cluster_table = F5ClusterTable(
+            snmp_handler, self.logger, self._max_concurrent_walks
+        )
+        if not self._cluster_table.blades:
+            return
+        self.logger.info(
+            f"Discovering {len(self._cluster_table.blades)} blades, up to "
+            f"{self._max_concurrent_walks} concurrent walks"
+        )
+        columns = [
+            column
+            for column in self._cluster_table.blade_columns
+            + list(self._if_table_class.PREFETCH_COLUMNS)
+            if not snmp_handler.is_prefetched(column)
+        ]
+        snmp_handler.prefetch(columns, self._max_concurrent_walks)
+        self._cluster_table.load_blade_tables()
+        self.snmp_handler = snmp_handler
+
+    def _add_ports_from_iftable(self):
+        if self._cluster_table and self._cluster_table.blades:
+            self._add_blade_ports()
+        else:
+            super(F5FirewallGenericSNMPAutoload, self)._add_ports_from_iftable()
+        # the generic autoload builds port channels only for the entity chassis
+        self._get_port_channels(self._resource_model)
+
+    def _add_blade_ports(self):
+        """Build the blades as the modules of the chassis holding their ports.
+
+        Ports which don't belong to a blade are connected to the chassis.
+        """
+        self.logger.info("Loading Blades and Ports ...")
+        chassis_id = next(iter(self._chassis), None)
+        if not chassis_id:
+            chassis_id = "0"
+            self._add_dummy_chassis(chassis_id)
+        chassis = self._chassis[chassis_id]
+
+        modules = {}
+        for slot_id, blade in sorted(self._cluster_table.blades.items()):
+            module = self._resource_model.entities.Module(index=str(slot_id))
+            module.model = blade.product
+            module.version = blade.version
+            chassis.connect_module(module)
+            modules[slot_id] = module
+            self.logger.info(f"Added {blade}")
+
+        for interface in self.if_table_service.if_ports.values():
+            if self.if_table_service.PORT_VALID_TYPE.search(interface.if_type):
+                parent_element = modules.get(
+                    get_port_slot_id(interface.if_descr_name), chassis
+                )
+                self._get_ports_attributes(interface, parent_element)
+
+        self.logger.info("Building Blades and Ports completed")
+
+    def _get_port_channels(self, parent_resource):
+        """Get all port channels and set attributes for them.
+
+        Members of the trunks are already resolved to the ports, so unlike the
+        generic implementation no lookups are made per associated port.
+        """
+        # called for the entity chassis and again after the ports of IF-MIB
+        if self._port_channels_built:
+            return
+        self._port_channels_built = True
+        if not self.if_table_service.if_port_channels:
+            return
+        self.logger.info("Building Port Channels")
+        if_ports = self.if_table_service.if_ports
+        for if_port_channel in self.if_table_service.if_port_channels.values():
+            interface_model = if_port_channel.port_name
+            port_channel_id = self._get_port_channel_id(if_port_channel)
+            if not port_channel_id:
+                self.logger.error(
+                    f"Adding of {interface_model} failed. Name is invalid"
+                )
+                continue
+            associated_ports = [
+                if_ports[if_index].port_name.replace("/", "-").replace(" ", "")
+                for if_index in if_port_channel.associated_port_list
+                if if_index in if_ports
+            ]
+            port_channel = self._resource_model.entities.PortChannel(
+                index=port_channel_id
+            )
+            port_channel.associated_ports = "; ".join(associated_ports)
+            port_channel.port_description = if_port_channel.if_port_description
+            port_channel.ipv4_address = if_port_channel.ipv4_address
+            port_channel.ipv6_address = if_port_channel.ipv6_address
+
+            parent_resource.connect_port_channel(port_channel)
+            self.logger.info(f"Added {interface_model} Port Channel")
+
+        self.logger.info("Building Port Channels completed")
+
+    @staticmethod
+    def _get_port_channel_id(if_port_channel):
+        if isinstance(if_port_channel, F5TrunkPortChannel):
+            return if_port_channel.port_channel_id
+        match = re.search(r"\d+$", if_port_channel.port_name)
+        return match.group(0) if match else None
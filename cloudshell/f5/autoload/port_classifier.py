@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, Iterable, Optional, Pattern
+
+
+class PortClassifier(object):
+    """Classify interface names as ports, port channels or excluded ones.
+
+    Every category is matched with one precompiled pattern and the result is
+    cached per name. Port channel names take precedence over excluded ones.
+    """
+
+    PORT = "port"
+    PORT_CHANNEL = "port-channel"
+    EXCLUDED = "excluded"
+
+    def __init__(self, port_channel_names: Iterable[str], exclude_names: Iterable[str]):
+        self.port_channel_names = tuple(port_channel_names)
+        self.exclude_names = tuple(exclude_names)
+        self._port_channel_pattern = self._compile(self.port_channel_names)
+        self._exclude_pattern = self._compile(self.exclude_names)
+        self._cache: Dict[str, str] = {}
+
+    @staticmethod
+    def _compile(names: Iterable[str]) -> Optional[Pattern]:
+        names = [re.escape(name) for name in names if name]
+        if names:
+            return re.compile("|".join(names))
+
+    def is_configured_with(
+        self, port_channel_names: Iterable[str], exclude_names: Iterable[str]
+    ) -> bool:
+        return (
+            tuple(port_channel_names) == self.port_channel_names
+            and tuple(exclude_names) == self.exclude_names
+        )
+
+    def classify(self, name: str) -> str:
+        category = self._cache.get(name)
+        if category is None:
+            lower_name = name.lower()
+            if self._port_channel_pattern and self._port_channel_pattern.search(
+                lower_name
+            ):
+                category = self.PORT_CHANNEL
+            elif self._exclude_pattern and self._exclude_pattern.search(lower_name):
+                category = self.EXCLUDED
+            else:
+                category = self.PORT
+            self._cache[name] = category
+        return category
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from cloudshell.f5.autoload.port_classifier import PortClassifier
+from cloudshell.f5.autoload.trunk_table import F5TrunkTable
+
+
+class F5PortEngineMixin(ABC):
+    """Shared parts of the port discovery engines based on SnmpIfTable.
+
+    The ports are built once by _load_if_entities, the port channels are
+    built from the trunk tables after them.
+    """
+
+    _port_classifier = None
+    _trunk_table = None
+    _if_entities_loaded = False
+
+    @property
+    def port_classifier(self) -> PortClassifier:
+        """Classifier of the interface names, rebuilt when the name lists change."""
+        if (
+            self._port_classifier is None
+            or not self._port_classifier.is_configured_with(
+                self.PORT_CHANNEL_NAME, self.port_exclude_list
+            )
+        ):
+            self._port_classifier = PortClassifier(
+                self.PORT_CHANNEL_NAME, self.port_exclude_list
+            )
+        return self._port_classifier
+
+    @property
+    def trunk_table(self) -> F5TrunkTable:
+        if self._trunk_table is None:
+            self._trunk_table = F5TrunkTable(self._snmp, self._logger)
+        return self._trunk_table
+
+    def _get_if_entities(self):
+        # the generic lookups call it again whenever a dict is empty
+        if self._if_entities_loaded:
+            return
+        self._if_entities_loaded = True
+        self._load_if_entities()
+        self._if_port_channels_dict.update(
+            self.trunk_table.get_port_channels(self._port_name_to_object_map)
+        )
+
+    @abstractmethod
+    def _load_if_entities(self) -> None:
+        """Add the ports and the port channels which aren't trunks."""
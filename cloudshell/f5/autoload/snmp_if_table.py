@@ -1,23 +1,256 @@
+from __future__ import annotations
+
+from cloudshell.snmp.autoload.constants import port_constants
+from cloudshell.snmp.autoload.domain.if_entity.snmp_if_entity import SnmpIfEntity
+from cloudshell.snmp.autoload.domain.if_entity.snmp_if_port_channel_entity import (
+    SnmpIfPortChannel,
+)
+from cloudshell.snmp.autoload.domain.if_entity.snmp_if_port_entity import SnmpIfPort
 from cloudshell.snmp.autoload.snmp_if_table import SnmpIfTable
+from cloudshell.snmp.core.domain.snmp_oid import SnmpMibObject
+
+from cloudshell.f5.autoload.port_engine import F5PortEngineMixin
+from cloudshell.f5.autoload.trunk_table import TRUNK_COLUMNS, TRUNK_MEMBER_COLUMNS
+from cloudshell.f5.snmp.prefetched_snmp_service import get_table_walker
+
+
+class F5IfEntity(object):
+    """Compact ifEntry record, the columns are read on the first use.
+
+    Unlike the generic entities the records have no instance dict, keep the
+    values as strings instead of SNMP responses and read a missing column only
+    once. IP lookups are shared with the generic entities.
+    """
+
+    __slots__ = (
+        "if_index",
+        "_snmp",
+        "_port_attributes_snmp_tables",
+        "_if_name",
+        "_if_descr_name",
+        "_if_alias",
+        "_ipv4",
+        "_ipv6",
+        "_ips_list",
+    )
+
+    def __init__(
+        self, snmp_handler, logger, port_name_response, port_attributes_snmp_tables
+    ):
+        self.if_index = port_name_response.index
+        self._snmp = snmp_handler
+        self._port_attributes_snmp_tables = port_attributes_snmp_tables
+        self._if_name = self._if_descr_name = self._if_alias = None
+        self._ipv4 = self._ipv6 = self._ips_list = None
+        if port_name_response.mib_id == port_constants.PORT_DESCR_NAME.mib_id:
+            self._if_descr_name = port_name_response.safe_value
+        else:
+            self._if_name = port_name_response.safe_value
+
+    _get_ip = SnmpIfEntity._get_ip
+    _get_ipv4 = SnmpIfEntity._get_ipv4
+    _get_ipv6 = SnmpIfEntity._get_ipv6
+
+    def _get_column(self, column) -> str:
+        return self._snmp.get_property(
+            column.get_snmp_mib_oid(self.if_index)
+        ).safe_value
+
+    @property
+    def port_name(self) -> str:
+        return self.if_name or self.if_descr_name
+
+    @property
+    def if_name(self) -> str:
+        if self._if_name is None:
+            self._if_name = self._get_column(port_constants.PORT_NAME)
+        return self._if_name
+
+    @property
+    def if_descr_name(self) -> str:
+        if self._if_descr_name is None:
+            self._if_descr_name = self._get_column(port_constants.PORT_DESCR_NAME)
+        return self._if_descr_name
+
+    @property
+    def if_port_description(self) -> str:
+        if self._if_alias is None:
+            self._if_alias = self._get_column(port_constants.PORT_DESCRIPTION)
+        return self._if_alias
+
+    @property
+    def ipv4_address(self):
+        if not self._ipv4:
+            if self._ips_list is None:
+                self._get_ip()
+            self._ipv4 = self._get_ipv4() or ""
+        return self._ipv4
+
+    @property
+    def ipv6_address(self):
+        if not self._ipv6:
+            if self._ips_list is None:
+                self._get_ip()
+            self._ipv6 = self._get_ipv6() or ""
+        return self._ipv6
+
+
+class F5IfPort(F5IfEntity):
+    """Compact physical port record of F5SnmpIfTable.
+
+    Speed, MTU and MAC are strings, so missing values fall back to the
+    defaults of the port attributes.
+    """
+
+    ADJACENT_TEMPLATE = SnmpIfPort.ADJACENT_TEMPLATE
+    PORT_IDS_PATTERN = SnmpIfPort.PORT_IDS_PATTERN
+    __slots__ = (
+        "_if_type",
+        "_if_speed",
+        "_if_mtu",
+        "_if_mac",
+        "_adjacent",
+        "_duplex",
+        "_auto_negotiation",
+    )
 
+    def __init__(
+        self, snmp_handler, logger, port_name_response, port_attributes_snmp_tables
+    ):
+        super(F5IfPort, self).__init__(
+            snmp_handler, logger, port_name_response, port_attributes_snmp_tables
+        )
+        self._if_type = self._if_speed = self._if_mtu = self._if_mac = None
+        self._adjacent = self._duplex = self._auto_negotiation = None
 
-class F5SnmpIfTable(SnmpIfTable):
+    _get_adjacent = SnmpIfPort._get_adjacent
+    _get_auto_neg = SnmpIfPort._get_auto_neg
+    _get_duplex = SnmpIfPort._get_duplex
+
+    @property
+    def if_type(self) -> str:
+        if self._if_type is None:
+            if_type = self._get_column(port_constants.PORT_TYPE)
+            self._if_type = if_type.replace("'", "") if if_type else "other"
+        return self._if_type
+
+    @property
+    def port_id(self):
+        port_id = self.PORT_IDS_PATTERN.search(self.port_name)
+        if port_id:
+            return port_id.group()
+
+    @property
+    def if_speed(self) -> str:
+        if self._if_speed is None:
+            self._if_speed = self._get_column(port_constants.PORT_SPEED)
+        return self._if_speed
+
+    @property
+    def if_mtu(self) -> str:
+        if self._if_mtu is None:
+            self._if_mtu = self._get_column(port_constants.PORT_MTU)
+        return self._if_mtu
+
+    @property
+    def if_mac(self) -> str:
+        if self._if_mac is None:
+            self._if_mac = self._get_column(port_constants.PORT_MAC)
+        return self._if_mac
+
+    @property
+    def adjacent(self) -> str:
+        if self._adjacent is None:
+            self._adjacent = self._get_adjacent() or ""
+        return self._adjacent
+
+    @property
+    def duplex(self) -> str:
+        if self._duplex is None:
+            self._duplex = self._get_duplex() or "Half"
+        return self._duplex
+
+    @property
+    def auto_negotiation(self) -> str:
+        if self._auto_negotiation is None:
+            self._auto_negotiation = self._get_auto_neg() or "False"
+        return self._auto_negotiation
+
+
+class F5IfPortChannel(F5IfEntity):
+    """Compact port channel record of F5SnmpIfTable."""
+
+    __slots__ = ("_associated_port_list",)
+
+    def __init__(
+        self, snmp_handler, logger, port_name_response, port_attributes_snmp_tables
+    ):
+        super(F5IfPortChannel, self).__init__(
+            snmp_handler, logger, port_name_response, port_attributes_snmp_tables
+        )
+        self._associated_port_list = None
+
+    _get_associated_ports = SnmpIfPortChannel._get_associated_ports
+
+    @property
+    def associated_port_list(self) -> list:
+        if self._associated_port_list is None:
+            self._associated_port_list = self._get_associated_ports()
+        return self._associated_port_list
+
+
+class F5SnmpIfTable(F5PortEngineMixin, SnmpIfTable):
+    IF_PORT = F5IfPort
+    IF_PORT_CHANNEL = F5IfPortChannel
     PORT_EXCLUDE_LIST = ["mgmt", "management", "loopback", "null"]
+    # port columns walked in the parallel discovery mode
+    PREFETCH_COLUMNS = (
+        port_constants.PORT_DESCR_NAME.get_snmp_mib_oid(),
+        port_constants.PORT_NAME.get_snmp_mib_oid(),
+        port_constants.PORT_DESCRIPTION.get_snmp_mib_oid(),
+        port_constants.PORT_TYPE.get_snmp_mib_oid(),
+        port_constants.PORT_MTU.get_snmp_mib_oid(),
+        port_constants.PORT_SPEED.get_snmp_mib_oid(),
+        port_constants.PORT_MAC.get_snmp_mib_oid(),
+        port_constants.PORT_AUTO_NEG.get_snmp_mib_oid(),
+        port_constants.PORT_ADJACENT_REM_TABLE,
+        port_constants.PORT_ADJACENT_LOC_TABLE,
+        SnmpMibObject("IP-MIB", "ipAdEntIfIndex"),
+        SnmpMibObject("IP-MIB", "ipAddressIfIndex"),
+        SnmpMibObject("IPV6-MIB", "ipv6AddrType"),
+        SnmpMibObject("EtherLike-MIB", "dot3StatsIndex"),
+        SnmpMibObject("IEEE8023-LAG-MIB", "dot3adAggPortAttachedAggID"),
+    ) + (TRUNK_COLUMNS + TRUNK_MEMBER_COLUMNS)
 
-    def _get_if_entities(self):
+    def _load_if_entities(self):
+        classifier = self.port_classifier
+        trunks = self.trunk_table.trunks
         for port in self._if_table:
             # commented default logic piece due to dot (.) being legal for f5
             # if "." in port.safe_value:
             #     continue
-            if any(
-                port_channel
-                for port_channel in self.PORT_CHANNEL_NAME
-                if port_channel in port.safe_value.lower()
-            ):
+            if port.safe_value in trunks:
+                # built from the trunk tables below
+                continue
+            category = classifier.classify(port.safe_value)
+            if category == classifier.PORT_CHANNEL:
                 self._add_port_channel(port)
-            elif not any(
-                exclude_port
-                for exclude_port in self.port_exclude_list
-                if exclude_port in port.safe_value.lower()
-            ):
+            elif category == classifier.PORT:
                 self._add_port(port)
+        # the records keep the index and the name, the responses aren't needed
+        self._if_table = ()
+
+    def _load_snmp_tables(self):
+        """Load if table with the adaptive GETBULK walker."""
+        self._logger.info("Start loading MIB tables:")
+        table_walker = get_table_walker(self._snmp, self._logger)
+        for if_table_oid in (
+            port_constants.PORT_DESCR_NAME,
+            port_constants.PORT_NAME,
+            port_constants.PORT_INDEX,
+        ):
+            self._if_table = table_walker.walk(if_table_oid.get_snmp_mib_oid())
+            if self._if_table:
+                break
+
+        self._logger.info(f"ifIndex table loaded, GETBULK: {table_walker.stats}")
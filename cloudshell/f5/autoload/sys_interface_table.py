@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import re
+
+from cloudshell.snmp.autoload.snmp_if_table import SnmpIfTable
+from cloudshell.snmp.core.domain.quali_mib_table import QualiMibTable
+from cloudshell.snmp.core.domain.snmp_oid import SnmpMibObject
+
+from cloudshell.f5.autoload.port_engine import F5PortEngineMixin
+from cloudshell.f5.autoload.trunk_table import TRUNK_COLUMNS, TRUNK_MEMBER_COLUMNS
+from cloudshell.f5.snmp.prefetched_snmp_service import get_row_value, get_table_walker
+
+SYS_INTERFACE_COLUMNS = (
+    SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysInterfaceName"),
+    SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysInterfaceMediaActiveSpeed"),
+    SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysInterfaceMediaActiveDuplex"),
+    SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysInterfaceMacAddr"),
+    SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysInterfaceMtu"),
+    SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysInterfaceStatus"),
+)
+SYS_IFX_STAT_COLUMNS = (
+    SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysIfxStatHighSpeed"),
+    SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysIfxStatAlias"),
+)
+
+
+class F5SysInterfacePort(object):
+    """Physical interface built from the sysInterfaceTable row.
+
+    Provides the same attributes as the IF-MIB based port of SnmpIfTable.
+    """
+
+    IF_TYPE = "ethernetCsmacd"
+    DUPLEX_MAP = {"full": "Full", "half": "Half"}
+    # the speed columns are in Mbps, the port bandwidth is in bps
+    SPEED_UNIT = 1000000
+    __slots__ = (
+        "if_index",
+        "port_name",
+        "if_name",
+        "if_descr_name",
+        "if_type",
+        "if_mac",
+        "if_mtu",
+        "if_speed",
+        "duplex",
+        "if_port_description",
+        "status",
+        "ipv4_address",
+        "ipv6_address",
+        "adjacent",
+        "auto_negotiation",
+    )
+
+    def __init__(self, name: str, row: dict):
+        self.if_index = re.sub(r"[^\w]+", "-", name)
+        self.port_name = self.if_name = self.if_descr_name = name
+        self.if_type = self.IF_TYPE
+        self.if_mac = get_row_value(row, "sysInterfaceMacAddr")
+        self.if_mtu = get_row_value(row, "sysInterfaceMtu") or 0
+        self.if_speed = (
+            self._get_speed(row, "sysIfxStatHighSpeed")
+            or self._get_speed(row, "sysInterfaceMediaActiveSpeed")
+        ) * self.SPEED_UNIT
+        self.duplex = self.DUPLEX_MAP.get(
+            get_row_value(row, "sysInterfaceMediaActiveDuplex"), "Half"
+        )
+        self.if_port_description = get_row_value(row, "sysIfxStatAlias")
+        self.status = get_row_value(row, "sysInterfaceStatus")
+        # self IPs and LLDP neighbours belong to VLANs, not to interfaces
+        self.ipv4_address = ""
+        self.ipv6_address = ""
+        self.adjacent = ""
+        self.auto_negotiation = "False"
+
+    @staticmethod
+    def _get_speed(row: dict, column: str) -> int:
+        try:
+            return int(get_row_value(row, column) or 0)
+        except ValueError:
+            return 0
+
+
+class F5SysInterfaceTable(F5PortEngineMixin, SnmpIfTable):
+    """Port discovery engine based on F5-BIGIP-SYSTEM-MIB interface tables.
+
+    sysInterfaceTable holds only physical interfaces, so VLAN, tunnel and
+    loopback ifEntries are never walked.
+    """
+
+    IF_PORT = F5SysInterfacePort
+    # sysInterfaceTable has no port channels, they live in sysTrunkTable
+    PORT_CHANNEL_NAME = ()
+    PORT_EXCLUDE_LIST = ["mgmt", "management"]
+    EXCLUDE_STATUSES = ("loopback", "unpopulated")
+    PREFETCH_COLUMNS = (
+        SYS_INTERFACE_COLUMNS
+        + SYS_IFX_STAT_COLUMNS
+        + TRUNK_COLUMNS
+        + TRUNK_MEMBER_COLUMNS
+    )
+
+    def _load_snmp_tables(self):
+        """Load F5 interface tables."""
+        self._logger.info("Start loading MIB tables:")
+        table_walker = get_table_walker(self._snmp, self._logger)
+        columns = table_walker.walk_many(SYS_INTERFACE_COLUMNS + SYS_IFX_STAT_COLUMNS)
+        self._sys_interface_table = QualiMibTable.create_from_list(
+            "sysInterfaceTable",
+            [response for column in columns for response in column],
+        )
+        self._if_table = []
+        self._logger.info(
+            f"sysInterfaceTable loaded, {len(self._sys_interface_table)} "
+            f"interfaces, GETBULK: {table_walker.stats}"
+        )
+
+    def _load_if_entities(self):
+        classifier = self.port_classifier
+        for index, row in self._sys_interface_table.items():
+            name = self._get_name(index, row)
+            port = self.if_port_type(name, row)
+            if (
+                port.status in self.EXCLUDE_STATUSES
+                or classifier.classify(name) == classifier.EXCLUDED
+            ):
+                continue
+            self._if_port_dict[port.if_index] = port
+            self._port_name_to_object_map[name.lower()] = port
+            self._unmapped_ports_list.append(port.if_index)
+
+    @staticmethod
+    def _get_name(index: str, row: dict) -> str:
+        return get_row_value(row, "sysInterfaceName", index)
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import re
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING
+
+from pyasn1.type import univ
+
+from cloudshell.snmp.core.domain.snmp_oid import SnmpMibObject
+
+from cloudshell.f5.snmp.index_codec import STRING, get_index_codec
+from cloudshell.f5.snmp.prefetched_snmp_service import get_row_value, get_table_walker
+
+if TYPE_CHECKING:
+    from logging import Logger
+    from typing import Dict, Iterator, List, Sequence, Tuple
+
+    from cloudshell.snmp.core.domain.snmp_response import SnmpResponse
+    from cloudshell.snmp.core.snmp_service import SnmpService
+
+TRUNK_COLUMNS = (
+    SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysTrunkStatus"),
+    SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysTrunkAggAddr"),
+    SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysTrunkOperBw"),
+)
+# trunk and member names are taken from the index, a single column is enough
+TRUNK_MEMBER_COLUMNS = (SnmpMibObject("F5-BIGIP-SYSTEM-MIB", "sysTrunkCfgMemberName"),)
+# trunks are indexed by the name, members by the trunk and the member names
+TRUNK_INDEX = (STRING,)
+TRUNK_MEMBER_INDEX = (STRING, STRING)
+
+
+class F5TrunkPortChannel(object):
+    """Port channel built from the sysTrunkTable row.
+
+    Provides the attributes of the IF-MIB based port channel of SnmpIfTable.
+    """
+
+    __slots__ = (
+        "if_index",
+        "port_channel_id",
+        "port_name",
+        "if_name",
+        "if_descr_name",
+        "if_mac",
+        "if_speed",
+        "status",
+        "if_port_description",
+        "ipv4_address",
+        "ipv6_address",
+        "associated_port_list",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        row: dict,
+        associated_port_list: List[str],
+        port_channel_id: str,
+    ):
+        self.if_index = name
+        self.port_channel_id = port_channel_id
+        self.port_name = self.if_name = self.if_descr_name = name
+        self.if_mac = get_row_value(row, "sysTrunkAggAddr")
+        # sysTrunkOperBw is in Mbps
+        self.if_speed = get_row_value(row, "sysTrunkOperBw") or 0
+        self.status = get_row_value(row, "sysTrunkStatus")
+        self.if_port_description = ""
+        self.ipv4_address = ""
+        self.ipv6_address = ""
+        self.associated_port_list = associated_port_list
+
+
+class F5TrunkTable(object):
+    """Trunks and their members from sysTrunkTable and sysTrunkCfgMemberTable.
+
+    Both tables are walked once and indexed by the trunk name.
+    """
+
+    PORT_CHANNEL = F5TrunkPortChannel
+
+    def __init__(self, snmp_service: SnmpService, logger: Logger):
+        self._snmp = snmp_service
+        self._logger = logger
+        self.trunks: Dict[str, Dict[str, SnmpResponse]] = defaultdict(dict)
+        self.members: Dict[str, List[str]] = defaultdict(list)
+        self._load_snmp_tables()
+
+    def _load_snmp_tables(self):
+        table_walker = get_table_walker(self._snmp, self._logger)
+        columns = table_walker.walk_many(TRUNK_COLUMNS + TRUNK_MEMBER_COLUMNS)
+        for snmp_oid_obj, responses in zip(TRUNK_COLUMNS, columns):
+            for (trunk_name,), response in self._iter_indexed(
+                snmp_oid_obj, responses, TRUNK_INDEX
+            ):
+                self.trunks[trunk_name][snmp_oid_obj.object_name] = response
+        for snmp_oid_obj, responses in zip(
+            TRUNK_MEMBER_COLUMNS, columns[len(TRUNK_COLUMNS) :]
+        ):
+            for (trunk_name, member_name), _ in self._iter_indexed(
+                snmp_oid_obj, responses, TRUNK_MEMBER_INDEX
+            ):
+                self.members[trunk_name].append(member_name)
+                self.trunks.setdefault(trunk_name, {})
+        self._logger.info(
+            f"sysTrunkTable loaded, {len(self.trunks)} trunks, "
+            f"{sum(map(len, self.members.values()))} members, "
+            f"GETBULK: {table_walker.stats}"
+        )
+
+    def _iter_indexed(
+        self,
+        snmp_oid_obj: SnmpMibObject,
+        responses: List[SnmpResponse],
+        layout: Sequence[str],
+    ) -> Iterator[Tuple[Tuple[str, ...], SnmpResponse]]:
+        """Split the index made of the names into the decoded names."""
+        column_oid = univ.ObjectIdentifier(
+            snmp_oid_obj.get_oid(self._snmp._snmp_engine)
+        )
+        codec = get_index_codec(layout)
+        for response in responses:
+            index = tuple(response._raw_oid[len(column_oid) :])
+            try:
+                names = codec.split(index)
+            except IndexError:
+                self._logger.debug(
+                    f"Unexpected index {index} of {snmp_oid_obj.object_name}"
+                )
+                continue
+            yield tuple(name.decode("utf-8", "replace") for name in names), response
+
+    def get_port_channels(
+        self, port_name_to_object_map: dict
+    ) -> Dict[str, F5TrunkPortChannel]:
+        """Build port channels with the members resolved to the ports.
+
+        :param port_name_to_object_map: ports by their lowered names
+        :return: port channels by their indexes
+        """
+        port_channels = {}
+        port_channel_ids = self._get_port_channel_ids()
+        for trunk_name in sorted(self.trunks):
+            associated_port_list = []
+            for member_name in sorted(self.members.get(trunk_name, [])):
+                port = port_name_to_object_map.get(member_name.lower())
+                if port is None:
+                    self._logger.debug(
+                        f"Member {member_name} of trunk {trunk_name} isn't a port"
+                    )
+                else:
+                    associated_port_list.append(port.if_index)
+            port_channel = self.PORT_CHANNEL(
+                trunk_name,
+                self.trunks[trunk_name],
+                associated_port_list,
+                port_channel_ids[trunk_name],
+            )
+            port_channels[port_channel.if_index] = port_channel
+        return port_channels
+
+    def _get_port_channel_ids(self) -> Dict[str, str]:
+        """Get port channel resource indexes of the trunks.
+
+        The trailing number of the trunk name is used like for the other port
+        channels, the whole name if there is no number or it isn't unique.
+        """
+        numbers = {name: re.search(r"\d+$", name) for name in self.trunks}
+        counts = Counter(match.group(0) for match in numbers.values() if match)
+        return {
+            name: match.group(0)
+            if match and counts[match.group(0)] == 1
+            else re.sub(r"[^\w]+", "-", name)
+            for name, match in numbers.items()
+        }
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from cloudshell.snmp.cloudshell_snmp import Snmp
+
+from cloudshell.f5.autoload.autoload_stages import merge_details
+from cloudshell.f5.autoload.f5_generic_snmp_autoload import (
+    F5FirewallGenericSNMPAutoload,
+    PortDiscoveryEngine,
+)
+from cloudshell.f5.flows.f5_autoload_flow import BigIPAutoloadFlow, prepare_mib_view
+from cloudshell.f5.snmp.async_snmp import AsyncSnmpClient, to_snmp_response
+from cloudshell.f5.snmp.mib_profile import MibProfile
+from cloudshell.f5.snmp.prefetched_snmp_service import PrefetchedSnmpService
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+    from cloudshell.shell.core.driver_context import AutoLoadDetails
+    from cloudshell.shell.standards.networking.autoload_model import (
+        NetworkingResourceModel,
+    )
+    from cloudshell.snmp.snmp_parameters import SNMPReadParameters
+
+    from cloudshell.f5.snmp.walk_stats import WalkStatsRecorder
+
+
+class AsyncBigIPAutoloadFlow(object):
+    """Autoload flow walking the device on the asyncio event loop.
+
+    Every column read by the discovery is walked concurrently with the asyncio
+    SNMP client, then the resource model is built from the walked columns the
+    same way BigIPAutoloadFlow builds it. Autoloads of many devices run
+    concurrently on a single event loop, SNMP v1 and v2c are supported.
+    """
+
+    MAX_CONCURRENT_WALKS = 8
+
+    def __init__(
+        self,
+        snmp_parameters: SNMPReadParameters,
+        logger: Logger,
+        mib_profile: MibProfile = MibProfile.FULL,
+        port_engine: PortDiscoveryEngine = PortDiscoveryEngine.IF_MIB,
+        max_concurrent_walks: int = MAX_CONCURRENT_WALKS,
+        timeout: float = 2.0,
+        retries: int = 2,
+        snmp: Snmp = None,
+    ):
+        """Async autoload flow.
+
+        :param max_concurrent_walks: per device limit of concurrent walks
+        :param timeout: SNMP response timeout, seconds
+        :param snmp: creates the SNMP service used to translate the responses
+        """
+        self._snmp_parameters = snmp_parameters
+        self._logger = logger
+        self._mib_profile = MibProfile(mib_profile)
+        self._port_engine = port_engine
+        self._max_concurrent_walks = max_concurrent_walks
+        self._timeout = timeout
+        self._retries = retries
+        self._snmp = snmp or Snmp()
+        # WalkSummary of the last discovery
+        self.walk_summary = None
+
+    async def discover(
+        self, supported_os: list[str], resource_model: NetworkingResourceModel
+    ) -> AutoLoadDetails:
+        with self._snmp.get_snmp_service(
+            self._snmp_parameters, self._logger
+        ) as snmp_service:
+            prepare_mib_view(
+                snmp_service,
+                BigIPAutoloadFlow.MIB_CACHES[self._mib_profile],
+                self._logger,
+            )
+            f5_snmp_autoload = F5FirewallGenericSNMPAutoload(
+                snmp_service, self._logger, port_engine=self._port_engine
+            )
+            with f5_snmp_autoload.walk_stats:
+                f5_snmp_autoload.snmp_handler = await self._prefetch(
+                    snmp_service,
+                    f5_snmp_autoload.prefetch_columns,
+                    f5_snmp_autoload.walk_stats,
+                )
+            stages = []
+            for _, details in f5_snmp_autoload.discover_stages(
+                supported_os, resource_model
+            ):
+                stages.append(details)
+                # let the autoloads of the other devices process their responses
+                await asyncio.sleep(0)
+            self.walk_summary = f5_snmp_autoload.walk_summary
+            return merge_details(*stages)
+
+    async def _prefetch(
+        self, snmp_service, columns, walk_stats: WalkStatsRecorder
+    ) -> PrefetchedSnmpService:
+        snmp_engine = snmp_service._snmp_engine
+        client = AsyncSnmpClient.from_parameters(
+            self._snmp_parameters,
+            timeout=self._timeout,
+            retries=self._retries,
+            walk_stats=walk_stats,
+        )
+        oids = [column.get_oid(snmp_engine) for column in columns]
+        async with client:
+            results = await client.walk_available(oids, self._max_concurrent_walks)
+        prefetched = PrefetchedSnmpService(snmp_service, self._logger)
+        walked = 0
+        for column, column_oid, var_binds in zip(columns, oids, results):
+            if var_binds is None:
+                # walked by the SNMP service once the discovery reads it
+                self._logger.warning(
+                    f"{column_oid} walk failed, left to the SNMP service"
+                )
+                continue
+            prefetched.add_column(
+                column,
+                [
+                    to_snmp_response(oid, value, snmp_engine, self._logger)
+                    for oid, value in var_binds
+                ],
+            )
+            walked += 1
+        self._logger.info(
+            f"Walked {walked} of {len(columns)} columns with {client.requests} "
+            f"requests"
+        )
+        return prefetched
@@ -1,40 +1,222 @@
 from __future__ import annotations
 
-import os
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 from cloudshell.shell.core.driver_context import AutoLoadDetails
 from cloudshell.shell.flows.autoload.basic_flow import AbstractAutoloadFlow
 
+from cloudshell.f5.autoload.autoload_cache import AutoloadCache, read_change_markers
+from cloudshell.f5.autoload.autoload_stages import AutoloadStage, merge_details
 from cloudshell.f5.autoload.f5_generic_snmp_autoload import (
     F5FirewallGenericSNMPAutoload,
+    PortDiscoveryEngine,
 )
+from cloudshell.f5.snmp.mib_cache import F5MibCache, get_mib_builder
+from cloudshell.f5.snmp.mib_profile import MIB_PROFILE_FOLDERS, MibProfile
+from cloudshell.f5.snmp.mib_view_cache import MIB_VIEW_CACHE
+from cloudshell.f5.snmp.snmp_recording import SnmpRecorder
 
 if TYPE_CHECKING:
     from logging import Logger
+    from typing import Iterator, Optional, Tuple
 
     from cloudshell.shell.standards.networking.autoload_model import (
         NetworkingResourceModel,
     )
+    from cloudshell.snmp.core.snmp_service import SnmpService
     from cloudshell.snmp.snmp_configurator import EnableDisableSnmpConfigurator
 
 
+# sysObjectID is translated to the vendor and the model with these MIBs
+VENDOR_MIBS = ("F5-BIGIP-COMMON-MIB", "F5-BIGIP-SYSTEM-MIB")
+
+
+def prepare_mib_view(
+    snmp_service: SnmpService, mib_cache: F5MibCache, logger: Logger
+) -> None:
+    """Attach the compiled MIBs and the shared MIB view to the SNMP service."""
+    mib_cache.attach(get_mib_builder(snmp_service))
+    view_controller = MIB_VIEW_CACHE.attach(snmp_service)
+    # loaded up front, otherwise the result depends on the MIBs the
+    # previous autoloads sharing the MIB view happened to load
+    view_controller.mibBuilder.loadModules(*VENDOR_MIBS)
+    logger.debug(
+        f"MIB view cache hit rate: {MIB_VIEW_CACHE.hit_rate:.0%} "
+        f"({MIB_VIEW_CACHE.hits} hits, {MIB_VIEW_CACHE.misses} misses)"
+    )
+
+
 class BigIPAutoloadFlow(AbstractAutoloadFlow):
+    MIB_CACHES = {
+        profile: F5MibCache(mibs_folder)
+        for profile, mibs_folder in MIB_PROFILE_FOLDERS.items()
+    }
+
     def __init__(
         self,
         snmp_configurator: EnableDisableSnmpConfigurator,
         logger: Logger,
+        mib_profile: MibProfile = MibProfile.FULL,
+        parallel_discovery: bool = False,
+        autoload_cache: AutoloadCache = None,
+        force_refresh: bool = False,
+        port_engine: PortDiscoveryEngine = PortDiscoveryEngine.IF_MIB,
+        snmp_record_path: str = None,
+        cluster_discovery: bool = False,
     ):
+        """Autoload flow.
+
+        :param autoload_cache: return cached details while the device change
+            markers stay the same, disabled if not set
+        :param force_refresh: run the full discovery even if the cached details
+            are up to date
+        :param port_engine: build ports from IF-MIB or from F5 sysInterfaceTable
+        :param snmp_record_path: write the SNMP responses of the autoload to
+            the snapshot served by SnmpReplayAgent, disabled if not set
+        :param cluster_discovery: model the VIPRION blades as the modules
+        """
         super(BigIPAutoloadFlow, self).__init__(logger)
         self._snmp_configurator = snmp_configurator
+        self._mib_profile = MibProfile(mib_profile)
+        self._parallel_discovery = parallel_discovery
+        self._autoload_cache = autoload_cache
+        self._force_refresh = force_refresh
+        self._port_engine = port_engine
+        self._snmp_record_path = snmp_record_path
+        self._cluster_discovery = cluster_discovery
+        # WalkSummary of the last discovery, None if the cached details are used
+        self.walk_summary = None
+
+    @property
+    def mib_cache(self) -> F5MibCache:
+        return self.MIB_CACHES[self._mib_profile]
+
+    def discover_stages(
+        self, supported_os: list[str], resource_model: NetworkingResourceModel
+    ) -> Iterator[Tuple[AutoloadStage, AutoLoadDetails]]:
+        """Discover the device yielding the details stage by stage.
+
+        The stages are yielded as soon as the tables they are built from are
+        walked, the SNMP session stays open until the generator is exhausted
+        or closed. Cached details are yielded as the only AutoloadStage.CACHED
+        stage. Together the stages contain the same resources and attributes
+        as the details returned by discover.
+        """
+        self.walk_summary = None
+        with self._snmp_configurator.get_service() as snmp_service:
+            with self._recording(snmp_service):
+                self._prepare_mib_view(snmp_service)
+                cache_key, markers, details = self._get_cached_details(
+                    snmp_service, supported_os, resource_model
+                )
+                if details:
+                    yield AutoloadStage.CACHED, details
+                    return
+
+                # the cache stores the whole details, keep the stages for it
+                stages = [] if cache_key else None
+                autoload = self._get_autoload(snmp_service)
+                try:
+                    for stage, details in autoload.discover_stages(
+                        supported_os, resource_model
+                    ):
+                        if stages is not None:
+                            stages.append(details)
+                        yield stage, details
+                finally:
+                    self.walk_summary = autoload.walk_summary
+                if cache_key:
+                    self._store_details(cache_key, markers, merge_details(*stages))
 
     def _autoload_flow(
         self, supported_os: list[str], resource_model: NetworkingResourceModel
     ) -> AutoLoadDetails:
+        self.walk_summary = None
         with self._snmp_configurator.get_service() as snmp_service:
-            snmp_service.add_mib_folder_path(
-                os.path.join(os.path.dirname(__file__), "..", "snmp", "mibs")
-            )
-            f5_snmp_autoload = F5FirewallGenericSNMPAutoload(snmp_service, self._logger)
+            with self._recording(snmp_service):
+                return self._discover(snmp_service, supported_os, resource_model)
+
+    @contextmanager
+    def _recording(self, snmp_service: SnmpService):
+        if not self._snmp_record_path:
+            yield
+            return
+        with SnmpRecorder(snmp_service) as recorder:
+            try:
+                yield
+            finally:
+                recorder.save(self._snmp_record_path)
+                self._logger.info(
+                    f"SNMP snapshot written to {self._snmp_record_path}: {recorder}"
+                )
+
+    def _prepare_mib_view(self, snmp_service: SnmpService) -> None:
+        prepare_mib_view(snmp_service, self.mib_cache, self._logger)
+
+    def _get_cached_details(
+        self,
+        snmp_service: SnmpService,
+        supported_os: list[str],
+        resource_model: NetworkingResourceModel,
+    ) -> Tuple[Optional[str], Optional[dict], Optional[AutoLoadDetails]]:
+        """Get the cache key, the change markers and the up to date details."""
+        if not self._autoload_cache:
+            return None, None, None
+        cache_key = self._autoload_cache.get_key(
+            self._snmp_configurator.resource_config.address,
+            resource_model,
+            supported_os=supported_os,
+            mib_profile=self._mib_profile,
+            port_engine=self._port_engine,
+            cluster_discovery=self._cluster_discovery,
+        )
+        markers = read_change_markers(snmp_service)
+        details = None
+        if markers and not self._force_refresh:
+            details = self._autoload_cache.get(cache_key, markers)
+            if details:
+                self._logger.info(
+                    "Device didn't change since the previous autoload, "
+                    "using cached details"
+                )
+        return cache_key, markers, details
+
+    def _store_details(
+        self, cache_key: str, markers: Optional[dict], details: AutoLoadDetails
+    ) -> None:
+        if markers and details:
+            self._autoload_cache.store(cache_key, markers, details)
+        else:
+            self._autoload_cache.invalidate(cache_key)
+
+    def _get_autoload(self, snmp_service: SnmpService) -> F5FirewallGenericSNMPAutoload:
+        return F5FirewallGenericSNMPAutoload(
+            snmp_service,
+            self._logger,
+            parallel_discovery=self._parallel_discovery,
+            port_engine=self._port_engine,
+            cluster_discovery=self._cluster_discovery,
+        )
+
+    def _discover(
+        self,
+        snmp_service: SnmpService,
+        supported_os: list[str],
+        resource_model: NetworkingResourceModel,
+    ) -> AutoLoadDetails:
+        self._prepare_mib_view(snmp_service)
+        cache_key, markers, details = self._get_cached_details(
+            snmp_service, supported_os, resource_model
+        )
+        if details:
+            return details
 
-            return f5_snmp_autoload.discover(supported_os, resource_model)
+        autoload = self._get_autoload(snmp_service)
+        try:
+            details = autoload.discover(supported_os, resource_model)
+        finally:
+            self.walk_summary = autoload.walk_summary
+        if cache_key:
+            self._store_details(cache_key, markers, details)
+        return details
@@ -7,14 +7,19 @@ from cloudshell.cli.session.session_exceptions import ExpectedSessionException
 from cloudshell.shell.flows.firmware.basic_flow import AbstractFirmwareFlow
 
 from ..command_actions.sys_config_actions import F5SysActions, F5SysConfigActions
+from ..snmp.mib_profile import MibProfile
+from ..snmp.volume_status import F5SnmpVolumeStatus, get_image_version
+from .f5_autoload_flow import BigIPAutoloadFlow, prepare_mib_view
 
 if TYPE_CHECKING:
     from logging import Logger
+    from typing import Tuple
 
     from cloudshell.shell.flows.utils.url import BasicLocalUrl, RemoteURL
     from cloudshell.shell.standards.firewall.resource_config import (
         FirewallResourceConfig,
     )
+    from cloudshell.snmp.snmp_configurator import EnableDisableSnmpConfigurator
 
     from ..cli.f5_cli_configurator import F5CliConfigurator
 
@@ -26,6 +31,8 @@ class F5FirmwareFlow(AbstractFirmwareFlow):
     RELOAD_TIMEOUT = 500
     INSTALL_CMD_TIMEOUT = 60
     INSTALL_TIMEOUT = 120
+    INSTALL_RETRIES = 20
+    SNMP_POLL_INTERVAL = 5
     BOOT_TIMEOUT = 60
 
     _local_storage = "/shared/images/"
@@ -35,9 +42,16 @@ class F5FirmwareFlow(AbstractFirmwareFlow):
         resource_config: FirewallResourceConfig,
         logger: Logger,
         cli_configurator: F5CliConfigurator,
+        snmp_configurator: EnableDisableSnmpConfigurator = None,
     ):
+        """Firmware flow.
+
+        :param snmp_configurator: poll the install status of the volume over
+            SNMP instead of tmsh, tmsh is used if not set
+        """
         super(F5FirmwareFlow, self).__init__(logger, resource_config)
         self._cli_configurator = cli_configurator
+        self._snmp_configurator = snmp_configurator
 
     def _load_firmware_flow(
         self, path: Url, vrf_management_name: str | None, timeout: int
@@ -58,32 +72,25 @@ class F5FirmwareFlow(AbstractFirmwareFlow):
             sys_config_actions.install_firmware(
                 filename, boot_volume=f"HD{boot_volume}"
             )
-            time.sleep(self.INSTALL_CMD_TIMEOUT)
-
-            max_retries = 20
-            retry = 0
-            volume_dict = sys_config_actions.show_version_per_volume().get(
-                boot_volume, {}
+            image_version = get_image_version(filename)
+            if self._snmp_configurator is not None and image_version is None:
+                self._logger.warning(
+                    f"Unknown version of {filename}, install status is read "
+                    f"with tmsh"
+                )
+            if self._snmp_configurator is None or image_version is None:
+                time.sleep(self.INSTALL_CMD_TIMEOUT)
+                max_retries = self.INSTALL_RETRIES
+            else:
+                # tmsh only confirms the state once SNMP reports the install done
+                max_retries = (
+                    self.INSTALL_RETRIES
+                    if self._wait_for_install(boot_volume, filename, image_version)
+                    else 0
+                )
+            volume_dict = self._wait_for_install_cli(
+                sys_config_actions, boot_volume, max_retries
             )
-            if volume_dict is None or volume_dict.get("status") is None:
-                raise Exception("Failed to load firmware, see logs for details.")
-
-            while (
-                "installing" in volume_dict.get("status")
-                or "testing" in volume_dict.get("status")
-            ) and retry != max_retries:
-                time.sleep(self.INSTALL_TIMEOUT)
-                try:
-                    volume_dict = sys_config_actions.show_version_per_volume().get(
-                        boot_volume
-                    )
-                    if volume_dict is None or volume_dict.get("status") is None:
-                        raise Exception(
-                            "Failed to load firmware, see logs for details."
-                        )
-                except ExpectedSessionException:
-                    pass
-                retry += 1
 
             if "complete" not in volume_dict.get("status"):
                 self._logger.error(f"Failed to load {filename} firmware")
@@ -109,3 +116,66 @@ class F5FirmwareFlow(AbstractFirmwareFlow):
                     f"available boot volumes: {updated_volumes_dict}"
                 )
                 raise Exception("Failed to update firmware version")
+
+    def _wait_for_install_cli(
+        self,
+        sys_config_actions: F5SysConfigActions,
+        boot_volume: float,
+        max_retries: int,
+    ) -> dict:
+        """Get the volume once it's not installing or after max_retries."""
+        retry = 0
+        volume_dict = sys_config_actions.show_version_per_volume().get(boot_volume, {})
+        if volume_dict is None or volume_dict.get("status") is None:
+            raise Exception("Failed to load firmware, see logs for details.")
+
+        while (
+            "installing" in volume_dict.get("status")
+            or "testing" in volume_dict.get("status")
+        ) and retry != max_retries:
+            time.sleep(self.INSTALL_TIMEOUT)
+            try:
+                volume_dict = sys_config_actions.show_version_per_volume().get(
+                    boot_volume
+                )
+                if volume_dict is None or volume_dict.get("status") is None:
+                    raise Exception("Failed to load firmware, see logs for details.")
+            except ExpectedSessionException:
+                pass
+            retry += 1
+        return volume_dict
+
+    def _wait_for_install(
+        self, boot_volume: float, filename: str, image_version: Tuple[str, str]
+    ) -> bool:
+        """Poll the volume over SNMP, False if it's not installed in time.
+
+        :param image_version: version and build of the image being installed
+        :raises Exception: the volume has other software than the image
+        """
+        timeout = self.INSTALL_CMD_TIMEOUT + self.INSTALL_TIMEOUT * self.INSTALL_RETRIES
+        deadline = time.monotonic() + timeout
+        with self._snmp_configurator.get_service() as snmp_service:
+            prepare_mib_view(
+                snmp_service,
+                BigIPAutoloadFlow.MIB_CACHES[MibProfile.FULL],
+                self._logger,
+            )
+            volume_status = F5SnmpVolumeStatus(snmp_service, self._logger)
+            while time.monotonic() < deadline:
+                status = volume_status.get_install_status(boot_volume, *image_version)
+                self._logger.debug(f"HD{boot_volume} install status: {status}")
+                if status == F5SnmpVolumeStatus.COMPLETE:
+                    return True
+                if status == F5SnmpVolumeStatus.FAILED:
+                    self._logger.error(
+                        f"Failed to load {filename} firmware, HD{boot_volume} "
+                        f"has other software installed"
+                    )
+                    raise Exception(
+                        f"Failed to load {filename} firmware, Please check logs "
+                        f"for details."
+                    )
+                time.sleep(self.SNMP_POLL_INTERVAL)
+        self._logger.warning(f"HD{boot_volume} is not installed in {timeout}s")
+        return False
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import random
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING
+
+from cloudshell.shell.standards.networking.autoload_model import NetworkingResourceModel
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from logging import Logger
+    from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+    from cloudshell.shell.core.driver_context import AutoLoadDetails
+    from cloudshell.shell.standards.core.resource_config_entities import (
+        GenericResourceConfig,
+    )
+
+    from cloudshell.f5.flows.f5_autoload_flow import BigIPAutoloadFlow
+    from cloudshell.f5.snmp.walk_stats import WalkSummary
+
+    FlowFactory = Callable[[GenericResourceConfig], BigIPAutoloadFlow]
+    ProgressCallback = Callable[["FleetAutoloadResult", "FleetProgress"], None]
+
+
+class FleetAutoloadResult(object):
+    """Autoload result of one device of the fleet."""
+
+    def __init__(
+        self,
+        resource_config: GenericResourceConfig,
+        site: str,
+        attempts: int,
+        elapsed: float,
+        details: AutoLoadDetails = None,
+        error: Exception = None,
+        walk_summary: WalkSummary = None,
+    ):
+        """Fleet autoload result.
+
+        :param attempts: autoloads run including the failed ones
+        :param elapsed: time of the last attempt, seconds
+        :param error: error of the last attempt if all of them failed
+        """
+        self.resource_config = resource_config
+        self.site = site
+        self.attempts = attempts
+        self.elapsed = elapsed
+        self.details = details
+        self.error = error
+        self.walk_summary = walk_summary
+
+    @property
+    def is_success(self) -> bool:
+        return self.error is None
+
+    def __str__(self):
+        status = "discovered" if self.is_success else f"failed: {self.error}"
+        return (
+            f"{self.resource_config.name} ({self.resource_config.address}) "
+            f"{status} in {self.elapsed:.1f}s, {self.attempts} attempts"
+        )
+
+
+class FleetProgress(object):
+    def __init__(self, total: int):
+        self.total = total
+        self.succeeded = 0
+        self.failed = 0
+        self.retries = 0
+        self.running = 0
+
+    @property
+    def completed(self) -> int:
+        return self.succeeded + self.failed
+
+    def __str__(self):
+        return (
+            f"{self.completed}/{self.total} devices completed, {self.failed} "
+            f"failed, {self.running} running, {self.retries} retries"
+        )
+
+
+class _FleetJob(object):
+    def __init__(self, resource_config: GenericResourceConfig, site: str):
+        self.resource_config = resource_config
+        self.site = site
+        self.attempts = 0
+        self.ready_time = 0.0
+
+
+class BigIPFleetAutoloadFlow(object):
+    """Runs BigIPAutoloadFlow across the fleet of devices.
+
+    Up to max_concurrency autoloads run in the threads at once, and up to
+    max_per_site of them for the devices of one site. Failed autoloads are
+    retried with the exponential backoff without holding a thread while
+    waiting. Results are yielded as the devices complete.
+    """
+
+    MAX_CONCURRENCY = 16
+    MAX_PER_SITE = 4
+
+    def __init__(
+        self,
+        flow_factory: FlowFactory,
+        logger: Logger,
+        max_concurrency: int = MAX_CONCURRENCY,
+        max_per_site: int = MAX_PER_SITE,
+        site_key: Callable[[GenericResourceConfig], str] = None,
+        retries: int = 2,
+        backoff: float = 5.0,
+        max_backoff: float = 60.0,
+        retry_on: Tuple[Type[Exception], ...] = (Exception,),
+        progress_callback: ProgressCallback = None,
+        resource_model_factory: Callable[
+            [GenericResourceConfig], NetworkingResourceModel
+        ] = NetworkingResourceModel.from_resource_config,
+    ):
+        """Fleet autoload flow.
+
+        :param flow_factory: creates the autoload flow of the resource config
+        :param site_key: gets the site of the resource config, every device
+            is a site of its own if not set
+        :param retries: attempts after the first failed one
+        :param backoff: delay before the first retry, doubled on every next
+            one up to max_backoff, seconds
+        :param retry_on: errors of the autoload which are retried
+        :param progress_callback: called with every result and the progress
+        """
+        self._flow_factory = flow_factory
+        self._logger = logger
+        self._max_concurrency = max(1, max_concurrency)
+        self._max_per_site = max(1, max_per_site)
+        self._site_key = site_key or (lambda resource_config: resource_config.address)
+        self._retries = retries
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._retry_on = retry_on
+        self._progress_callback = progress_callback
+        self._resource_model_factory = resource_model_factory
+
+    def discover(
+        self,
+        resource_configs: Iterable[GenericResourceConfig],
+        supported_os: list[str],
+    ) -> Iterator[FleetAutoloadResult]:
+        """Autoload the devices yielding the results as they complete.
+
+        Closing the generator waits for the running autoloads, pending ones
+        are not started.
+        """
+        pending = [
+            _FleetJob(resource_config, str(self._site_key(resource_config)))
+            for resource_config in resource_configs
+        ]
+        progress = FleetProgress(len(pending))
+        self._logger.info(
+            f"Autoloading {progress.total} devices, up to {self._max_concurrency} "
+            f"at once and {self._max_per_site} per site"
+        )
+        running: Dict[Future, _FleetJob] = {}
+        site_running = Counter()
+        with ThreadPoolExecutor(self._max_concurrency) as executor:
+            while pending or running:
+                now = time.monotonic()
+                for job in self._get_ready_jobs(pending, running, site_running, now):
+                    pending.remove(job)
+                    job.attempts += 1
+                    site_running[job.site] += 1
+                    running[executor.submit(self._autoload, job, supported_os)] = job
+                progress.running = len(running)
+
+                timeout = self._get_wait_timeout(pending, now)
+                if not running:
+                    # only the retries are left, wait doesn't block without futures
+                    time.sleep(timeout)
+                    continue
+                done, _ = wait(running, timeout, FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    site_running[job.site] -= 1
+                    progress.running = len(running)
+                    result = future.result()
+                    if result.is_success or not self._retry(job, result, pending):
+                        yield self._report(result, progress)
+                    else:
+                        progress.retries += 1
+
+    def _get_ready_jobs(
+        self,
+        pending: List[_FleetJob],
+        running: Dict[Future, _FleetJob],
+        site_running: Counter,
+        now: float,
+    ) -> List[_FleetJob]:
+        ready = []
+        site_running = Counter(site_running)
+        for job in pending:
+            if len(running) + len(ready) >= self._max_concurrency:
+                break
+            if job.ready_time <= now and site_running[job.site] < self._max_per_site:
+                ready.append(job)
+                site_running[job.site] += 1
+        return ready
+
+    @staticmethod
+    def _get_wait_timeout(pending: List[_FleetJob], now: float) -> Optional[float]:
+        """Wait for a running autoload or for the backoff of a retry to pass."""
+        retry_times = [job.ready_time for job in pending if job.ready_time > now]
+        return max(0.0, min(retry_times) - now) if retry_times else None
+
+    def _autoload(self, job: _FleetJob, supported_os: list[str]) -> FleetAutoloadResult:
+        flow = self._flow_factory(job.resource_config)
+        start_time = time.monotonic()
+        details = error = None
+        try:
+            details = flow.discover(
+                supported_os, self._resource_model_factory(job.resource_config)
+            )
+        except Exception as e:
+            error = e
+        return FleetAutoloadResult(
+            job.resource_config,
+            job.site,
+            job.attempts,
+            time.monotonic() - start_time,
+            details=details,
+            error=error,
+            walk_summary=getattr(flow, "walk_summary", None),
+        )
+
+    def _retry(
+        self, job: _FleetJob, result: FleetAutoloadResult, pending: List[_FleetJob]
+    ) -> bool:
+        """Schedule the retry of the failed autoload if it's retried."""
+        if not isinstance(result.error, self._retry_on) or (
+            job.attempts > self._retries
+        ):
+            return False
+        delay = min(self._max_backoff, self._backoff * 2 ** (job.attempts - 1))
+        # spread the retries of the devices which failed together
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        job.ready_time = time.monotonic() + delay
+        pending.append(job)
+        self._logger.warning(
+            f"Autoload of {job.resource_config.name} failed: {result.error}, "
+            f"retrying in {delay:.1f}s"
+        )
+        return True
+
+    def _report(
+        self, result: FleetAutoloadResult, progress: FleetProgress
+    ) -> FleetAutoloadResult:
+        if result.is_success:
+            progress.succeeded += 1
+            self._logger.info(f"{result}; {progress}")
+        else:
+            progress.failed += 1
+            self._logger.error(f"{result}; {progress}")
+        if self._progress_callback:
+            self._progress_callback(result, progress)
+        return result
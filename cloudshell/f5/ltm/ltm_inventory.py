@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import ipaddress
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from pyasn1.type import univ
+
+from cloudshell.snmp.core.domain.snmp_oid import SnmpMibObject
+
+from cloudshell.f5.snmp.bulk_walker import AdaptiveBulkWalker
+from cloudshell.f5.snmp.index_codec import INTEGER, STRING, get_index_codec
+
+if TYPE_CHECKING:
+    from logging import Logger
+    from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+    from cloudshell.snmp.core.domain.snmp_response import SnmpResponse
+    from cloudshell.snmp.core.snmp_service import SnmpService
+
+    # InetAddressType and the formatted address
+    AddressKey = Tuple[int, str]
+
+LOCAL_MIB = "F5-BIGIP-LOCAL-MIB"
+VIRTUAL_SERVER_COLUMNS = (
+    SnmpMibObject(LOCAL_MIB, "ltmVirtualServAddr"),
+    SnmpMibObject(LOCAL_MIB, "ltmVirtualServPort"),
+    SnmpMibObject(LOCAL_MIB, "ltmVirtualServEnabled"),
+    SnmpMibObject(LOCAL_MIB, "ltmVirtualServDefaultPool"),
+)
+# virtual server and pool names are taken from the index
+VIRTUAL_SERVER_POOL_COLUMNS = (SnmpMibObject(LOCAL_MIB, "ltmVirtualServPoolPoolName"),)
+POOL_COLUMNS = (
+    SnmpMibObject(LOCAL_MIB, "ltmPoolLbMode"),
+    SnmpMibObject(LOCAL_MIB, "ltmPoolActiveMemberCnt"),
+)
+POOL_MEMBER_COLUMNS = (
+    SnmpMibObject(LOCAL_MIB, "ltmPoolMemberRatio"),
+    SnmpMibObject(LOCAL_MIB, "ltmPoolMemberPriority"),
+)
+NODE_COLUMNS = (SnmpMibObject(LOCAL_MIB, "ltmNodeAddrName"),)
+LTM_COLUMNS = (
+    VIRTUAL_SERVER_COLUMNS
+    + VIRTUAL_SERVER_POOL_COLUMNS
+    + POOL_COLUMNS
+    + POOL_MEMBER_COLUMNS
+    + NODE_COLUMNS
+)
+# index layouts of the tables, see split_index
+VIRTUAL_SERVER_INDEX = (STRING,)
+VIRTUAL_SERVER_POOL_INDEX = (STRING, STRING)
+POOL_INDEX = (STRING,)
+# pool name, address type, address, port
+POOL_MEMBER_INDEX = (STRING, INTEGER, STRING, INTEGER)
+NODE_INDEX = (INTEGER, STRING)
+
+
+def get_partition(name: str) -> str:
+    """Get the partition of the full name, e.g. Common of /Common/vs1."""
+    if name.startswith("/"):
+        return name.split("/", 2)[1]
+    return ""
+
+
+def decode_name(name: bytes) -> str:
+    """Decode the name of the index or the value, invalid UTF-8 is replaced."""
+    return name.decode("utf-8", "replace")
+
+
+def format_address(address: bytes) -> str:
+    """Format InetAddress, route domain zones are appended after %."""
+    if len(address) in (4, 16):
+        return str(ipaddress.ip_address(address))
+    if len(address) in (8, 20):
+        zone = int.from_bytes(address[-4:], "big")
+        return f"{ipaddress.ip_address(address[:-4])}%{zone}"
+    return decode_name(address)
+
+
+def format_virtual_server_index(parts: tuple) -> str:
+    """Format the split index of the virtual server tables as the name."""
+    (name,) = parts
+    return decode_name(name)
+
+
+def format_pool_member_index(parts: tuple) -> str:
+    """Format the split index of the pool member tables, "<pool> <addr>:<port>"."""
+    pool, _, address, port = parts
+    return f"{decode_name(pool)} {format_address(address)}:{port}"
+
+
+def format_node_index(parts: tuple) -> str:
+    """Format the split index of the node tables as the address."""
+    _, address = parts
+    return format_address(address)
+
+
+class LtmNode(object):
+    __slots__ = ("address", "name", "partition", "pool_members")
+
+    def __init__(self, address: str, name: str):
+        self.address = address
+        self.name = name
+        self.partition = get_partition(name)
+        self.pool_members: List[LtmPoolMember] = []
+
+
+class LtmPoolMember(object):
+    __slots__ = ("pool", "node", "address", "port", "ratio", "priority")
+
+    def __init__(self, pool: LtmPool, node: Optional[LtmNode], address: str, port: int):
+        self.pool = pool
+        self.node = node
+        self.address = address
+        self.port = port
+        self.ratio = 0
+        self.priority = 0
+
+    @property
+    def name(self) -> str:
+        return f"{self.node.name if self.node else self.address}:{self.port}"
+
+
+class LtmPool(object):
+    __slots__ = ("name", "partition", "lb_mode", "active_members", "members")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.partition = get_partition(name)
+        self.lb_mode = ""
+        self.active_members = 0
+        self.members: List[LtmPoolMember] = []
+
+
+class LtmVirtualServer(object):
+    __slots__ = ("name", "partition", "address", "port", "enabled", "pools")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.partition = get_partition(name)
+        self.address = ""
+        self.port = 0
+        self.enabled = False
+        # the default pool first, then the pools of the rules
+        self.pools: List[LtmPool] = []
+
+
+class LtmInventory(object):
+    """Graph of virtual servers, their pools, pool members and nodes."""
+
+    def __init__(
+        self,
+        virtual_servers: Dict[str, LtmVirtualServer],
+        pools: Dict[str, LtmPool],
+        nodes: Dict[str, LtmNode],
+    ):
+        """LTM inventory.
+
+        :param virtual_servers: virtual servers by the full name
+        :param pools: pools by the full name
+        :param nodes: nodes by the address
+        """
+        self.virtual_servers = virtual_servers
+        self.pools = pools
+        self.nodes = nodes
+        self._partitions: Dict[str, List[LtmVirtualServer]] = defaultdict(list)
+        for virtual_server in virtual_servers.values():
+            self._partitions[virtual_server.partition].append(virtual_server)
+
+    @property
+    def partitions(self) -> List[str]:
+        return sorted(self._partitions)
+
+    def get_virtual_servers(self, partition: str) -> List[LtmVirtualServer]:
+        return list(self._partitions.get(partition, []))
+
+    def iter_paths(
+        self, virtual_servers: Iterable[LtmVirtualServer] = None
+    ) -> Iterator[Tuple[LtmVirtualServer, LtmPool, LtmPoolMember, Optional[LtmNode]]]:
+        """Iterate the virtual server, pool, member and node paths of the graph."""
+        if virtual_servers is None:
+            virtual_servers = self.virtual_servers.values()
+        for virtual_server in virtual_servers:
+            for pool in virtual_server.pools:
+                for member in pool.members:
+                    yield virtual_server, pool, member, member.node
+
+    def __str__(self):
+        members = sum(len(pool.members) for pool in self.pools.values())
+        return (
+            f"{len(self.virtual_servers)} virtual servers, {len(self.pools)} "
+            f"pools, {members} pool members, {len(self.nodes)} nodes in "
+            f"{len(self._partitions)} partitions"
+        )
+
+
+class F5LtmInventoryDiscovery(object):
+    """Builds LtmInventory from the LTM tables of F5-BIGIP-LOCAL-MIB.
+
+    The columns of all the tables are walked concurrently with GETBULK, then
+    the tables are joined in memory by the hash indexes of the pool names and
+    the node addresses, so the time is linear in the number of rows. Values
+    are read from the raw responses without resolving them with the MIB, the
+    names of the enumerations are looked up once per column. The MIB view of
+    the SNMP service needs the shipped F5-BIGIP-LOCAL-MIB.
+    """
+
+    MAX_CONCURRENCY = 4
+
+    def __init__(
+        self,
+        snmp_service: SnmpService,
+        logger: Logger,
+        max_concurrency: int = MAX_CONCURRENCY,
+    ):
+        self._snmp = snmp_service
+        self._logger = logger
+        self._max_concurrency = max_concurrency
+        self._bulk_walker = AdaptiveBulkWalker(snmp_service, logger)
+
+    def discover(self) -> LtmInventory:
+        columns = dict(
+            zip(
+                (column.object_name for column in LTM_COLUMNS),
+                self._bulk_walker.walk_many(LTM_COLUMNS, self._max_concurrency),
+            )
+        )
+
+        nodes: Dict[AddressKey, LtmNode] = {}
+        for (address_type, address), row in self._get_rows(
+            columns, NODE_COLUMNS, NODE_INDEX
+        ):
+            address = format_address(address)
+            nodes[address_type, address] = LtmNode(
+                address, self._to_str(row["ltmNodeAddrName"])
+            )
+
+        pools: Dict[str, LtmPool] = {}
+        lb_modes = self._get_named_values("ltmPoolLbMode")
+        for (name,), row in self._get_rows(columns, POOL_COLUMNS, POOL_INDEX):
+            pool = LtmPool(decode_name(name))
+            pools[pool.name] = pool
+            pool.lb_mode = self._to_name(row.get("ltmPoolLbMode"), lb_modes)
+            pool.active_members = self._to_int(row.get("ltmPoolActiveMemberCnt"))
+
+        for (pool_name, address_type, address, port), row in self._get_rows(
+            columns, POOL_MEMBER_COLUMNS, POOL_MEMBER_INDEX
+        ):
+            pool = self._get_pool(pools, decode_name(pool_name))
+            address = format_address(address)
+            node = nodes.get((address_type, address))
+            member = LtmPoolMember(pool, node, address, port)
+            member.ratio = self._to_int(row.get("ltmPoolMemberRatio"))
+            member.priority = self._to_int(row.get("ltmPoolMemberPriority"))
+            pool.members.append(member)
+            if node is not None:
+                node.pool_members.append(member)
+
+        virtual_servers: Dict[str, LtmVirtualServer] = {}
+        enabled = self._get_named_values("ltmVirtualServEnabled")
+        for (name,), row in self._get_rows(
+            columns, VIRTUAL_SERVER_COLUMNS, VIRTUAL_SERVER_INDEX
+        ):
+            virtual_server = LtmVirtualServer(decode_name(name))
+            virtual_servers[virtual_server.name] = virtual_server
+            address = row.get("ltmVirtualServAddr")
+            if address is not None:
+                virtual_server.address = format_address(bytes(address.raw_value))
+            virtual_server.port = self._to_int(row.get("ltmVirtualServPort"))
+            virtual_server.enabled = (
+                self._to_name(row.get("ltmVirtualServEnabled"), enabled) == "true"
+            )
+            default_pool = self._to_str(row.get("ltmVirtualServDefaultPool"))
+            if default_pool:
+                virtual_server.pools.append(self._get_pool(pools, default_pool))
+
+        for (name, pool_name), _ in self._get_rows(
+            columns, VIRTUAL_SERVER_POOL_COLUMNS, VIRTUAL_SERVER_POOL_INDEX
+        ):
+            virtual_server = virtual_servers.get(decode_name(name))
+            pool = self._get_pool(pools, decode_name(pool_name))
+            if virtual_server is not None and pool not in virtual_server.pools:
+                virtual_server.pools.append(pool)
+
+        inventory = LtmInventory(
+            virtual_servers,
+            pools,
+            {node.address: node for node in nodes.values()},
+        )
+        self._logger.info(
+            f"LTM inventory discovered: {inventory}, GETBULK: {self._bulk_walker.stats}"
+        )
+        return inventory
+
+    def _get_pool(self, pools: Dict[str, LtmPool], name: str) -> LtmPool:
+        """Get the pool by the name, pools missing in ltmPoolTable are added."""
+        pool = pools.get(name)
+        if pool is None:
+            self._logger.debug(f"Pool {name} isn't in ltmPoolTable")
+            pool = pools[name] = LtmPool(name)
+        return pool
+
+    def _get_rows(
+        self,
+        columns: Dict[str, List[SnmpResponse]],
+        snmp_oid_objs: Tuple[SnmpMibObject, ...],
+        layout: Sequence[str],
+    ) -> Iterator[Tuple[tuple, Dict[str, SnmpResponse]]]:
+        """Group the responses of the table columns into the rows by the index."""
+        codec = get_index_codec(layout)
+        rows: Dict[Tuple[int, ...], Dict[str, SnmpResponse]] = defaultdict(dict)
+        for snmp_oid_obj in snmp_oid_objs:
+            length = len(
+                univ.ObjectIdentifier(snmp_oid_obj.get_oid(self._snmp._snmp_engine))
+            )
+            for response in columns[snmp_oid_obj.object_name]:
+                rows[tuple(response._raw_oid[length:])][
+                    snmp_oid_obj.object_name
+                ] = response
+        for index, row in rows.items():
+            try:
+                yield codec.split(index), row
+            except IndexError:
+                self._logger.debug(f"Unexpected index {index} of {list(row)}")
+
+    def _get_named_values(self, column: str) -> Dict[int, str]:
+        (mib_column,) = self._snmp._snmp_engine.getMibBuilder().importSymbols(
+            LOCAL_MIB, column
+        )
+        named_values = mib_column.getSyntax().namedValues
+        return {int(value): name for name, value in named_values.items()}
+
+    @staticmethod
+    def _to_name(response: Optional[SnmpResponse], named_values: Dict[int, str]):
+        if response is None:
+            return ""
+        value = int(response.raw_value)
+        return named_values.get(value, str(value))
+
+    @staticmethod
+    def _to_int(response: Optional[SnmpResponse]) -> int:
+        return 0 if response is None else int(response.raw_value)
+
+    @staticmethod
+    def _to_str(response: Optional[SnmpResponse]) -> str:
+        if response is None:
+            return ""
+        return decode_name(bytes(response.raw_value))
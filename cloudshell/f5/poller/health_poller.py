@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from pyasn1.type import univ
+
+from cloudshell.snmp.core.domain.snmp_oid import SnmpMibObject
+
+from cloudshell.f5.poller.snmp_poller import F5SnmpPoller
+from cloudshell.f5.snmp.bulk_walker import AdaptiveBulkWalker
+from cloudshell.f5.snmp.index_codec import STRING, get_index_codec
+
+if TYPE_CHECKING:
+    from logging import Logger
+    from typing import Dict, List, Optional, Tuple
+
+    from cloudshell.snmp.core.domain.snmp_response import SnmpResponse
+    from cloudshell.snmp.core.snmp_service import SnmpService
+
+    Column = Dict[str, SnmpResponse]
+
+SYSTEM_MIB = "F5-BIGIP-SYSTEM-MIB"
+# CPU time counters in ticks, the idle one is the last
+CPU_TICKS = ("User", "Nice", "System", "Irq", "Softirq", "Iowait", "Idle")
+HOST_CPU_COLUMNS = tuple(
+    SnmpMibObject(SYSTEM_MIB, f"sysHostCpu{ticks}") for ticks in CPU_TICKS
+)
+MULTI_HOST_CPU_COLUMNS = tuple(
+    SnmpMibObject(SYSTEM_MIB, f"sysMultiHostCpu{ticks}") for ticks in CPU_TICKS
+)
+CPU_SENSOR_COLUMNS = (
+    SnmpMibObject(SYSTEM_MIB, "sysCpuTemperature"),
+    SnmpMibObject(SYSTEM_MIB, "sysCpuFanSpeed"),
+)
+MEMORY_COLUMNS = (
+    SnmpMibObject(SYSTEM_MIB, "sysSubMemoryAllocated"),
+    SnmpMibObject(SYSTEM_MIB, "sysSubMemorySize"),
+)
+FAN_COLUMNS = (
+    SnmpMibObject(SYSTEM_MIB, "sysChassisFanStatus"),
+    SnmpMibObject(SYSTEM_MIB, "sysChassisFanSpeed"),
+)
+POWER_SUPPLY_COLUMNS = (SnmpMibObject(SYSTEM_MIB, "sysChassisPowerSupplyStatus"),)
+TEMPERATURE_COLUMNS = (SnmpMibObject(SYSTEM_MIB, "sysChassisTempTemperature"),)
+HEALTH_COLUMNS = (
+    HOST_CPU_COLUMNS
+    + MULTI_HOST_CPU_COLUMNS
+    + CPU_SENSOR_COLUMNS
+    + MEMORY_COLUMNS
+    + FAN_COLUMNS
+    + POWER_SUPPLY_COLUMNS
+    + TEMPERATURE_COLUMNS
+)
+
+
+class HealthSample(object):
+    """Health of the device collected in one interval.
+
+    Every table is a dict by the row index: sysSubMemoryTable rows by the
+    name, sysMultiHostCpuTable rows by "<host>/<cpu>", the others by the
+    number. Rates are computed from the previous sample and are missing in
+    the first one and for the counters which were reset since then.
+    """
+
+    __slots__ = (
+        "timestamp",
+        "interval",
+        "cpu_usage",
+        "cpu_sensors",
+        "memory",
+        "fans",
+        "power_supplies",
+        "temperatures",
+    )
+
+    def __init__(self, timestamp: float, interval: Optional[float]):
+        """Health sample.
+
+        :param interval: seconds since the previous sample, None for the first
+        """
+        self.timestamp = timestamp
+        self.interval = interval
+        # busy share of the CPU time since the previous sample, percent
+        self.cpu_usage: Dict[str, float] = {}
+        # temperature, Celsius and fan speed, RPM
+        self.cpu_sensors: Dict[str, Tuple[int, int]] = {}
+        # allocated and size of the memory, bytes and allocated bytes per second
+        self.memory: Dict[str, Tuple[int, int, Optional[float]]] = {}
+        # status and speed, RPM
+        self.fans: Dict[str, Tuple[str, int]] = {}
+        self.power_supplies: Dict[str, str] = {}
+        # Celsius
+        self.temperatures: Dict[str, int] = {}
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __str__(self):
+        usage = max(self.cpu_usage.values(), default=None)
+        usage = "n/a" if usage is None else f"{usage:.1f}%"
+        return (
+            f"max CPU usage {usage} of {len(self.cpu_usage)} CPUs, "
+            f"{len(self.memory)} memory pools, {len(self.fans)} fans, "
+            f"{len(self.power_supplies)} power supplies, "
+            f"max temperature {max(self.temperatures.values(), default='n/a')}"
+        )
+
+
+class F5HealthCollector(object):
+    """Collects HealthSample from the health tables of the device.
+
+    All the columns are walked concurrently with GETBULK on every collect,
+    counters of the previous collect are kept to compute the rates. Columns
+    which timed out are missing in the sample.
+    """
+
+    def __init__(
+        self, snmp_service: SnmpService, logger: Logger, max_concurrency: int = 4
+    ):
+        self._snmp = snmp_service
+        self._logger = logger
+        self._max_concurrency = max_concurrency
+        self._bulk_walker = AdaptiveBulkWalker(snmp_service, logger)
+        self._column_oids = [
+            univ.ObjectIdentifier(column.get_oid(snmp_service._snmp_engine))
+            for column in HEALTH_COLUMNS
+        ]
+        self._named_columns = {
+            column.object_name for column in MEMORY_COLUMNS + MULTI_HOST_CPU_COLUMNS
+        }
+        self._previous_time: Optional[float] = None
+        self._previous_cpu_ticks: Dict[str, Tuple[int, ...]] = {}
+        self._previous_memory: Dict[str, int] = {}
+
+    def collect(self) -> HealthSample:
+        timestamp = time.time()
+        results = self._bulk_walker.walk_available(
+            HEALTH_COLUMNS, self._max_concurrency
+        )
+        columns: Dict[str, Column] = {}
+        for snmp_oid_obj, column_oid, responses in zip(
+            HEALTH_COLUMNS, self._column_oids, results
+        ):
+            if responses is None:
+                self._logger.warning(f"{snmp_oid_obj.object_name} walk timed out")
+                continue
+            named = snmp_oid_obj.object_name in self._named_columns
+            columns[snmp_oid_obj.object_name] = {
+                self._get_index(response._raw_oid[len(column_oid) :], named): response
+                for response in responses
+            }
+
+        interval = None
+        if self._previous_time is not None:
+            interval = timestamp - self._previous_time
+        sample = HealthSample(timestamp, interval)
+        cpu_ticks = self._get_rows(columns, HOST_CPU_COLUMNS)
+        cpu_ticks.update(self._get_rows(columns, MULTI_HOST_CPU_COLUMNS))
+        self._set_cpu_usage(sample, cpu_ticks)
+        for index, (temperature, fan_speed) in self._get_rows(
+            columns, CPU_SENSOR_COLUMNS
+        ).items():
+            sample.cpu_sensors[index] = (temperature, fan_speed)
+        self._set_memory(sample, self._get_rows(columns, MEMORY_COLUMNS))
+        for index, (status, speed) in self._get_rows(
+            columns, FAN_COLUMNS, numeric=False
+        ).items():
+            sample.fans[index] = (status, self._to_int(speed))
+        for index, (status,) in self._get_rows(
+            columns, POWER_SUPPLY_COLUMNS, numeric=False
+        ).items():
+            sample.power_supplies[index] = status
+        for index, (temperature,) in self._get_rows(
+            columns, TEMPERATURE_COLUMNS
+        ).items():
+            sample.temperatures[index] = temperature
+        self._previous_time = timestamp
+        return sample
+
+    def _set_cpu_usage(
+        self, sample: HealthSample, cpu_ticks: Dict[str, Tuple[int, ...]]
+    ) -> None:
+        for index, ticks in cpu_ticks.items():
+            previous = self._previous_cpu_ticks.get(index)
+            if previous is None:
+                continue
+            deltas = [current - last for current, last in zip(ticks, previous)]
+            total = sum(deltas)
+            # counters were reset, e.g. the blade rebooted
+            if total <= 0 or min(deltas) < 0:
+                continue
+            sample.cpu_usage[index] = 100.0 * (total - deltas[-1]) / total
+        self._previous_cpu_ticks = cpu_ticks
+
+    def _set_memory(
+        self, sample: HealthSample, memory: Dict[str, Tuple[int, ...]]
+    ) -> None:
+        for index, (allocated, size) in memory.items():
+            rate = None
+            previous = self._previous_memory.get(index)
+            if previous is not None and sample.interval:
+                rate = (allocated - previous) / sample.interval
+            sample.memory[index] = (allocated, size, rate)
+        self._previous_memory = {
+            index: allocated for index, (allocated, _) in memory.items()
+        }
+
+    def _get_rows(
+        self,
+        columns: Dict[str, Column],
+        snmp_oid_objs: Tuple[SnmpMibObject, ...],
+        numeric: bool = True,
+    ) -> Dict[str, tuple]:
+        """Get the rows with all the columns present by the index."""
+        table: List[Column] = []
+        for snmp_oid_obj in snmp_oid_objs:
+            column = columns.get(snmp_oid_obj.object_name)
+            if column is None:
+                return {}
+            table.append(column)
+        return {
+            index: tuple(
+                self._to_int(column[index].safe_value)
+                if numeric
+                else column[index].safe_value
+                for column in table
+            )
+            for index in table[0]
+            if all(index in column for column in table[1:])
+        }
+
+    @staticmethod
+    def _get_index(index: Tuple[int, ...], named: bool) -> str:
+        """Get the row index, joined by "/" if it's made of several parts.
+
+        :param named: the index starts with the length prefixed name
+        """
+        if not named or not index:
+            return ".".join(map(str, index))
+        position = 1 + index[0]
+        try:
+            (name,) = get_index_codec((STRING,)).split(index[:position])
+        except IndexError:
+            return ".".join(map(str, index))
+        return "/".join([name.decode("utf-8", "replace"), *map(str, index[position:])])
+
+    @staticmethod
+    def _to_int(value: str) -> int:
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return 0
+
+
+class F5HealthPoller(F5SnmpPoller):
+    """Polls the health of the device every interval over one SNMP session."""
+
+    def _get_collector(self, snmp_service: SnmpService) -> F5HealthCollector:
+        return F5HealthCollector(snmp_service, self._logger, self._max_concurrent_walks)
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+from pyasn1.type import univ
+
+from cloudshell.snmp.core.domain.snmp_oid import SnmpMibObject
+
+from cloudshell.f5.poller.snmp_poller import COUNTER_RESET, F5SnmpPoller
+from cloudshell.f5.snmp.bulk_walker import AdaptiveBulkWalker
+from cloudshell.f5.snmp.index_codec import STRING, get_index_codec
+
+if TYPE_CHECKING:
+    from logging import Logger
+    from typing import Dict, List, Optional, Tuple
+
+    from cloudshell.snmp.core.snmp_service import SnmpService
+
+    Index = Tuple[int, ...]
+
+SYSTEM_MIB = "F5-BIGIP-SYSTEM-MIB"
+# both tables are indexed by the interface name
+INTERFACE_INDEX = (STRING,)
+# counters walked and the rates they add up to, octets are counted as bits
+INTERFACE_COUNTERS = (
+    ("sysIfxStatHcInOctets", "bps_in", 8),
+    ("sysIfxStatHcOutOctets", "bps_out", 8),
+    ("sysIfxStatHcInUcastPkts", "pps_in", 1),
+    ("sysIfxStatHcInMulticastPkts", "pps_in", 1),
+    ("sysIfxStatHcInBroadcastPkts", "pps_in", 1),
+    ("sysIfxStatHcOutUcastPkts", "pps_out", 1),
+    ("sysIfxStatHcOutMulticastPkts", "pps_out", 1),
+    ("sysIfxStatHcOutBroadcastPkts", "pps_out", 1),
+    ("sysInterfaceStatErrorsIn", "errors_in", 1),
+    ("sysInterfaceStatErrorsOut", "errors_out", 1),
+    ("sysInterfaceStatDropsIn", "drops_in", 1),
+    ("sysInterfaceStatDropsOut", "drops_out", 1),
+)
+INTERFACE_RATES = (
+    "bps_in",
+    "bps_out",
+    "pps_in",
+    "pps_out",
+    "errors_in",
+    "errors_out",
+    "drops_in",
+    "drops_out",
+)
+
+
+class InterfaceStatsSample(object):
+    """Rates of the interfaces, bits, packets, errors and drops per second.
+
+    rates is a float array, a row per name and a column per INTERFACE_RATES.
+    Rates are NaN in the first sample and if any of their counters was
+    missing or reset.
+    """
+
+    __slots__ = ("timestamp", "interval", "names", "rates", "_rows")
+
+    def __init__(
+        self,
+        timestamp: float,
+        interval: Optional[float],
+        names: List[str],
+        rates: np.ndarray,
+    ):
+        self.timestamp = timestamp
+        self.interval = interval
+        self.names = names
+        self.rates = rates
+        self._rows: Optional[Dict[str, int]] = None
+
+    def get_interface(self, name: str) -> Dict[str, float]:
+        """Get the rates of the interface by the rate name."""
+        if self._rows is None:
+            self._rows = {row_name: row for row, row_name in enumerate(self.names)}
+        return dict(zip(INTERFACE_RATES, self.rates[self._rows[name]].tolist()))
+
+    def __str__(self):
+        return f"interface rates of {len(self.names)} interfaces"
+
+
+class F5InterfaceStatsCollector(object):
+    """Collects InterfaceStatsSample of sysIfxStatTable and sysInterfaceStatTable.
+
+    The counter columns of both tables are walked concurrently in one pass.
+    Interfaces keep their row in the counter buffers, which are allocated
+    for the interfaces seen so far and grown only when new ones appear. The
+    counters of the collect overwrite the buffer of the collect before the
+    previous one, the deltas are subtracted in place and the rates are the
+    product of the deltas and the matrix summing the counters of every rate,
+    so the Python work per collect is the decoding of the varbinds only.
+    Rows of the interfaces which are gone stay in the buffers. Needs NumPy,
+    the stats extra.
+    """
+
+    def __init__(
+        self,
+        snmp_service: SnmpService,
+        logger: Logger,
+        max_concurrency: int = 4,
+    ):
+        self._logger = logger
+        self._max_concurrency = max_concurrency
+        self._bulk_walker = AdaptiveBulkWalker(snmp_service, logger)
+        self._index_codec = get_index_codec(INTERFACE_INDEX)
+        self._columns = tuple(
+            SnmpMibObject(SYSTEM_MIB, column) for column, _, _ in INTERFACE_COUNTERS
+        )
+        self._column_lengths = [
+            len(univ.ObjectIdentifier(column.get_oid(snmp_service._snmp_engine)))
+            for column in self._columns
+        ]
+        # counter weight of every rate
+        self._weights = np.zeros((len(INTERFACE_COUNTERS), len(INTERFACE_RATES)))
+        for column, (_, rate, weight) in enumerate(INTERFACE_COUNTERS):
+            self._weights[column, INTERFACE_RATES.index(rate)] = weight
+        self._rate_counters = self._weights != 0
+        self._rows: Dict[Index, int] = {}
+        self._names: List[str] = []
+        # the current and the previous counters, swapped every collect
+        self._counters = np.zeros((2, 0, len(INTERFACE_COUNTERS)), dtype=np.uint64)
+        self._present = np.zeros((2, 0, len(INTERFACE_COUNTERS)), dtype=bool)
+        self._deltas = np.zeros((0, len(INTERFACE_COUNTERS)), dtype=np.uint64)
+        self._valid = np.zeros((0, len(INTERFACE_COUNTERS)), dtype=bool)
+        self._current = 0
+        self._previous_time: Optional[float] = None
+
+    def collect(self) -> InterfaceStatsSample:
+        timestamp = time.time()
+        results = self._bulk_walker.walk_available(self._columns, self._max_concurrency)
+        columns = []
+        for snmp_oid_obj, length, responses in zip(
+            self._columns, self._column_lengths, results
+        ):
+            if responses is None:
+                self._logger.warning(f"{snmp_oid_obj.object_name} walk timed out")
+                responses = ()
+            columns.append(
+                (
+                    [response._raw_oid.asTuple()[length:] for response in responses],
+                    [int(response.raw_value) for response in responses],
+                )
+            )
+        self._add_rows(
+            {index for indexes, _ in columns for index in indexes} - self._rows.keys()
+        )
+
+        row_count = len(self._rows)
+        previous = 1 - self._current
+        counters = self._counters[self._current, :row_count]
+        present = self._present[self._current, :row_count]
+        counters[:] = 0
+        present[:] = False
+        seen = np.zeros(row_count, dtype=bool)
+        for column, (indexes, values) in enumerate(columns):
+            column_rows = [self._rows[index] for index in indexes]
+            counters[column_rows, column] = np.array(values, dtype=np.uint64)
+            present[column_rows, column] = True
+            seen[column_rows] = True
+
+        interval = None
+        if self._previous_time is not None:
+            interval = timestamp - self._previous_time
+        deltas = self._deltas[:row_count]
+        valid = self._valid[:row_count]
+        np.subtract(counters, self._counters[previous, :row_count], out=deltas)
+        np.logical_and(present, self._present[previous, :row_count], out=valid)
+        valid &= deltas < COUNTER_RESET
+        if not interval:
+            valid[:] = False
+
+        rates = np.where(valid, deltas, 0).astype(float) @ self._weights
+        if interval:
+            rates /= interval
+        rates[~valid @ self._rate_counters] = np.nan
+
+        names = self._names
+        if not seen.all():
+            rates = rates[seen]
+            names = [name for name, row_seen in zip(names, seen.tolist()) if row_seen]
+        self._current = previous
+        self._previous_time = timestamp
+        return InterfaceStatsSample(timestamp, interval, list(names), rates)
+
+    def _add_rows(self, indexes: set) -> None:
+        """Add the rows of the new interfaces, growing the buffers if needed."""
+        if not indexes:
+            return
+        for index in sorted(indexes):
+            self._rows[index] = len(self._rows)
+            try:
+                name = self._index_codec.split(index)[0].decode("utf-8", "replace")
+            except IndexError:
+                self._logger.debug(f"Unexpected interface index {index}")
+                name = ".".join(map(str, index))
+            self._names.append(name)
+        capacity = self._deltas.shape[0]
+        if len(self._rows) <= capacity:
+            return
+        capacity = max(len(self._rows), 2 * capacity)
+        counters = np.zeros((2, capacity, len(INTERFACE_COUNTERS)), dtype=np.uint64)
+        present = np.zeros((2, capacity, len(INTERFACE_COUNTERS)), dtype=bool)
+        counters[:, : self._counters.shape[1]] = self._counters
+        present[:, : self._present.shape[1]] = self._present
+        self._counters, self._present = counters, present
+        self._deltas = np.zeros((capacity, len(INTERFACE_COUNTERS)), dtype=np.uint64)
+        self._valid = np.zeros((capacity, len(INTERFACE_COUNTERS)), dtype=bool)
+
+
+class F5InterfaceStatsPoller(F5SnmpPoller):
+    """Polls the rates of the interfaces every interval."""
+
+    def _get_collector(self, snmp_service: SnmpService) -> F5InterfaceStatsCollector:
+        return F5InterfaceStatsCollector(
+            snmp_service, self._logger, self._max_concurrent_walks
+        )
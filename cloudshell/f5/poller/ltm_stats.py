@@ -0,0 +1,372 @@
+from __future__ import annotations
+
+import itertools
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+from pyasn1.type import univ
+
+from cloudshell.snmp.core.domain.snmp_oid import SnmpMibObject
+
+from cloudshell.f5.ltm.ltm_inventory import (
+    LOCAL_MIB,
+    POOL_MEMBER_INDEX,
+    VIRTUAL_SERVER_INDEX,
+    format_pool_member_index,
+    format_virtual_server_index,
+    get_partition,
+)
+from cloudshell.f5.poller.snmp_poller import COUNTER_RESET, F5SnmpPoller
+from cloudshell.f5.snmp.bulk_walker import AdaptiveBulkWalker
+from cloudshell.f5.snmp.index_codec import get_index_codec
+
+if TYPE_CHECKING:
+    from logging import Logger
+    from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+    from cloudshell.snmp.core.domain.snmp_response import SnmpResponse
+    from cloudshell.snmp.core.snmp_service import SnmpService
+
+    Index = Tuple[int, ...]
+
+
+class LtmStatTable(object):
+    """Statistics table, its counter and gauge columns and the row names.
+
+    :param get_row_name: gets the name of the row from the index split into
+        the parts of the index layout, the partition is taken from the name
+    """
+
+    def __init__(
+        self,
+        name: str,
+        counters: Sequence[str],
+        gauges: Sequence[str],
+        index_layout: Sequence[str],
+        get_row_name: Callable[[tuple], str],
+    ):
+        self.name = name
+        self.counters = tuple(counters)
+        self.gauges = tuple(gauges)
+        self.index_codec = get_index_codec(index_layout)
+        self.get_row_name = get_row_name
+
+    @property
+    def columns(self) -> Tuple[SnmpMibObject, ...]:
+        return tuple(
+            SnmpMibObject(LOCAL_MIB, column) for column in self.counters + self.gauges
+        )
+
+
+def _get_stat_columns(prefix: str, names: str) -> Tuple[str, ...]:
+    return tuple(f"{prefix}{name}" for name in names.split())
+
+
+VIRTUAL_SERVER_STATS = LtmStatTable(
+    "ltmVirtualServStatTable",
+    counters=_get_stat_columns(
+        "ltmVirtualServStat",
+        "NoNodesErrors "
+        "ClientPktsIn ClientBytesIn ClientPktsOut ClientBytesOut ClientTotConns "
+        "EphemeralPktsIn EphemeralBytesIn EphemeralPktsOut EphemeralBytesOut "
+        "EphemeralTotConns "
+        "PvaPktsIn PvaBytesIn PvaPktsOut PvaBytesOut PvaTotConns "
+        "TotRequests TotPvaAssistConn",
+    ),
+    gauges=_get_stat_columns(
+        "ltmVirtualServStat",
+        "CsMinConnDur CsMaxConnDur CsMeanConnDur "
+        "ClientMaxConns ClientCurConns EphemeralMaxConns EphemeralCurConns "
+        "PvaMaxConns PvaCurConns CurrPvaAssistConn",
+    ),
+    index_layout=VIRTUAL_SERVER_INDEX,
+    get_row_name=format_virtual_server_index,
+)
+POOL_MEMBER_STATS = LtmStatTable(
+    "ltmPoolMemberStatTable",
+    counters=_get_stat_columns(
+        "ltmPoolMemberStat",
+        "ServerPktsIn ServerBytesIn ServerPktsOut ServerBytesOut ServerTotConns "
+        "PvaPktsIn PvaBytesIn PvaPktsOut PvaBytesOut PvaTotConns "
+        "TotRequests TotPvaAssistConn",
+    ),
+    gauges=_get_stat_columns(
+        "ltmPoolMemberStat",
+        "ServerMaxConns ServerCurConns PvaMaxConns PvaCurConns CurrPvaAssistConn",
+    ),
+    index_layout=POOL_MEMBER_INDEX,
+    get_row_name=format_pool_member_index,
+)
+LTM_STAT_TABLES = (VIRTUAL_SERVER_STATS, POOL_MEMBER_STATS)
+
+
+class LtmStatsSample(object):
+    """Rates of the counters and values of the gauges of the table rows.
+
+    rates and gauges are float arrays, a row per name and a column per
+    counter or gauge of the table. Rates are per second since the previous
+    sample, NaN in the first one and for the counters which were missing or
+    reset. partition_rates and partition_gauges are the sums of the known
+    values of the rows of every partition.
+    """
+
+    __slots__ = (
+        "table",
+        "timestamp",
+        "interval",
+        "names",
+        "partitions",
+        "rates",
+        "gauges",
+        "partition_rates",
+        "partition_gauges",
+        "_rows",
+    )
+
+    def __init__(
+        self,
+        table: LtmStatTable,
+        timestamp: float,
+        interval: Optional[float],
+        names: List[str],
+        partitions: List[str],
+    ):
+        self.table = table
+        self.timestamp = timestamp
+        self.interval = interval
+        self.names = names
+        self.partitions = partitions
+        self.rates = np.full((len(names), len(table.counters)), np.nan)
+        self.gauges = np.full((len(names), len(table.gauges)), np.nan)
+        self.partition_rates = np.zeros((len(partitions), len(table.counters)))
+        self.partition_gauges = np.zeros((len(partitions), len(table.gauges)))
+        self._rows: Optional[Dict[str, int]] = None
+
+    def get_row(self, name: str) -> Dict[str, float]:
+        """Get the rates and the gauges of the row by the column name."""
+        if self._rows is None:
+            self._rows = {row_name: row for row, row_name in enumerate(self.names)}
+        row = self._rows[name]
+        return self._as_dict(self.rates[row], self.gauges[row])
+
+    def get_partition(self, partition: str) -> Dict[str, float]:
+        """Get the sums of the rates and the gauges by the column name."""
+        row = self.partitions.index(partition)
+        return self._as_dict(self.partition_rates[row], self.partition_gauges[row])
+
+    def _as_dict(self, rates: np.ndarray, gauges: np.ndarray) -> Dict[str, float]:
+        return dict(
+            zip(
+                self.table.counters + self.table.gauges,
+                (*rates.tolist(), *gauges.tolist()),
+            )
+        )
+
+    def __str__(self):
+        return (
+            f"{self.table.name} {len(self.names)} rows in "
+            f"{len(self.partitions)} partitions"
+        )
+
+
+class _TableState(object):
+    """Counters of the previous collect of the table, a row per index."""
+
+    __slots__ = ("rows", "names", "partition_codes", "counters", "present")
+
+    def __init__(self, table: LtmStatTable):
+        self.rows: Dict[Index, int] = {}
+        self.names: List[str] = []
+        self.partition_codes: List[int] = []
+        self.counters = np.zeros((0, len(table.counters)), dtype=np.uint64)
+        self.present = np.zeros((0, len(table.counters)), dtype=bool)
+
+
+class F5LtmStatsCollector(object):
+    """Collects LtmStatsSample of the LTM statistics tables.
+
+    The columns of all the tables are walked concurrently with GETBULK on
+    every collect. Values are stored in the arrays of the rows once, the
+    rates, resets and partition sums are computed over the whole arrays, so
+    the Python work per collect grows with the number of the varbinds only.
+    Names of the rows are decoded when the row appears. Columns which timed
+    out have no rates in the sample. Needs NumPy, the stats extra.
+    """
+
+    def __init__(
+        self,
+        snmp_service: SnmpService,
+        logger: Logger,
+        tables: Sequence[LtmStatTable] = LTM_STAT_TABLES,
+        max_concurrency: int = 4,
+    ):
+        self._logger = logger
+        self._tables = tuple(tables)
+        self._max_concurrency = max_concurrency
+        self._bulk_walker = AdaptiveBulkWalker(snmp_service, logger)
+        self._columns = tuple(
+            column for table in self._tables for column in table.columns
+        )
+        self._column_lengths = [
+            len(univ.ObjectIdentifier(column.get_oid(snmp_service._snmp_engine)))
+            for column in self._columns
+        ]
+        self._states = {table.name: _TableState(table) for table in self._tables}
+        self._partitions: List[str] = []
+        self._partition_codes: Dict[str, int] = {}
+        self._previous_time: Optional[float] = None
+
+    def collect(self) -> Dict[str, LtmStatsSample]:
+        """Collect the sample of every table by the table name."""
+        timestamp = time.time()
+        results = iter(
+            zip(
+                self._columns,
+                self._column_lengths,
+                self._bulk_walker.walk_available(self._columns, self._max_concurrency),
+            )
+        )
+        interval = None
+        if self._previous_time is not None:
+            interval = timestamp - self._previous_time
+        samples = {}
+        for table in self._tables:
+            columns = []
+            for snmp_oid_obj, length, responses in (
+                next(results) for _ in table.columns
+            ):
+                if responses is None:
+                    self._logger.warning(f"{snmp_oid_obj.object_name} walk timed out")
+                columns.append((length, responses))
+            samples[table.name] = self._get_sample(table, timestamp, interval, columns)
+        self._previous_time = timestamp
+        return samples
+
+    def _get_sample(
+        self,
+        table: LtmStatTable,
+        timestamp: float,
+        interval: Optional[float],
+        columns: List[Tuple[int, Optional[List[SnmpResponse]]]],
+    ) -> LtmStatsSample:
+        state = self._states[table.name]
+        column_values = []
+        for length, responses in columns:
+            responses = responses or ()
+            column_values.append(
+                (
+                    [tuple(response._raw_oid[length:]) for response in responses],
+                    [int(response.raw_value) for response in responses],
+                )
+            )
+
+        # rows keep their numbers, new rows are appended in the OID order
+        rows = dict(state.rows)
+        names = list(state.names)
+        partition_codes = list(state.partition_codes)
+        for index in sorted(
+            {
+                index
+                for indexes, _ in column_values
+                for index in indexes
+                if index not in rows
+            }
+        ):
+            rows[index] = len(rows)
+            name = self._get_row_name(table, index)
+            names.append(name)
+            partition_codes.append(self._get_partition_code(get_partition(name)))
+
+        counter_count = len(table.counters)
+        counters = np.zeros((len(rows), counter_count), dtype=np.uint64)
+        present = np.zeros((len(rows), counter_count), dtype=bool)
+        gauges = np.full((len(rows), len(table.gauges)), np.nan)
+        seen = np.zeros(len(rows), dtype=bool)
+        for column, (indexes, values) in enumerate(column_values):
+            column_rows = [rows[index] for index in indexes]
+            seen[column_rows] = True
+            if column < counter_count:
+                counters[column_rows, column] = np.array(values, dtype=np.uint64)
+                present[column_rows, column] = True
+            else:
+                gauges[column_rows, column - counter_count] = values
+
+        # the previous counters are the first rows, new rows have none
+        known_count = len(state.rows)
+        deltas = counters.copy()
+        deltas[:known_count] -= state.counters
+        valid = present.copy()
+        valid[:known_count] &= state.present
+        valid[known_count:] = False
+        valid &= deltas < COUNTER_RESET
+        if not interval:
+            valid[:] = False
+
+        # rows which are gone from the device are dropped
+        if not seen.all():
+            counters, present, deltas, valid, gauges = (
+                values[seen] for values in (counters, present, deltas, valid, gauges)
+            )
+            kept = seen.tolist()
+            rows = {
+                index: row for row, index in enumerate(itertools.compress(rows, kept))
+            }
+            names = list(itertools.compress(names, kept))
+            partition_codes = list(itertools.compress(partition_codes, kept))
+
+        sample = LtmStatsSample(
+            table, timestamp, interval, names, list(self._partitions)
+        )
+        if interval:
+            sample.rates[valid] = deltas[valid] / interval
+        sample.gauges[:] = gauges
+
+        codes = np.array(partition_codes, dtype=np.intp)
+        partition_count = len(self._partitions)
+        rates = np.where(valid, sample.rates, 0.0)
+        gauges = np.nan_to_num(sample.gauges)
+        for column in range(counter_count):
+            sample.partition_rates[:, column] = np.bincount(
+                codes, weights=rates[:, column], minlength=partition_count
+            )
+        for column in range(len(table.gauges)):
+            sample.partition_gauges[:, column] = np.bincount(
+                codes, weights=gauges[:, column], minlength=partition_count
+            )
+
+        state.rows = rows
+        state.names = names
+        state.partition_codes = partition_codes
+        state.counters = counters
+        state.present = present
+        return sample
+
+    def _get_partition_code(self, partition: str) -> int:
+        code = self._partition_codes.get(partition)
+        if code is None:
+            code = self._partition_codes[partition] = len(self._partitions)
+            self._partitions.append(partition)
+        return code
+
+    def _get_row_name(self, table: LtmStatTable, index: Index) -> str:
+        try:
+            return table.get_row_name(table.index_codec.split(index))
+        except (IndexError, ValueError):
+            self._logger.debug(f"Unexpected index {index} of {table.name}")
+            return ".".join(map(str, index))
+
+
+class F5LtmStatsPoller(F5SnmpPoller):
+    """Polls the rates of the LTM statistics tables every interval."""
+
+    def __init__(
+        self, *args, tables: Sequence[LtmStatTable] = LTM_STAT_TABLES, **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self._tables = tables
+
+    def _get_collector(self, snmp_service: SnmpService) -> F5LtmStatsCollector:
+        return F5LtmStatsCollector(
+            snmp_service, self._logger, self._tables, self._max_concurrent_walks
+        )
@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from pyasn1.type import univ
+
+from cloudshell.snmp.core.domain.snmp_oid import SnmpMibObject
+from cloudshell.snmp.core.snmp_errors import ReadSNMPException
+
+from cloudshell.f5.ltm.ltm_inventory import (
+    LOCAL_MIB,
+    NODE_INDEX,
+    POOL_MEMBER_INDEX,
+    VIRTUAL_SERVER_INDEX,
+    format_node_index,
+    format_pool_member_index,
+    format_virtual_server_index,
+)
+from cloudshell.f5.poller.snmp_poller import F5SnmpPoller
+from cloudshell.f5.snmp.bulk_walker import AdaptiveBulkWalker
+from cloudshell.f5.snmp.index_codec import get_index_codec
+
+if TYPE_CHECKING:
+    from logging import Logger
+    from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+    from cloudshell.snmp.core.domain.snmp_response import SnmpResponse
+    from cloudshell.snmp.core.snmp_service import SnmpService
+
+    Index = Tuple[int, ...]
+    # enabled state and detail reason
+    Details = Tuple[int, bytes]
+
+
+class LtmStatusTable(object):
+    """Status table, its availability, enabled state and reason columns.
+
+    :param prefix: prefix of the column names, e.g. ltmVsStatus
+    :param get_row_name: gets the name of the row from the index split into
+        the parts of the index layout
+    """
+
+    def __init__(
+        self,
+        name: str,
+        prefix: str,
+        index_layout: Sequence[str],
+        get_row_name: Callable[[tuple], str],
+    ):
+        self.name = name
+        self.availability = SnmpMibObject(LOCAL_MIB, f"{prefix}AvailState")
+        self.enabled = SnmpMibObject(LOCAL_MIB, f"{prefix}EnabledState")
+        self.reason = SnmpMibObject(LOCAL_MIB, f"{prefix}DetailReason")
+        self.index_codec = get_index_codec(index_layout)
+        self.get_row_name = get_row_name
+
+    @property
+    def columns(self) -> Tuple[SnmpMibObject, ...]:
+        return self.availability, self.enabled, self.reason
+
+
+VIRTUAL_SERVER_STATUS = LtmStatusTable(
+    "ltmVsStatusTable", "ltmVsStatus", VIRTUAL_SERVER_INDEX, format_virtual_server_index
+)
+POOL_MEMBER_STATUS = LtmStatusTable(
+    "ltmPoolMbrStatusTable",
+    "ltmPoolMbrStatus",
+    POOL_MEMBER_INDEX,
+    format_pool_member_index,
+)
+NODE_STATUS = LtmStatusTable(
+    "ltmNodeAddrStatusTable", "ltmNodeAddrStatus", NODE_INDEX, format_node_index
+)
+LTM_STATUS_TABLES = (VIRTUAL_SERVER_STATUS, POOL_MEMBER_STATUS, NODE_STATUS)
+
+
+class LtmStatusEvent(object):
+    """Row of the status table which was added, changed or removed.
+
+    Removed rows have no availability, enabled state and reason.
+    """
+
+    ADDED = "added"
+    CHANGED = "changed"
+    REMOVED = "removed"
+
+    __slots__ = (
+        "table",
+        "name",
+        "kind",
+        "availability",
+        "enabled",
+        "reason",
+        "previous_availability",
+    )
+
+    def __init__(
+        self,
+        table: LtmStatusTable,
+        name: str,
+        kind: str,
+        availability: str = "",
+        enabled: str = "",
+        reason: str = "",
+        previous_availability: str = "",
+    ):
+        self.table = table
+        self.name = name
+        self.kind = kind
+        self.availability = availability
+        self.enabled = enabled
+        self.reason = reason
+        self.previous_availability = previous_availability
+
+    def __str__(self):
+        if self.kind == self.REMOVED:
+            return f"{self.table.name} {self.name} removed"
+        availability = self.availability
+        if self.previous_availability and self.previous_availability != availability:
+            availability = f"{self.previous_availability} -> {availability}"
+        return (
+            f"{self.table.name} {self.name} {self.kind}: {availability}, "
+            f"{self.enabled}, {self.reason}"
+        )
+
+
+class F5LtmStatusCollector(object):
+    """Collects LtmStatusEvent of the rows which changed since the last collect.
+
+    Only the availability and the hash of the availability, enabled state
+    and reason are kept per row. The first collect reports every row as
+    added. In the availability_only mode only the availability columns are
+    walked, the enabled state and the reason are fetched with GET for the
+    rows with the new availability, or walked if there are many of them.
+    Changes of the enabled state or the reason alone are seen only in the
+    full mode. Tables which timed out are skipped till the next collect.
+    """
+
+    MAX_CONCURRENCY = 4
+    # more changed rows than this are walked instead of fetched with GET
+    MAX_GET_ROWS = 64
+
+    def __init__(
+        self,
+        snmp_service: SnmpService,
+        logger: Logger,
+        tables: Sequence[LtmStatusTable] = LTM_STATUS_TABLES,
+        availability_only: bool = False,
+        max_concurrency: int = MAX_CONCURRENCY,
+    ):
+        self._snmp = snmp_service
+        self._logger = logger
+        self._tables = tuple(tables)
+        self._availability_only = availability_only
+        self._max_concurrency = max_concurrency
+        self._bulk_walker = AdaptiveBulkWalker(snmp_service, logger)
+        self._named_values: Dict[str, Dict[int, str]] = {}
+        # availability and the hash of the row by the index
+        self._rows: Dict[str, Dict[Index, Tuple[int, int]]] = {
+            table.name: {} for table in self._tables
+        }
+        self._names: Dict[str, Dict[Index, str]] = {
+            table.name: {} for table in self._tables
+        }
+
+    def collect(self) -> List[LtmStatusEvent]:
+        start_time = time.time()
+        columns = [
+            column
+            for table in self._tables
+            for column in (
+                (table.availability,) if self._availability_only else table.columns
+            )
+        ]
+        results = dict(
+            zip(
+                (column.object_name for column in columns),
+                self._bulk_walker.walk_available(columns, self._max_concurrency),
+            )
+        )
+        events = []
+        for table in self._tables:
+            responses = results[table.availability.object_name]
+            if responses is None:
+                self._logger.warning(f"{table.name} walk timed out")
+                continue
+            availabilities = {
+                index: int(response.raw_value)
+                for index, response in self._iter_indexed(table.availability, responses)
+            }
+            if self._availability_only:
+                details = self._get_changed_details(table, availabilities)
+            else:
+                details = self._get_details(
+                    table,
+                    results[table.enabled.object_name],
+                    results[table.reason.object_name],
+                )
+            events.extend(self._update_rows(table, availabilities, details))
+        self._logger.debug(
+            f"{len(events)} status events collected in "
+            f"{time.time() - start_time:.2f}s, GETBULK: {self._bulk_walker.stats}"
+        )
+        return events
+
+    def _update_rows(
+        self,
+        table: LtmStatusTable,
+        availabilities: Dict[Index, int],
+        details: Dict[Index, Details],
+    ) -> List[LtmStatusEvent]:
+        previous_rows = self._rows[table.name]
+        names = self._names[table.name]
+        rows: Dict[Index, Tuple[int, int]] = {}
+        events = []
+        for index, availability in availabilities.items():
+            previous = previous_rows.get(index)
+            row_details = details.get(index)
+            if row_details is None:
+                # availability only, unchanged or the row is gone already
+                if previous is not None:
+                    rows[index] = previous
+                continue
+            row_hash = hash((availability, *row_details))
+            rows[index] = availability, row_hash
+            if previous is not None and previous[1] == row_hash:
+                continue
+            name = names.get(index)
+            if name is None:
+                name = names[index] = self._get_row_name(table, index)
+            enabled, reason = row_details
+            event = LtmStatusEvent(
+                table,
+                name,
+                LtmStatusEvent.ADDED,
+                self._to_name(table.availability, availability),
+                self._to_name(table.enabled, enabled),
+                reason.decode("utf-8", "replace"),
+            )
+            if previous is not None:
+                event.kind = LtmStatusEvent.CHANGED
+                event.previous_availability = self._to_name(
+                    table.availability, previous[0]
+                )
+            events.append(event)
+        for index in previous_rows.keys() - rows.keys():
+            events.append(
+                LtmStatusEvent(table, names.pop(index), LtmStatusEvent.REMOVED)
+            )
+        self._rows[table.name] = rows
+        return sorted(events, key=lambda event: event.name)
+
+    def _get_changed_details(
+        self, table: LtmStatusTable, availabilities: Dict[Index, int]
+    ) -> Dict[Index, Details]:
+        """Get the details of the new rows and of the changed availabilities."""
+        previous_rows = self._rows[table.name]
+        changed = [
+            index
+            for index, availability in availabilities.items()
+            if previous_rows.get(index, (None,))[0] != availability
+        ]
+        if not changed:
+            return {}
+        if len(changed) > self.MAX_GET_ROWS:
+            enabled, reason = self._bulk_walker.walk_available(
+                (table.enabled, table.reason), self._max_concurrency
+            )
+            details = self._get_details(table, enabled, reason)
+            return {index: details[index] for index in changed if index in details}
+        return self._get_row_details(table, changed)
+
+    def _get_row_details(
+        self, table: LtmStatusTable, indexes: List[Index]
+    ) -> Dict[Index, Details]:
+        """Get the enabled state and the reason of the rows with GET."""
+        engine = self._snmp._snmp_engine
+        columns = []
+        for column in (table.enabled, table.reason):
+            column_oid = univ.ObjectIdentifier(column.get_oid(engine))
+            try:
+                columns.append(
+                    self._bulk_walker.get_many(column_oid + index for index in indexes)
+                )
+            except ReadSNMPException:
+                self._logger.warning(f"{column.object_name} GET failed")
+                return {}
+        return self._get_details(table, *columns)
+
+    def _get_details(
+        self,
+        table: LtmStatusTable,
+        enabled: Optional[List[SnmpResponse]],
+        reason: Optional[List[SnmpResponse]],
+    ) -> Dict[Index, Details]:
+        """Join the enabled state and the reason responses by the index."""
+        if enabled is None or reason is None:
+            self._logger.warning(f"{table.name} details walk timed out")
+            return {}
+        enabled_states = {
+            index: int(response.raw_value)
+            for index, response in self._iter_indexed(table.enabled, enabled)
+        }
+        return {
+            index: (enabled_states[index], bytes(response.raw_value))
+            for index, response in self._iter_indexed(table.reason, reason)
+            if index in enabled_states
+        }
+
+    def _iter_indexed(
+        self, snmp_oid_obj: SnmpMibObject, responses: Iterable[SnmpResponse]
+    ) -> Iterable[Tuple[Index, SnmpResponse]]:
+        """Iterate the responses of the column by the index."""
+        column_oid = univ.ObjectIdentifier(
+            snmp_oid_obj.get_oid(self._snmp._snmp_engine)
+        )
+        for response in responses:
+            yield tuple(response._raw_oid[len(column_oid) :]), response
+
+    def _get_row_name(self, table: LtmStatusTable, index: Index) -> str:
+        try:
+            return table.get_row_name(table.index_codec.split(index))
+        except IndexError:
+            self._logger.debug(f"Unexpected index {index} of {table.name}")
+            return ".".join(map(str, index))
+
+    def _to_name(self, snmp_oid_obj: SnmpMibObject, value: int) -> str:
+        named_values = self._named_values.get(snmp_oid_obj.object_name)
+        if named_values is None:
+            (mib_column,) = self._snmp._snmp_engine.getMibBuilder().importSymbols(
+                LOCAL_MIB, snmp_oid_obj.object_name
+            )
+            named_values = self._named_values[snmp_oid_obj.object_name] = {
+                int(number): name
+                for name, number in mib_column.getSyntax().namedValues.items()
+            }
+        return named_values.get(value, str(value))
+
+
+class F5LtmStatusPoller(F5SnmpPoller):
+    """Polls the changes of the LTM status tables every interval."""
+
+    def __init__(
+        self,
+        *args,
+        tables: Sequence[LtmStatusTable] = LTM_STATUS_TABLES,
+        availability_only: bool = False,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self._tables = tables
+        self._availability_only = availability_only
+
+    def _get_collector(self, snmp_service: SnmpService) -> F5LtmStatusCollector:
+        return F5LtmStatusCollector(
+            snmp_service,
+            self._logger,
+            self._tables,
+            self._availability_only,
+            self._max_concurrent_walks,
+        )
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from cloudshell.f5.flows.f5_autoload_flow import BigIPAutoloadFlow, prepare_mib_view
+from cloudshell.f5.snmp.mib_profile import MibProfile
+
+if TYPE_CHECKING:
+    from logging import Logger
+    from typing import Any, Iterator
+
+    from cloudshell.snmp.core.snmp_service import SnmpService
+    from cloudshell.snmp.snmp_configurator import EnableDisableSnmpConfigurator
+
+
+# Counter64 deltas are computed modulo 2**64, so a wrapped counter gives
+# the right delta, a delta from this value on is a counter which went back
+COUNTER_RESET = np.uint64(2**63)
+
+
+class F5SnmpPoller(ABC):
+    """Collects the samples every interval over one SNMP session.
+
+    Subclasses create the collector, an object with the collect method which
+    is called once per interval and keeps the state between the calls.
+    """
+
+    MAX_CONCURRENT_WALKS = 4
+
+    def __init__(
+        self,
+        snmp_configurator: EnableDisableSnmpConfigurator,
+        logger: Logger,
+        max_concurrent_walks: int = MAX_CONCURRENT_WALKS,
+    ):
+        self._snmp_configurator = snmp_configurator
+        self._logger = logger
+        self._max_concurrent_walks = max_concurrent_walks
+
+    @abstractmethod
+    def _get_collector(self, snmp_service: SnmpService) -> Any:
+        """Create the collector of the samples read with the SNMP service."""
+
+    def poll(self, interval: float, count: int = None) -> Iterator[Any]:
+        """Yield the sample every interval, seconds.
+
+        Polls until the generator is closed or count samples are yielded.
+        A collect taking longer than the interval is followed by the next one
+        right away, the missed intervals are skipped.
+        """
+        with self._snmp_configurator.get_service() as snmp_service:
+            prepare_mib_view(
+                snmp_service,
+                BigIPAutoloadFlow.MIB_CACHES[MibProfile.FULL],
+                self._logger,
+            )
+            collector = self._get_collector(snmp_service)
+            next_time = time.monotonic()
+            collected = 0
+            while count is None or collected < count:
+                sample = collector.collect()
+                collected += 1
+                self._logger.debug(f"{type(self).__name__} sample: {sample}")
+                yield sample
+                next_time = max(next_time + interval, time.monotonic())
+                if count is None or collected < count:
+                    time.sleep(max(0.0, next_time - time.monotonic()))
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import random
+from typing import TYPE_CHECKING
+
+from pyasn1.codec.ber import decoder, encoder
+from pyasn1.error import PyAsn1Error
+from pyasn1.type import univ
+from pysnmp.proto import api, rfc1902, rfc1905
+from pysnmp.proto.errind import RequestTimedOut, requestTimedOut
+
+from cloudshell.snmp.core.domain.snmp_response import SnmpResponse
+from cloudshell.snmp.core.snmp_errors import ReadSNMPException
+from cloudshell.snmp.snmp_parameters import SnmpParameters
+
+from cloudshell.f5.snmp.bulk_walker import NO_SUCH_NAME_ERROR_STATUS
+
+if TYPE_CHECKING:
+    from logging import Logger
+    from typing import Dict, Iterable, List, Optional, Tuple
+
+    from pysnmp.entity.engine import SnmpEngine
+
+    from cloudshell.snmp.snmp_parameters import SNMPReadParameters
+
+    from cloudshell.f5.snmp.walk_stats import WalkStatsRecorder
+
+    VarBind = Tuple[univ.ObjectIdentifier, object]
+
+# values ending the walk, the same as skipped by SnmpResponseReader
+END_OF_WALK_TAGS = frozenset(
+    (
+        rfc1905.NoSuchObject.tagSet,
+        rfc1905.NoSuchInstance.tagSet,
+        rfc1905.EndOfMibView.tagSet,
+    )
+)
+
+
+def to_snmp_response(
+    oid: univ.ObjectIdentifier, value, snmp_engine: SnmpEngine, logger: Logger
+) -> SnmpResponse:
+    """Create the response like SnmpResponseReader does for the walked var-bind."""
+    if value.tagSet == rfc1902.Integer32.tagSet:
+        value = rfc1902.Integer32(value)
+    elif value.tagSet == rfc1902.Unsigned32.tagSet:
+        value = rfc1902.Unsigned32(value)
+    return SnmpResponse(oid, value, snmp_engine=snmp_engine, logger=logger)
+
+
+class _SnmpClientProtocol(asyncio.DatagramProtocol):
+    """Passes the responses to the requests in flight by the request ID."""
+
+    def __init__(self, proto_module):
+        self._proto_module = proto_module
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.requests: Dict[int, asyncio.Future] = {}
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        proto_module = self._proto_module
+        try:
+            message, _ = decoder.decode(data, asn1Spec=proto_module.Message())
+        except PyAsn1Error:
+            return
+        pdu = proto_module.apiMessage.getPDU(message)
+        future = self.requests.pop(int(proto_module.apiPDU.getRequestID(pdu)), None)
+        if future and not future.done():
+            future.set_result((pdu, len(data)))
+
+    def error_received(self, exc):
+        # e.g. ICMP port unreachable, the request is retried until it times out
+        pass
+
+    def connection_lost(self, exc):
+        for future in self.requests.values():
+            future.cancel()
+        self.requests.clear()
+
+
+class AsyncSnmpClient(object):
+    """SNMP v1/v2c client running on the asyncio event loop.
+
+    Requests of all the clients share the event loop, so many devices and many
+    tables of every device are walked concurrently without threads.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        community: str,
+        port: int = 161,
+        version: str = SnmpParameters.SnmpVersion.V2,
+        timeout: float = 2.0,
+        retries: int = 2,
+        max_repetitions: int = 25,
+        walk_stats: WalkStatsRecorder = None,
+    ):
+        """Asyncio SNMP client.
+
+        :param timeout: response timeout of every attempt, seconds
+        :param retries: attempts after the first timed out one
+        :param max_repetitions: GETBULK max-repetitions of the walks
+        :param walk_stats: records the requests and the responses if set
+        """
+        if version == SnmpParameters.SnmpVersion.V1:
+            self._proto_module = api.protoModules[api.protoVersion1]
+        elif version == SnmpParameters.SnmpVersion.V2:
+            self._proto_module = api.protoModules[api.protoVersion2c]
+        else:
+            raise ValueError(f"SNMP version {version} isn't supported")
+        self._address = (host, port)
+        self._community = community
+        self._timeout = timeout
+        self._retries = retries
+        self._max_repetitions = max_repetitions
+        self._walk_stats = walk_stats
+        self._protocol: Optional[_SnmpClientProtocol] = None
+        self._request_ids = itertools.count(random.randrange(1, 2**24))
+        self.requests = 0
+
+    @classmethod
+    def from_parameters(
+        cls, snmp_parameters: SNMPReadParameters, **kwargs
+    ) -> AsyncSnmpClient:
+        return cls(
+            snmp_parameters.ip,
+            snmp_parameters.snmp_community,
+            port=int(snmp_parameters.port),
+            version=snmp_parameters.version,
+            **kwargs,
+        )
+
+    @property
+    def is_bulk_supported(self) -> bool:
+        return self._proto_module is not api.protoModules[api.protoVersion1]
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        _, self._protocol = await loop.create_datagram_endpoint(
+            lambda: _SnmpClientProtocol(self._proto_module),
+            remote_addr=self._address,
+        )
+
+    def stop(self) -> None:
+        if self._protocol and self._protocol.transport:
+            self._protocol.transport.close()
+        self._protocol = None
+
+    async def get(self, oids: Iterable[univ.ObjectIdentifier]) -> List[VarBind]:
+        """GET the instances, missing ones have noSuchInstance values.
+
+        SNMPv1 reports only the first missing instance of the request.
+        """
+        return await self._request(self._proto_module.GetRequestPDU(), oids)
+
+    async def get_next(self, oids: Iterable[univ.ObjectIdentifier]) -> List[VarBind]:
+        """GETNEXT of the OIDs, endOfMibView values past the last instance."""
+        return await self._request(self._proto_module.GetNextRequestPDU(), oids)
+
+    async def get_bulk(
+        self,
+        oids: Iterable[univ.ObjectIdentifier],
+        non_repeaters: int,
+        max_repetitions: int,
+    ) -> List[VarBind]:
+        if not self.is_bulk_supported:
+            raise ValueError("GETBULK isn't available with SNMP v1")
+        pdu = api.v2c.GetBulkRequestPDU()
+        api.v2c.apiBulkPDU.setDefaults(pdu)
+        api.v2c.apiBulkPDU.setNonRepeaters(pdu, non_repeaters)
+        api.v2c.apiBulkPDU.setMaxRepetitions(pdu, max_repetitions)
+        return await self._request(pdu, oids, set_defaults=False)
+
+    async def walk(self, oid: univ.ObjectIdentifier) -> List[VarBind]:
+        """Walk the subtree with GETBULK, with GETNEXT for SNMP v1."""
+        start_oid = univ.ObjectIdentifier(oid)
+        result = []
+        next_oid = start_oid
+        while True:
+            if self.is_bulk_supported:
+                var_binds = await self.get_bulk([next_oid], 0, self._max_repetitions)
+            else:
+                var_binds = await self.get_next([next_oid])
+            if not var_binds:
+                return result
+            for var_oid, value in var_binds:
+                if (
+                    not start_oid.isPrefixOf(var_oid)
+                    or value.tagSet in END_OF_WALK_TAGS
+                    # an agent returning OIDs out of order would loop forever
+                    or var_oid <= next_oid
+                ):
+                    return result
+                result.append((var_oid, value))
+                next_oid = var_oid
+
+    async def walk_many(
+        self, oids: Iterable[univ.ObjectIdentifier], max_concurrency: int = 1
+    ) -> List[List[VarBind]]:
+        """Walk the subtrees keeping up to max_concurrency walks in flight.
+
+        :return: var-binds of every subtree in the order of oids
+        """
+        return await self._walk_concurrently(self.walk, oids, max_concurrency)
+
+    async def walk_available(
+        self, oids: Iterable[univ.ObjectIdentifier], max_concurrency: int = 1
+    ) -> List[Optional[List[VarBind]]]:
+        """Same as walk_many but subtrees which failed get None.
+
+        A subtree fails if its walk timed out or the agent returned an error,
+        the var-binds read before are dropped as partial.
+        """
+
+        async def walk(oid):
+            try:
+                return await self.walk(oid)
+            except (RequestTimedOut, ReadSNMPException):
+                return None
+
+        return await self._walk_concurrently(walk, oids, max_concurrency)
+
+    @staticmethod
+    async def _walk_concurrently(walk, oids, max_concurrency: int) -> list:
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def limited_walk(oid):
+            async with semaphore:
+                return await walk(oid)
+
+        return list(await asyncio.gather(*map(limited_walk, oids)))
+
+    async def _request(
+        self, pdu, oids: Iterable[univ.ObjectIdentifier], set_defaults: bool = True
+    ) -> List[VarBind]:
+        proto_module = self._proto_module
+        if set_defaults:
+            proto_module.apiPDU.setDefaults(pdu)
+        proto_module.apiPDU.setVarBinds(
+            pdu, [(univ.ObjectIdentifier(oid), proto_module.Null("")) for oid in oids]
+        )
+        response = await self._send(pdu)
+
+        error_status = int(proto_module.apiPDU.getErrorStatus(response))
+        var_binds = proto_module.apiPDU.getVarBinds(response)
+        if error_status == NO_SUCH_NAME_ERROR_STATUS:
+            # SNMPv1 echoes the request, the error index points at the missing OID
+            error_index = int(proto_module.apiPDU.getErrorIndex(response))
+            if pdu.isSameTypeWith(proto_module.GetRequestPDU()):
+                return [
+                    (oid, rfc1905.noSuchInstance if index == error_index else value)
+                    for index, (oid, value) in enumerate(var_binds, 1)
+                ]
+            return [
+                (oid, rfc1905.endOfMibView if index == error_index else value)
+                for index, (oid, value) in enumerate(var_binds, 1)
+            ]
+        if error_status:
+            raise ReadSNMPException(
+                "Remote SNMP error {}".format(
+                    proto_module.apiPDU.getErrorStatus(response).prettyPrint()
+                )
+            )
+        return var_binds
+
+    async def _send(self, pdu):
+        if not self._protocol:
+            raise ReadSNMPException("SNMP client isn't started")
+        proto_module = self._proto_module
+        request_id = next(self._request_ids) % 2**31
+        proto_module.apiPDU.setRequestID(pdu, request_id)
+        message = proto_module.Message()
+        proto_module.apiMessage.setDefaults(message)
+        proto_module.apiMessage.setCommunity(message, self._community)
+        proto_module.apiMessage.setPDU(message, pdu)
+        data = encoder.encode(message)
+
+        loop = asyncio.get_running_loop()
+        for _ in range(self._retries + 1):
+            future = loop.create_future()
+            self._protocol.requests[request_id] = future
+            self._protocol.transport.sendto(data)
+            self.requests += 1
+            if self._walk_stats:
+                self._walk_stats.record_request(pdu, len(data))
+            try:
+                response, size = await asyncio.wait_for(future, self._timeout)
+            except asyncio.TimeoutError:
+                self._protocol.requests.pop(request_id, None)
+                continue
+            if self._walk_stats:
+                self._walk_stats.record_response(response, size)
+            return response
+        raise requestTimedOut
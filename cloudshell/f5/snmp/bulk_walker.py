@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+from pyasn1.codec.ber import encoder
+from pyasn1.type import univ
+from pysnmp.entity.rfc3413 import cmdgen
+from pysnmp.proto.errind import RequestTimedOut, requestTimedOut
+
+from cloudshell.snmp.core.domain.quali_mib_table import QualiMibTable
+from cloudshell.snmp.core.snmp_errors import ReadSNMPException
+from cloudshell.snmp.core.snmp_response_reader import SnmpResponseReader
+
+if TYPE_CHECKING:
+    from logging import Logger
+    from typing import Callable, Iterable, List
+
+    from cloudshell.snmp.core.domain.snmp_oid import SnmpMibOid
+    from cloudshell.snmp.core.domain.snmp_response import SnmpResponse
+    from cloudshell.snmp.core.snmp_service import SnmpService
+
+TOO_BIG_ERROR_STATUS = 1
+NO_SUCH_NAME_ERROR_STATUS = 2
+VAR_BIND_OVERHEAD = 4
+
+
+class BulkWalkStats(object):
+    def __init__(self, max_repetitions: int):
+        self.max_repetitions = max_repetitions
+        self.requests = 0
+        self.too_big = 0
+        self.timeouts = 0
+        self.var_binds = 0
+        self.bytes = 0
+        self.elapsed = 0.0
+
+    def __str__(self):
+        return (
+            f"max-repetitions {self.max_repetitions}, {self.requests} requests, "
+            f"{self.var_binds} var-binds, {self.bytes} bytes, "
+            f"{self.too_big} tooBig, {self.timeouts} timeouts, "
+            f"{self.elapsed:.2f}s"
+        )
+
+
+class AdaptiveBulkWalker(object):
+    """GETBULK walker which tunes max-repetitions while walking.
+
+    max-repetitions grows while full responses come back faster than
+    FAST_RESPONSE_TIME and are expected to fit into MAX_PDU_SIZE, it is halved
+    on tooBig errors and timeouts. The tuned value is kept between walks.
+    """
+
+    MIN_REPETITIONS = 5
+    MAX_REPETITIONS = 200
+    # keep var-binds of the response within a single unfragmented UDP datagram
+    MAX_PDU_SIZE = 1400
+    FAST_RESPONSE_TIME = 0.5
+    # var-binds of the GET request, instances are fetched in several requests
+    GET_VAR_BINDS = 20
+
+    def __init__(
+        self,
+        snmp_service: SnmpService,
+        logger: Logger,
+        max_repetitions: int = 25,
+        retry_count: int = 2,
+    ):
+        self._snmp = snmp_service
+        self._logger = logger
+        self._retry_count = retry_count
+        self._var_bind_size = None
+        self.stats = BulkWalkStats(max_repetitions)
+
+    @property
+    def max_repetitions(self) -> int:
+        return self.stats.max_repetitions
+
+    @property
+    def is_bulk_supported(self) -> bool:
+        # GETBULK isn't available with SNMP v1
+        return bool(self._snmp._get_bulk_flag)
+
+    def walk(self, snmp_oid_obj: SnmpMibOid) -> List[SnmpResponse]:
+        return self.walk_many([snmp_oid_obj])[0]
+
+    def walk_many(
+        self, snmp_oid_objs: Iterable[SnmpMibOid], max_concurrency: int = 1
+    ) -> List[List[SnmpResponse]]:
+        """Walk several subtrees keeping up to max_concurrency requests in flight.
+
+        :return: responses of every subtree in the order of snmp_oid_objs
+        """
+        if not self.is_bulk_supported:
+            return [self._snmp.walk(snmp_oid_obj) for snmp_oid_obj in snmp_oid_objs]
+
+        readers = self._run_readers(snmp_oid_objs, max_concurrency)
+        for reader in readers:
+            if reader.error is not None:
+                self._logger.error(str(reader.error))
+                raise reader.error
+        return [list(reader.result) for reader in readers]
+
+    def walk_available(
+        self, snmp_oid_objs: Iterable[SnmpMibOid], max_concurrency: int = 1
+    ) -> List[List[SnmpResponse] | None]:
+        """Same as walk_many but subtrees which failed get None.
+
+        A subtree fails if its walk ended on a timeout or a tooBig error once
+        the retries ran out, the responses read before are dropped as partial.
+        """
+        if not self.is_bulk_supported:
+            return [self._snmp.walk(snmp_oid_obj) for snmp_oid_obj in snmp_oid_objs]
+
+        return [
+            None if reader.error is not None else list(reader.result)
+            for reader in self._run_readers(snmp_oid_objs, max_concurrency)
+        ]
+
+    def get_many(self, oids: Iterable[univ.ObjectIdentifier]) -> List[SnmpResponse]:
+        """GET the instances, GET_VAR_BINDS of them per request.
+
+        The requests are sent at once, the OIDs aren't resolved with the MIB,
+        instances missing on the device are skipped.
+        """
+        snmp_engine = self._snmp._snmp_engine
+        oids = list(oids)
+        readers = []
+        for start in range(0, len(oids), self.GET_VAR_BINDS):
+            reader = SnmpResponseReader(
+                snmp_engine=snmp_engine,
+                logger=self._logger,
+                context_id=self._snmp._context_id,
+                context_name=self._snmp._context_name,
+                retry_count=self._retry_count,
+            )
+            cmdgen.GetCommandGenerator().sendVarBinds(
+                snmp_engine,
+                "tgt",
+                self._snmp._context_id,
+                self._snmp._context_name,
+                [(oid, None) for oid in oids[start : start + self.GET_VAR_BINDS]],
+                reader.cb_fun,
+                reader.cb_ctx,
+            )
+            readers.append(reader)
+        if readers:
+            self._snmp._start_dispatcher()
+        return [response for reader in readers for response in reader.result]
+
+    def _run_readers(
+        self, snmp_oid_objs: Iterable[SnmpMibOid], max_concurrency: int
+    ) -> List[_AdaptiveBulkReader]:
+        snmp_engine = self._snmp._snmp_engine
+        pending = deque()
+
+        def start_next():
+            if pending:
+                pending.popleft().start()
+
+        readers = []
+        for snmp_oid_obj in snmp_oid_objs:
+            start_oid = univ.ObjectIdentifier(snmp_oid_obj.get_oid(snmp_engine))
+            readers.append(_AdaptiveBulkReader(self, start_oid, on_done=start_next))
+        if not readers:
+            return readers
+        pending.extend(readers)
+
+        start_time = time.time()
+        for _ in range(max(1, max_concurrency)):
+            start_next()
+        self._snmp._start_dispatcher()
+        self.stats.elapsed += time.time() - start_time
+        return readers
+
+    def get_table(self, snmp_oid_obj: SnmpMibOid) -> QualiMibTable:
+        snmp_engine = self._snmp._snmp_engine
+        table_name = snmp_oid_obj.get_object_type(snmp_engine=snmp_engine)[
+            0
+        ].getMibSymbol()[1]
+        return QualiMibTable.create_from_list(table_name, self.walk(snmp_oid_obj))
+
+    def _on_response(self, response_time: float, var_bind_table) -> None:
+        self.stats.requests += 1
+        size = sum(
+            len(encoder.encode(oid)) + len(encoder.encode(value)) + VAR_BIND_OVERHEAD
+            for row in var_bind_table
+            for oid, value in row
+        )
+        self.stats.var_binds += len(var_bind_table)
+        self.stats.bytes += size
+        if not var_bind_table:
+            return
+
+        var_bind_size = size / len(var_bind_table)
+        if self._var_bind_size is None:
+            self._var_bind_size = var_bind_size
+        else:
+            self._var_bind_size = (self._var_bind_size + var_bind_size) / 2
+        size_limit = max(
+            self.MIN_REPETITIONS, int(self.MAX_PDU_SIZE // self._var_bind_size)
+        )
+
+        max_repetitions = self.stats.max_repetitions
+        if (
+            response_time < self.FAST_RESPONSE_TIME
+            and len(var_bind_table) >= max_repetitions
+        ):
+            max_repetitions *= 2
+        self._set_max_repetitions(min(max_repetitions, size_limit))
+
+    def _on_error(self, is_timeout: bool) -> None:
+        self.stats.requests += 1
+        if is_timeout:
+            self.stats.timeouts += 1
+        else:
+            self.stats.too_big += 1
+        self._set_max_repetitions(self.stats.max_repetitions // 2)
+
+    def _set_max_repetitions(self, max_repetitions: int) -> None:
+        max_repetitions = max(
+            self.MIN_REPETITIONS, min(self.MAX_REPETITIONS, max_repetitions)
+        )
+        if max_repetitions != self.stats.max_repetitions:
+            self._logger.debug(f"GETBULK max-repetitions set to {max_repetitions}")
+            self.stats.max_repetitions = max_repetitions
+
+
+class _AdaptiveBulkReader(SnmpResponseReader):
+    """Sends the next GETBULK request only after the previous one is processed."""
+
+    def __init__(
+        self,
+        walker: AdaptiveBulkWalker,
+        start_oid: univ.ObjectIdentifier,
+        on_done: Callable[[], None] = None,
+    ):
+        snmp_service = walker._snmp
+        super(_AdaptiveBulkReader, self).__init__(
+            snmp_engine=snmp_service._snmp_engine,
+            logger=walker._logger,
+            context_id=snmp_service._context_id,
+            context_name=snmp_service._context_name,
+            get_bulk_flag=True,
+            retry_count=walker._retry_count,
+        )
+        self._walker = walker
+        self._start_oid = start_oid
+        self._stop_oid = start_oid[:-1] + (start_oid[-1] + 1,)
+        self._on_done = on_done
+        self._last_oid = None
+        self._request_time = None
+        # error the walk ended on, the result is partial if set
+        self.error: Exception | None = None
+
+    def start(self) -> None:
+        self.send(self._start_oid)
+
+    def _done(self) -> None:
+        if self._on_done:
+            self._on_done()
+
+    def send(self, oid: univ.ObjectIdentifier) -> None:
+        self._last_oid = oid
+        self._request_time = time.time()
+        cmdgen.BulkCommandGenerator().sendVarBinds(
+            self._snmp_engine,
+            "tgt",
+            self._context_id,
+            self._context_name,
+            0,
+            self._walker.max_repetitions,
+            [(oid, None)],
+            self.cb_walk_fun,
+            self.cb_ctx,
+        )
+
+    def cb_walk_fun(
+        self,
+        snmp_engine,
+        send_request_handle,
+        error_indication,
+        error_status,
+        error_index,
+        var_bind_table,
+        cb_ctx,
+    ):
+        response_time = time.time() - self._request_time
+        is_timeout = isinstance(error_indication, RequestTimedOut)
+        if is_timeout or error_status == TOO_BIG_ERROR_STATUS:
+            self._walker._on_error(is_timeout)
+            if self.cb_ctx["retries"]:
+                self.cb_ctx["retries"] -= 1
+                self._logger.debug(
+                    f"Retrying GETBULK from {self._last_oid} "
+                    f"({self.cb_ctx['retries']} retries left)"
+                )
+                self.send(self._last_oid)
+            else:
+                self.cb_ctx["is_snmp_timeout"] = is_timeout
+                self.error = (
+                    requestTimedOut
+                    if is_timeout
+                    else ReadSNMPException("Remote SNMP error tooBig")
+                )
+                self._done()
+            return False
+        if error_indication or (
+            error_status and error_status != NO_SUCH_NAME_ERROR_STATUS
+        ):
+            message = "Remote SNMP error {}".format(
+                error_indication or error_status.prettyPrint()
+            )
+            self._logger.error(message)
+            raise ReadSNMPException(message)
+
+        self.cb_ctx["retries"] = self._retry_count
+        self._walker._on_response(response_time, var_bind_table)
+        stop_flag = self._parse_var_binds(var_bind_table=var_bind_table)
+        if not stop_flag and var_bind_table:
+            self.send(var_bind_table[-1][-1][0])
+        else:
+            self._done()
+        return False
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, Sequence, Tuple, Union
+
+    Index = Tuple[int, ...]
+
+# parts of the table indexes: length prefixed strings and octets, integers
+STRING = "s"
+INTEGER = "i"
+
+
+def split_index(index: Sequence[int], layout: Sequence[str]) -> tuple:
+    """Split the instance index into the parts of the layout.
+
+    Strings are returned as bytes, they are names or InetAddress octets.
+    Raises IndexError if the index doesn't match the layout.
+    """
+    parts = []
+    position = 0
+    for part in layout:
+        if part == STRING:
+            end = position + 1 + index[position]
+            if end > len(index):
+                raise IndexError(f"Index {index} ends inside the string")
+            try:
+                parts.append(bytes(index[position + 1 : end]))
+            except ValueError:
+                raise IndexError(f"Index {index} has a string octet above 255")
+            position = end
+        else:
+            parts.append(index[position])
+            position += 1
+    if position != len(index):
+        raise IndexError(f"Index {index} is longer than its layout")
+    return tuple(parts)
+
+
+def join_index(parts: Sequence[Union[str, bytes, int]], layout: Sequence[str]) -> Index:
+    """Join the parts of the layout into the instance index, see split_index.
+
+    Strings are encoded with UTF-8 unless they are bytes already.
+    Raises ValueError if the number of the parts doesn't match the layout.
+    """
+    if len(parts) != len(layout):
+        raise ValueError(f"{len(parts)} parts don't match the layout {layout}")
+    index = []
+    for part, value in zip(layout, parts):
+        if part == STRING:
+            if isinstance(value, str):
+                value = value.encode()
+            index.append(len(value))
+            index.extend(value)
+        else:
+            index.append(int(value))
+    return tuple(index)
+
+
+class IndexCodec(object):
+    """Splits and joins the instance indexes of the tables of the layout.
+
+    The F5 tables are mostly indexed by the length prefixed names, split
+    indexes are kept in the LRU cache, so the rows seen on every poll are
+    split once. Joined indexes make the instance OIDs for GET of the rows.
+    """
+
+    CACHE_SIZE = 2**16
+
+    def __init__(self, layout: Sequence[str], cache_size: int = CACHE_SIZE):
+        self.layout = tuple(layout)
+        self._split = lru_cache(maxsize=cache_size)(self._split_index)
+        self._join = lru_cache(maxsize=cache_size)(self._join_index)
+
+    def split(self, index: Sequence[int]) -> tuple:
+        """Split the index, raises IndexError if it doesn't match the layout."""
+        return self._split(tuple(index))
+
+    def join(self, parts: Sequence[Union[str, bytes, int]]) -> Index:
+        return self._join(tuple(parts))
+
+    def _split_index(self, index: Index) -> tuple:
+        return split_index(index, self.layout)
+
+    def _join_index(self, parts: tuple) -> Index:
+        return join_index(parts, self.layout)
+
+    def cache_info(self) -> str:
+        return f"split {self._split.cache_info()}, join {self._join.cache_info()}"
+
+
+_codecs: Dict[Tuple[str, ...], IndexCodec] = {}
+
+
+def get_index_codec(layout: Sequence[str]) -> IndexCodec:
+    """Get the codec of the layout shared by all the tables with the layout."""
+    layout = tuple(layout)
+    codec = _codecs.get(layout)
+    if codec is None:
+        codec = _codecs[layout] = IndexCodec(layout)
+    return codec
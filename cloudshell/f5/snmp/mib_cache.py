@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import marshal
+import os
+import stat
+import tempfile
+from importlib.util import MAGIC_NUMBER
+from typing import TYPE_CHECKING
+
+from pysnmp.smi.builder import DirMibSource
+
+if TYPE_CHECKING:
+    from typing import List, Optional
+
+    from pysnmp.smi.builder import MibBuilder
+
+    from cloudshell.snmp.core.snmp_service import SnmpService
+
+MIBS_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mibs")
+MIB_CACHE_DIR_ENV = "CLOUDSHELL_F5_MIB_CACHE_DIR"
+CACHE_DIR_MODE = 0o700
+PACKAGE_NAME = "cloudshell-f5"
+
+
+def get_package_version() -> str:
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:  # python 3.7
+        return "unknown"
+    try:
+        return version(PACKAGE_NAME)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Write the file so concurrent readers never see it partially written."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def get_user_cache_dir() -> str:
+    """Get the cache folder of the current user."""
+    if os.name == "nt":
+        cache_dir = os.environ.get("LOCALAPPDATA")
+    else:
+        cache_dir = os.environ.get("XDG_CACHE_HOME")
+    return cache_dir or os.path.join(os.path.expanduser("~"), ".cache")
+
+
+def is_private_dir(path: str) -> bool:
+    """Check the folder is owned by the current user and writable only by them.
+
+    Always true on Windows, user folders are protected by ACLs there.
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    try:
+        path_stat = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(path_stat.st_mode)
+        and path_stat.st_uid == os.getuid()
+        and not path_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    )
+
+
+def get_mib_builder(snmp_service: SnmpService) -> MibBuilder:
+    """Get pysnmp MIB builder used by the snmp service."""
+    return snmp_service._snmp_engine.msgAndPduDsp.mibInstrumController.mibBuilder
+
+
+class CachedMibSource(DirMibSource):
+    """MIB source which executes precompiled code objects from the MIB cache.
+
+    Falls back to the plain MIB folder for modules missing in the cache.
+    """
+
+    def __init__(self, mib_cache: F5MibCache):
+        super(CachedMibSource, self).__init__(mib_cache.mibs_folder)
+        self._mib_cache = mib_cache
+
+    def read(self, f):
+        code_obj = self._mib_cache.get_code(f)
+        if code_obj is None:
+            return super(CachedMibSource, self).read(f)
+        return code_obj, ".py"
+
+
+class F5MibCache(object):
+    """Precompiled MIB cache.
+
+    Shipped MIB modules are compiled once per package version and stored on disk,
+    so warm starts only unmarshal code of the modules which are actually resolved.
+    The cache folder is created private to the user in the user cache folder, the
+    cache is skipped if the folder is owned or writable by someone else.
+    """
+
+    INDEX_FILE = "index.json"
+    CODE_FILE_EXT = ".mibc"
+
+    def __init__(self, mibs_folder: str = MIBS_FOLDER, cache_root: str = None):
+        self.mibs_folder = os.path.normpath(os.path.abspath(mibs_folder))
+        self._cache_root = cache_root
+        self._cache_dir = None
+        self._is_private = None
+        self._index = None
+
+    @property
+    def cache_root(self) -> str:
+        return (
+            self._cache_root
+            or os.environ.get(MIB_CACHE_DIR_ENV)
+            or os.path.join(get_user_cache_dir(), "cloudshell-f5-mib-cache")
+        )
+
+    @property
+    def cache_dir(self) -> str:
+        if self._cache_dir is None:
+            version = get_package_version()
+            key = hashlib.sha1(
+                f"{self.mibs_folder}|{version}|{MAGIC_NUMBER.hex()}".encode()
+            )
+            if version == "unknown":
+                # not installed, rely on the state of the sources instead
+                for file_name in sorted(os.listdir(self.mibs_folder)):
+                    file_stat = os.stat(os.path.join(self.mibs_folder, file_name))
+                    key.update(
+                        f"{file_name}|{file_stat.st_size}|{file_stat.st_mtime}".encode()
+                    )
+            self._cache_dir = os.path.join(
+                self.cache_root, f"{version}-{key.hexdigest()[:16]}"
+            )
+        return self._cache_dir
+
+    @property
+    def is_private(self) -> bool:
+        """Check the cache folder can be trusted, creating it if needed."""
+        if self._is_private is None:
+            try:
+                os.makedirs(self.cache_root, mode=CACHE_DIR_MODE, exist_ok=True)
+                os.makedirs(self.cache_dir, mode=CACHE_DIR_MODE, exist_ok=True)
+            except OSError:
+                self._is_private = False
+            else:
+                self._is_private = is_private_dir(self.cache_root) and is_private_dir(
+                    self.cache_dir
+                )
+        return self._is_private
+
+    @property
+    def index(self) -> dict:
+        if self._index is None:
+            if not self.is_private:
+                # modules are read from the MIB folder
+                self._index = {"modules": []}
+            else:
+                self._index = self._load_index()
+                if self._index is None:
+                    self._index = self.build()
+        return self._index
+
+    @property
+    def modules(self) -> List[str]:
+        return list(self.index["modules"])
+
+    def build(self) -> dict:
+        """Compile all MIB modules of the folder and store them in the cache."""
+        os.makedirs(self.cache_dir, mode=CACHE_DIR_MODE, exist_ok=True)
+        index = {"modules": []}
+        for file_name in sorted(os.listdir(self.mibs_folder)):
+            mib_name, ext = os.path.splitext(file_name)
+            if ext != ".py" or mib_name.startswith("__"):
+                continue
+            path = os.path.join(self.mibs_folder, file_name)
+            with open(path) as source_file:
+                source = source_file.read()
+            code_obj = compile(source, path, "exec")
+            write_atomic(
+                os.path.join(self.cache_dir, mib_name + self.CODE_FILE_EXT),
+                marshal.dumps(code_obj),
+            )
+            index["modules"].append(mib_name)
+        write_atomic(
+            os.path.join(self.cache_dir, self.INDEX_FILE),
+            json.dumps(index).encode(),
+        )
+        self._index = index
+        return index
+
+    def get_code(self, mib_name: str):
+        if mib_name not in self.index["modules"]:
+            return
+        try:
+            with open(
+                os.path.join(self.cache_dir, mib_name + self.CODE_FILE_EXT), "rb"
+            ) as code_file:
+                return marshal.loads(code_file.read())
+        except (OSError, ValueError, EOFError, TypeError):
+            return
+
+    def get_mib_source(self) -> CachedMibSource:
+        return CachedMibSource(self)
+
+    def attach(self, mib_builder: MibBuilder) -> None:
+        """Add cached MIB source in front of the MIB builder sources."""
+        for source in mib_builder.getMibSources():
+            if (
+                isinstance(source, CachedMibSource)
+                and source.fullPath() == self.mibs_folder
+            ):
+                return
+        mib_builder.setMibSources(self.get_mib_source(), *mib_builder.getMibSources())
+
+    def _load_index(self) -> Optional[dict]:
+        try:
+            with open(os.path.join(self.cache_dir, self.INDEX_FILE)) as index_file:
+                return json.load(index_file)
+        except (OSError, ValueError):
+            return
@@ -0,0 +1,282 @@
+"""Build-time generator of the trimmed "autoload" MIB profile.
+
+Usage: python -m cloudshell.f5.snmp.mib_profile [--output <folder>]
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import os
+import shutil
+from collections import OrderedDict
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from cloudshell.f5.snmp.mib_cache import MIBS_FOLDER
+
+if TYPE_CHECKING:
+    from typing import Dict, Iterable, List, Set, Tuple
+
+AUTOLOAD_MIBS_FOLDER = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "mibs_autoload"
+)
+
+VENDOR_MIB_PREFIX = "F5-"
+# MIB objects resolved by F5FirewallGenericSNMPAutoload and its port engines,
+# every symbol brings its whole OID subtree into the profile
+AUTOLOAD_PROFILE = OrderedDict(
+    [
+        (
+            "F5-BIGIP-SYSTEM-MIB",
+            [
+                "sysDeviceModelOIDs",
+                "sysInterfaceNumber",
+                "sysInterfaceTable",
+                "sysIfxStatTable",
+                "sysTrunkTable",
+                "sysTrunkCfgMemberTable",
+                "sysClusterTable",
+                "sysClusterMbrTable",
+                "sysMultiHostTable",
+                "sysMultiHostCpuTable",
+                "sysSwStatusTable",
+            ],
+        ),
+    ]
+)
+
+
+class MibProfile(Enum):
+    FULL = "full"
+    AUTOLOAD = "autoload"
+
+
+MIB_PROFILE_FOLDERS = {
+    MibProfile.FULL: MIBS_FOLDER,
+    MibProfile.AUTOLOAD: AUTOLOAD_MIBS_FOLDER,
+}
+
+
+class _MibModuleSource(object):
+    """Top level statements of the pysmi generated MIB module."""
+
+    def __init__(self, mib_name: str, source: str):
+        self.mib_name = mib_name
+        self._lines = source.splitlines(keepends=True)
+        self.imports: Dict[str, List[str]] = OrderedDict()
+        self.statements: List[Tuple[Set[str], Set[str], str]] = []
+        self.oids: Dict[str, Tuple[int, ...]] = {}
+        self._parse(source)
+
+    def _parse(self, source: str):
+        body = ast.parse(source).body
+        line_numbers = [node.lineno for node in body] + [len(self._lines) + 1]
+        for node, start, end in zip(body, line_numbers, line_numbers[1:]):
+            text = "".join(self._lines[start - 1 : end - 1]).rstrip() + "\n"
+            imported = self._get_imported(node)
+            if imported:
+                self.imports.setdefault(imported[0], []).extend(imported[1])
+                continue
+            if self._is_export(node):
+                continue
+            defined = self._get_defined(node)
+            self.statements.append((defined, self._get_required(node), text))
+
+    @staticmethod
+    def _get_imported(node) -> Tuple[str, List[str]] | None:
+        if (
+            isinstance(node, ast.Assign)
+            and isinstance(node.value, ast.Call)
+            and isinstance(node.value.func, ast.Attribute)
+            and node.value.func.attr == "importSymbols"
+        ):
+            mib_name, *names = (ast.literal_eval(arg) for arg in node.value.args)
+            return mib_name, names
+
+    @staticmethod
+    def _is_export(node) -> bool:
+        return (
+            isinstance(node, ast.Expr)
+            and isinstance(node.value, ast.Call)
+            and isinstance(node.value.func, ast.Attribute)
+            and node.value.func.attr == "exportSymbols"
+        )
+
+    def _get_defined(self, node) -> Set[str]:
+        if isinstance(node, ast.ClassDef):
+            return {node.name}
+        if (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+        ):
+            name = node.targets[0].id
+            call = node.value
+            while isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute):
+                call = call.func.value
+            if (
+                isinstance(call, ast.Call)
+                and call.args
+                and isinstance(call.args[0], ast.Tuple)
+            ):
+                try:
+                    self.oids[name] = tuple(ast.literal_eval(call.args[0]))
+                except ValueError:
+                    pass
+            return {name}
+        return set()
+
+    def _get_required(self, node) -> Set[str]:
+        """Names and same module index columns the statement depends on."""
+        required = set()
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name):
+                required.add(child.id)
+            elif isinstance(child, ast.Tuple) and len(child.elts) == 3:
+                # index columns are referenced by name in setIndexNames calls
+                try:
+                    _, mib_name, index_name = ast.literal_eval(child)
+                except ValueError:
+                    continue
+                if mib_name == self.mib_name:
+                    required.add(index_name)
+        required.discard("mibBuilder")
+        return required
+
+    def render(self, kept: Set[str]) -> str:
+        lines = [
+            "#\n",
+            f"# Trimmed {self.mib_name} for the autoload MIB profile\n",
+            "# Generated by cloudshell.f5.snmp.mib_profile, do not edit\n",
+            "#\n",
+        ]
+        statements = []
+        exported = []
+        used = set()
+        for defined, required, text in self.statements:
+            if defined:
+                if not defined & kept:
+                    continue
+                exported.extend(sorted(defined))
+            elif not required & kept or (required & self.local_names) - kept:
+                continue
+            statements.append(text)
+            used |= required
+        for mib_name, names in self.imports.items():
+            names = [name for name in names if name in used]
+            if names:
+                targets = ", ".join(names)
+                if len(names) == 1:
+                    targets = f"({targets},)"
+                args = ", ".join(f'"{x}"' for x in [mib_name] + names)
+                lines.append(f"{targets} = mibBuilder.importSymbols({args})\n")
+        lines.extend(statements)
+        exported = ", ".join(f"{name}={name}" for name in exported)
+        lines.append(f'mibBuilder.exportSymbols("{self.mib_name}", {exported})\n')
+        return "".join(lines)
+
+    @property
+    def local_names(self) -> Set[str]:
+        names = set()
+        for defined, _, _ in self.statements:
+            names |= defined
+        return names
+
+
+class MibProfileGenerator(object):
+    """Emit the minimal subset of the shipped MIBs needed by the profile."""
+
+    def __init__(self, mibs_folder: str = MIBS_FOLDER):
+        self._mibs_folder = mibs_folder
+        self._modules: Dict[str, _MibModuleSource] = {}
+
+    def _get_module(self, mib_name: str) -> _MibModuleSource | None:
+        if mib_name not in self._modules:
+            path = os.path.join(self._mibs_folder, mib_name + ".py")
+            if not os.path.exists(path):
+                return
+            with open(path) as source_file:
+                self._modules[mib_name] = _MibModuleSource(mib_name, source_file.read())
+        return self._modules[mib_name]
+
+    def resolve(self, profile: Dict[str, Iterable[str]]) -> Dict[str, Set[str]]:
+        """Get names which have to be kept in every module."""
+        kept: Dict[str, Set[str]] = {}
+        pending = []
+        self._load_imported(profile)
+        for mib_name, roots in profile.items():
+            module = self._get_module(mib_name)
+            roots = [module.oids[root] for root in roots]
+            for name, oid in module.oids.items():
+                if any(oid[: len(root)] == root for root in roots):
+                    pending.append((mib_name, name))
+        while pending:
+            mib_name, name = pending.pop()
+            if name in kept.setdefault(mib_name, set()):
+                continue
+            kept[mib_name].add(name)
+            module = self._get_module(mib_name)
+            if module is None:
+                continue
+            pending.extend(self._get_dependencies(module, name))
+        return kept
+
+    def _load_imported(self, mib_names: Iterable[str]):
+        """Load shipped modules the profile modules import from."""
+        for mib_name in mib_names:
+            module = self._get_module(mib_name)
+            if module is not None:
+                self._load_imported(set(module.imports) - set(self._modules))
+
+    def _get_dependencies(self, module: _MibModuleSource, name: str):
+        oid = module.oids.get(name)
+        if oid:
+            # parent nodes of the subtree, including ones of other F5 MIBs
+            for mib_name in list(self._modules):
+                parent_module = self._modules[mib_name]
+                for parent, parent_oid in parent_module.oids.items():
+                    if len(parent_oid) < len(oid) and oid[: len(parent_oid)] == (
+                        parent_oid
+                    ):
+                        yield mib_name, parent
+        for defined, required, _ in module.statements:
+            if name in defined:
+                for required_name in required - defined:
+                    yield self._get_owner(module, required_name), required_name
+
+    @staticmethod
+    def _get_owner(module: _MibModuleSource, name: str) -> str:
+        for mib_name, names in module.imports.items():
+            if name in names:
+                return mib_name
+        return module.mib_name
+
+    def generate(
+        self, output_folder: str = AUTOLOAD_MIBS_FOLDER, profile=AUTOLOAD_PROFILE
+    ) -> List[str]:
+        """Write trimmed MIB modules to the output folder.
+
+        Only the F5 modules are trimmed, the standard modules they import are
+        copied whole, other MIBs loaded by the autoload import from them too.
+        """
+        kept = self.resolve(profile)
+        os.makedirs(output_folder, exist_ok=True)
+        written = []
+        for mib_name in sorted(kept):
+            module = self._get_module(mib_name)
+            if module is None:
+                continue
+            path = os.path.join(output_folder, mib_name + ".py")
+            if mib_name.startswith(VENDOR_MIB_PREFIX):
+                with open(path, "w") as mib_file:
+                    mib_file.write(module.render(kept[mib_name]))
+            else:
+                shutil.copyfile(os.path.join(self._mibs_folder, mib_name + ".py"), path)
+            written.append(path)
+        return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", default=AUTOLOAD_MIBS_FOLDER)
+    MibProfileGenerator().generate(parser.parse_args().output)
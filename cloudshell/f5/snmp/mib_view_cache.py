@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from pysnmp.smi.builder import MibBuilder
+from pysnmp.smi.view import MibViewController
+
+from cloudshell.f5.snmp.mib_cache import get_mib_builder
+
+if TYPE_CHECKING:
+    from typing import Dict, Tuple
+
+    from cloudshell.snmp.core.snmp_service import SnmpService
+
+# modules loaded by the SNMP engine before the MIB folders are registered
+ENGINE_MIBS = (
+    "SNMPv2-SMI",
+    "SNMPv2-CONF",
+    "SNMPv2-TC",
+    "SNMPv2-MIB",
+    "SNMP-MPD-MIB",
+    "SNMP-FRAMEWORK-MIB",
+    "SNMP-TARGET-MIB",
+    "SNMP-COMMUNITY-MIB",
+    "SNMP-USER-BASED-SM-MIB",
+)
+
+
+class _LockedMibBuilder(MibBuilder):
+    """MIB builder which loads modules under the lock."""
+
+    def __init__(self, lock: threading.RLock):
+        self.lock = lock
+        super(_LockedMibBuilder, self).__init__()
+
+    def loadModules(self, *modNames, **userCtx):  # noqa: N802, N803
+        with self.lock:
+            return super(_LockedMibBuilder, self).loadModules(*modNames, **userCtx)
+
+    def unloadModules(self, *modNames):  # noqa: N802, N803
+        with self.lock:
+            return super(_LockedMibBuilder, self).unloadModules(*modNames)
+
+
+class _LockedMibViewController(MibViewController):
+    """MIB view controller which rebuilds its index under the builder lock."""
+
+    def indexMib(self):  # noqa: N802
+        if self.lastBuildId == self.mibBuilder.lastBuildId:
+            return
+        with self.mibBuilder.lock:
+            return super(_LockedMibViewController, self).indexMib()
+
+
+class MibViewCache(object):
+    """Process wide cache of MIB view controllers.
+
+    Every SNMP service creates its own SNMP engine with an empty MIB builder, so
+    MIB modules are loaded and indexed again on each autoload. The cache keeps one
+    MIB builder and view controller per set of MIB sources and makes the SNMP
+    engine of the service translate OIDs with it. Engine's own MIB builder is
+    left untouched as it holds engine specific managed objects.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._view_controllers: Dict[Tuple[str, ...], MibViewController] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_view_controller(self, mib_builder: MibBuilder) -> MibViewController:
+        """Get shared view controller with the same MIB sources as the builder."""
+        mib_sources = mib_builder.getMibSources()
+        key = tuple(source.fullPath() for source in mib_sources)
+        with self._lock:
+            view_controller = self._view_controllers.get(key)
+            if view_controller is not None:
+                self.hits += 1
+                return view_controller
+            self.misses += 1
+            shared_builder = _LockedMibBuilder(threading.RLock())
+            shared_builder.loadModules(*ENGINE_MIBS)
+            shared_builder.setMibSources(*mib_sources)
+            view_controller = _LockedMibViewController(shared_builder)
+            self._view_controllers[key] = view_controller
+            return view_controller
+
+    def attach(self, snmp_service: SnmpService) -> MibViewController:
+        """Make the SNMP service translate OIDs with the shared view controller.
+
+        Call it after all MIB folders are added to the service. Modules loaded
+        into the service MIB builder afterwards aren't used for translation,
+        load them with the builder of the returned view controller.
+        """
+        view_controller = self.get_view_controller(get_mib_builder(snmp_service))
+        snmp_service._snmp_engine.setUserContext(mibViewController=view_controller)
+        return view_controller
+
+    def clear(self) -> None:
+        with self._lock:
+            self._view_controllers.clear()
+            self.hits = self.misses = 0
+
+
+MIB_VIEW_CACHE = MibViewCache()
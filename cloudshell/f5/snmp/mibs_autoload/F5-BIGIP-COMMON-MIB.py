@@ -0,0 +1,19 @@
+#
+# Trimmed F5-BIGIP-COMMON-MIB for the autoload MIB profile
+# Generated by cloudshell.f5.snmp.mib_profile, do not edit
+#
+(OctetString,) = mibBuilder.importSymbols("ASN1", "OctetString")
+(ValueSizeConstraint,) = mibBuilder.importSymbols("ASN1-REFINEMENT", "ValueSizeConstraint")
+MibIdentifier, ModuleIdentity = mibBuilder.importSymbols("SNMPv2-SMI", "MibIdentifier", "ModuleIdentity")
+(TextualConvention,) = mibBuilder.importSymbols("SNMPv2-TC", "TextualConvention")
+f5 = ModuleIdentity((1, 3, 6, 1, 4, 1, 3375))
+if mibBuilder.loadTexts:
+    f5.setLastUpdated("200909141710Z")
+if mibBuilder.loadTexts:
+    f5.setOrganization("F5 Networks, Inc.")
+bigipTrafficMgmt = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2))
+class LongDisplayString(TextualConvention, OctetString):
+    status = "current"
+    displayHint = "1024a"
+    subtypeSpec = OctetString.subtypeSpec + ValueSizeConstraint(0, 1024)
+mibBuilder.exportSymbols("F5-BIGIP-COMMON-MIB", f5=f5, bigipTrafficMgmt=bigipTrafficMgmt, LongDisplayString=LongDisplayString)
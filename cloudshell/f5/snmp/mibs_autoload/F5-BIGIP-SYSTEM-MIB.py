@@ -0,0 +1,1016 @@
+#
+# Trimmed F5-BIGIP-SYSTEM-MIB for the autoload MIB profile
+# Generated by cloudshell.f5.snmp.mib_profile, do not edit
+#
+(NamedValues,) = mibBuilder.importSymbols("ASN1-ENUMERATION", "NamedValues")
+SingleValueConstraint, ValueRangeConstraint = mibBuilder.importSymbols("ASN1-REFINEMENT", "SingleValueConstraint", "ValueRangeConstraint")
+(LongDisplayString,) = mibBuilder.importSymbols("F5-BIGIP-COMMON-MIB", "LongDisplayString")
+InetAddress, InetAddressType = mibBuilder.importSymbols("INET-ADDRESS-MIB", "InetAddress", "InetAddressType")
+Integer32, MibScalar, MibTable, MibTableRow, MibTableColumn, MibIdentifier, Counter64, ModuleIdentity, Gauge32 = mibBuilder.importSymbols("SNMPv2-SMI", "Integer32", "MibScalar", "MibTable", "MibTableRow", "MibTableColumn", "MibIdentifier", "Counter64", "ModuleIdentity", "Gauge32")
+(MacAddress,) = mibBuilder.importSymbols("SNMPv2-TC", "MacAddress")
+bigipSystem = ModuleIdentity((1, 3, 6, 1, 4, 1, 3375, 2, 1))
+if mibBuilder.loadTexts:
+    bigipSystem.setLastUpdated("201002172155Z")
+if mibBuilder.loadTexts:
+    bigipSystem.setOrganization("F5 Networks, Inc.")
+sysNetwork = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 2))
+sysPlatform = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3))
+sysHostInfoStat = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 7))
+sysSoftware = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 9))
+sysClusters = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 10))
+sysInterfaces = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4))
+sysTrunks = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12))
+sysDeviceModelOIDs = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4))
+sysInterface = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1))
+sysIfxStat = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5))
+sysTrunk = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12, 1))
+sysTrunkCfgMember = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12, 3))
+sysMultiHost = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 4))
+sysMultiHostCpu = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5))
+sysSoftwareStatus = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 9, 4))
+sysCluster = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1))
+sysClusterMbr = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 2))
+bigip520 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 1))
+bigip540 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 2))
+bigip1000 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 3))
+bigip1500 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 4))
+bigip2400 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 5))
+bigip3400 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 6))
+bigip4100 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 7))
+bigip5100 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 8))
+bigip5110 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 9))
+bigip6400 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 10))
+bigip6800 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 11))
+bigip8400 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 12))
+bigip8800 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 13))
+em3000 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 14))
+wj300 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 15))
+wj400 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 16))
+wj500 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 17))
+wj800 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 18))
+bigipPb200 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 19))
+bigip1600 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 20))
+bigip3600 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 21))
+bigip6900 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 22))
+bigip8900 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 23))
+bigip3900 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 24))
+bigip8950 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 25))
+em4000 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 26))
+bigip11050 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 27))
+em500 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 28))
+arx1000 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 29))
+arx2000 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 30))
+arx4000 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 31))
+arx500 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 32))
+bigip3410 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 33))
+bigipPb100 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 34))
+bigipPb100n = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 35))
+sam4300 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 36))
+firepass1200 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 37))
+firepass4100 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 38))
+firepass4300 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 39))
+swanWJ200 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 40))
+TrafficShield4100 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 41))
+wa4500 = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 42))
+bigipVirtualEdition = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 43))
+unknown = MibIdentifier((1, 3, 6, 1, 4, 1, 3375, 2, 1, 3, 4, 1000))
+sysInterfaceNumber = MibScalar(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 1), Integer32()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfaceNumber.setStatus("current")
+sysInterfaceTable = MibTable(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2),
+)
+if mibBuilder.loadTexts:
+    sysInterfaceTable.setStatus("current")
+sysInterfaceEntry = MibTableRow(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1),
+).setIndexNames((0, "F5-BIGIP-SYSTEM-MIB", "sysInterfaceName"))
+if mibBuilder.loadTexts:
+    sysInterfaceEntry.setStatus("current")
+sysInterfaceName = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 1), LongDisplayString()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfaceName.setStatus("current")
+sysInterfaceMediaMaxSpeed = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 2), Integer32()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfaceMediaMaxSpeed.setStatus("current")
+sysInterfaceMediaMaxDuplex = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 3),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1, 2))
+    .clone(namedValues=NamedValues(("none", 0), ("half", 1), ("full", 2))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfaceMediaMaxDuplex.setStatus("current")
+sysInterfaceMediaActiveSpeed = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 4), Integer32()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfaceMediaActiveSpeed.setStatus("current")
+sysInterfaceMediaActiveDuplex = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 5),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1, 2))
+    .clone(namedValues=NamedValues(("none", 0), ("half", 1), ("full", 2))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfaceMediaActiveDuplex.setStatus("current")
+sysInterfaceMacAddr = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 6), MacAddress()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfaceMacAddr.setStatus("current")
+sysInterfaceMtu = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 7), Integer32()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfaceMtu.setStatus("current")
+sysInterfaceEnabled = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 8),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1))
+    .clone(namedValues=NamedValues(("false", 0), ("true", 1))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfaceEnabled.setStatus("current")
+sysInterfaceLearnMode = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 9),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1, 2))
+    .clone(
+        namedValues=NamedValues(
+            ("learnforward", 0), ("nolearnforward", 1), ("nolearndrop", 2)
+        )
+    ),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfaceLearnMode.setStatus("current")
+sysInterfaceFlowCtrlReq = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 10),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1, 2, 3))
+    .clone(namedValues=NamedValues(("none", 0), ("txrx", 1), ("tx", 2), ("rx", 3))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfaceFlowCtrlReq.setStatus("current")
+sysInterfaceStpLink = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 11),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1, 2))
+    .clone(namedValues=NamedValues(("linkp2p", 0), ("linkshared", 1), ("linkauto", 2))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfaceStpLink.setStatus("current")
+sysInterfaceStpEdge = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 12),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1))
+    .clone(namedValues=NamedValues(("false", 0), ("true", 1))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfaceStpEdge.setStatus("current")
+sysInterfaceStpEdgeActive = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 13),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1))
+    .clone(namedValues=NamedValues(("false", 0), ("true", 1))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfaceStpEdgeActive.setStatus("current")
+sysInterfaceStpAuto = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 14),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1))
+    .clone(namedValues=NamedValues(("false", 0), ("true", 1))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfaceStpAuto.setStatus("current")
+sysInterfaceStpEnable = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 15),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1))
+    .clone(namedValues=NamedValues(("false", 0), ("true", 1))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfaceStpEnable.setStatus("current")
+sysInterfaceStpReset = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 16),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1))
+    .clone(namedValues=NamedValues(("false", 0), ("true", 1))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfaceStpReset.setStatus("current")
+sysInterfaceStatus = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 17),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1, 2, 3, 4, 5))
+    .clone(
+        namedValues=NamedValues(
+            ("up", 0),
+            ("down", 1),
+            ("disabled", 2),
+            ("uninitialized", 3),
+            ("loopback", 4),
+            ("unpopulated", 5),
+        )
+    ),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfaceStatus.setStatus("current")
+sysInterfaceComboPort = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 18),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1))
+    .clone(namedValues=NamedValues(("false", 0), ("true", 1))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfaceComboPort.setStatus("current")
+sysInterfacePreferSfp = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 19),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1))
+    .clone(namedValues=NamedValues(("false", 0), ("true", 1))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfacePreferSfp.setStatus("current")
+sysInterfaceSfpMedia = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 20),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1))
+    .clone(namedValues=NamedValues(("false", 0), ("true", 1))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfaceSfpMedia.setStatus("current")
+sysInterfacePhyMaster = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 21),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1, 2, 3))
+    .clone(
+        namedValues=NamedValues(("slave", 0), ("master", 1), ("auto", 2), ("none", 3))
+    ),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysInterfacePhyMaster.setStatus("current")
+sysIfxStatTable = MibTable(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3),
+)
+if mibBuilder.loadTexts:
+    sysIfxStatTable.setStatus("current")
+sysIfxStatEntry = MibTableRow(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3, 1),
+).setIndexNames((0, "F5-BIGIP-SYSTEM-MIB", "sysIfxStatName"))
+if mibBuilder.loadTexts:
+    sysIfxStatEntry.setStatus("current")
+sysIfxStatName = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3, 1, 1), LongDisplayString()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysIfxStatName.setStatus("current")
+sysIfxStatInMulticastPkts = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3, 1, 2), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysIfxStatInMulticastPkts.setStatus("current")
+sysIfxStatInBroadcastPkts = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3, 1, 3), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysIfxStatInBroadcastPkts.setStatus("current")
+sysIfxStatOutMulticastPkts = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3, 1, 4), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysIfxStatOutMulticastPkts.setStatus("current")
+sysIfxStatOutBroadcastPkts = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3, 1, 5), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysIfxStatOutBroadcastPkts.setStatus("current")
+sysIfxStatHcInOctets = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3, 1, 6), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysIfxStatHcInOctets.setStatus("current")
+sysIfxStatHcInUcastPkts = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3, 1, 7), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysIfxStatHcInUcastPkts.setStatus("current")
+sysIfxStatHcInMulticastPkts = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3, 1, 8), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysIfxStatHcInMulticastPkts.setStatus("current")
+sysIfxStatHcInBroadcastPkts = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3, 1, 9), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysIfxStatHcInBroadcastPkts.setStatus("current")
+sysIfxStatHcOutOctets = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3, 1, 10), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysIfxStatHcOutOctets.setStatus("current")
+sysIfxStatHcOutUcastPkts = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3, 1, 11), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysIfxStatHcOutUcastPkts.setStatus("current")
+sysIfxStatHcOutMulticastPkts = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3, 1, 12), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysIfxStatHcOutMulticastPkts.setStatus("current")
+sysIfxStatHcOutBroadcastPkts = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3, 1, 13), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysIfxStatHcOutBroadcastPkts.setStatus("current")
+sysIfxStatHighSpeed = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3, 1, 14), Integer32()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysIfxStatHighSpeed.setStatus("current")
+sysIfxStatConnectorPresent = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3, 1, 15), Integer32()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysIfxStatConnectorPresent.setStatus("current")
+sysIfxStatCounterDiscontinuityTime = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3, 1, 16), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysIfxStatCounterDiscontinuityTime.setStatus("current")
+sysIfxStatAlias = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3, 1, 17), LongDisplayString()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysIfxStatAlias.setStatus("current")
+sysTrunkTable = MibTable(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12, 1, 2),
+)
+if mibBuilder.loadTexts:
+    sysTrunkTable.setStatus("current")
+sysTrunkEntry = MibTableRow(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12, 1, 2, 1),
+).setIndexNames((0, "F5-BIGIP-SYSTEM-MIB", "sysTrunkName"))
+if mibBuilder.loadTexts:
+    sysTrunkEntry.setStatus("current")
+sysTrunkName = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12, 1, 2, 1, 1), LongDisplayString()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysTrunkName.setStatus("current")
+sysTrunkStatus = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12, 1, 2, 1, 2),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1, 2, 3, 4, 5))
+    .clone(
+        namedValues=NamedValues(
+            ("up", 0),
+            ("down", 1),
+            ("disable", 2),
+            ("uninitialized", 3),
+            ("loopback", 4),
+            ("unpopulated", 5),
+        )
+    ),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysTrunkStatus.setStatus("current")
+sysTrunkAggAddr = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12, 1, 2, 1, 3), MacAddress()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysTrunkAggAddr.setStatus("current")
+sysTrunkCfgMbrCount = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12, 1, 2, 1, 4), Integer32()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysTrunkCfgMbrCount.setStatus("current")
+sysTrunkOperBw = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12, 1, 2, 1, 5), Integer32()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysTrunkOperBw.setStatus("current")
+sysTrunkStpEnable = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12, 1, 2, 1, 6),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1))
+    .clone(namedValues=NamedValues(("false", 0), ("true", 1))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysTrunkStpEnable.setStatus("current")
+sysTrunkStpReset = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12, 1, 2, 1, 7),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1))
+    .clone(namedValues=NamedValues(("false", 0), ("true", 1))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysTrunkStpReset.setStatus("current")
+sysTrunkLacpEnabled = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12, 1, 2, 1, 8),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1))
+    .clone(namedValues=NamedValues(("false", 0), ("true", 1))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysTrunkLacpEnabled.setStatus("current")
+sysTrunkActiveLacp = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12, 1, 2, 1, 9),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1))
+    .clone(namedValues=NamedValues(("false", 0), ("true", 1))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysTrunkActiveLacp.setStatus("current")
+sysTrunkShortTimeout = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12, 1, 2, 1, 10),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1))
+    .clone(namedValues=NamedValues(("false", 0), ("true", 1))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysTrunkShortTimeout.setStatus("current")
+sysTrunkCfgMemberTable = MibTable(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12, 3, 2),
+)
+if mibBuilder.loadTexts:
+    sysTrunkCfgMemberTable.setStatus("current")
+sysTrunkCfgMemberEntry = MibTableRow(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12, 3, 2, 1),
+).setIndexNames(
+    (0, "F5-BIGIP-SYSTEM-MIB", "sysTrunkCfgMemberTrunkName"),
+    (0, "F5-BIGIP-SYSTEM-MIB", "sysTrunkCfgMemberName"),
+)
+if mibBuilder.loadTexts:
+    sysTrunkCfgMemberEntry.setStatus("current")
+sysTrunkCfgMemberTrunkName = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12, 3, 2, 1, 1), LongDisplayString()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysTrunkCfgMemberTrunkName.setStatus("current")
+sysTrunkCfgMemberName = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 12, 3, 2, 1, 2), LongDisplayString()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysTrunkCfgMemberName.setStatus("current")
+sysMultiHostTable = MibTable(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 4, 2),
+)
+if mibBuilder.loadTexts:
+    sysMultiHostTable.setStatus("current")
+sysMultiHostEntry = MibTableRow(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 4, 2, 1),
+).setIndexNames((0, "F5-BIGIP-SYSTEM-MIB", "sysMultiHostHostId"))
+if mibBuilder.loadTexts:
+    sysMultiHostEntry.setStatus("current")
+sysMultiHostHostId = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 4, 2, 1, 1), LongDisplayString()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostHostId.setStatus("current")
+sysMultiHostTotal = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 4, 2, 1, 2), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostTotal.setStatus("current")
+sysMultiHostUsed = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 4, 2, 1, 3), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostUsed.setStatus("current")
+sysMultiHostMode = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 4, 2, 1, 4),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1))
+    .clone(namedValues=NamedValues(("modeup", 0), ("modesmp", 1))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostMode.setStatus("deprecated")
+sysMultiHostCpuCount = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 4, 2, 1, 5), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuCount.setStatus("current")
+sysMultiHostActiveCpuCount = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 4, 2, 1, 6), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostActiveCpuCount.setStatus("current")
+sysMultiHostCpuTable = MibTable(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2),
+)
+if mibBuilder.loadTexts:
+    sysMultiHostCpuTable.setStatus("current")
+sysMultiHostCpuEntry = MibTableRow(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1),
+).setIndexNames(
+    (0, "F5-BIGIP-SYSTEM-MIB", "sysMultiHostCpuHostId"),
+    (0, "F5-BIGIP-SYSTEM-MIB", "sysMultiHostCpuIndex"),
+)
+if mibBuilder.loadTexts:
+    sysMultiHostCpuEntry.setStatus("current")
+sysMultiHostCpuHostId = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 1), LongDisplayString()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuHostId.setStatus("current")
+sysMultiHostCpuIndex = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 2),
+    Integer32().subtype(subtypeSpec=ValueRangeConstraint(1, 2147483647)),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuIndex.setStatus("current")
+sysMultiHostCpuId = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 3), Integer32()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuId.setStatus("current")
+sysMultiHostCpuUser = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 4), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuUser.setStatus("current")
+sysMultiHostCpuNice = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 5), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuNice.setStatus("current")
+sysMultiHostCpuSystem = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 6), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuSystem.setStatus("current")
+sysMultiHostCpuIdle = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 7), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuIdle.setStatus("current")
+sysMultiHostCpuIrq = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 8), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuIrq.setStatus("current")
+sysMultiHostCpuSoftirq = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 9), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuSoftirq.setStatus("current")
+sysMultiHostCpuIowait = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 10), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuIowait.setStatus("current")
+sysMultiHostCpuUsageRatio = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 11), Gauge32()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuUsageRatio.setStatus("current")
+sysMultiHostCpuUser5s = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 12), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuUser5s.setStatus("current")
+sysMultiHostCpuNice5s = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 13), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuNice5s.setStatus("current")
+sysMultiHostCpuSystem5s = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 14), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuSystem5s.setStatus("current")
+sysMultiHostCpuIdle5s = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 15), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuIdle5s.setStatus("current")
+sysMultiHostCpuIrq5s = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 16), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuIrq5s.setStatus("current")
+sysMultiHostCpuSoftirq5s = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 17), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuSoftirq5s.setStatus("current")
+sysMultiHostCpuIowait5s = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 18), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuIowait5s.setStatus("current")
+sysMultiHostCpuUsageRatio5s = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 19), Gauge32()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuUsageRatio5s.setStatus("current")
+sysMultiHostCpuUser1m = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 20), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuUser1m.setStatus("current")
+sysMultiHostCpuNice1m = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 21), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuNice1m.setStatus("current")
+sysMultiHostCpuSystem1m = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 22), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuSystem1m.setStatus("current")
+sysMultiHostCpuIdle1m = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 23), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuIdle1m.setStatus("current")
+sysMultiHostCpuIrq1m = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 24), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuIrq1m.setStatus("current")
+sysMultiHostCpuSoftirq1m = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 25), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuSoftirq1m.setStatus("current")
+sysMultiHostCpuIowait1m = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 26), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuIowait1m.setStatus("current")
+sysMultiHostCpuUsageRatio1m = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 27), Gauge32()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuUsageRatio1m.setStatus("current")
+sysMultiHostCpuUser5m = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 28), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuUser5m.setStatus("current")
+sysMultiHostCpuNice5m = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 29), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuNice5m.setStatus("current")
+sysMultiHostCpuSystem5m = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 30), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuSystem5m.setStatus("current")
+sysMultiHostCpuIdle5m = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 31), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuIdle5m.setStatus("current")
+sysMultiHostCpuIrq5m = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 32), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuIrq5m.setStatus("current")
+sysMultiHostCpuSoftirq5m = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 33), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuSoftirq5m.setStatus("current")
+sysMultiHostCpuIowait5m = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 34), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuIowait5m.setStatus("current")
+sysMultiHostCpuUsageRatio5m = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 35), Gauge32()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuUsageRatio5m.setStatus("current")
+sysMultiHostCpuStolen = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 36), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuStolen.setStatus("current")
+sysMultiHostCpuStolen5s = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 37), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuStolen5s.setStatus("current")
+sysMultiHostCpuStolen1m = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 38), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuStolen1m.setStatus("current")
+sysMultiHostCpuStolen5m = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 7, 5, 2, 1, 39), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysMultiHostCpuStolen5m.setStatus("current")
+sysClusterTable = MibTable(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1, 2),
+)
+if mibBuilder.loadTexts:
+    sysClusterTable.setStatus("current")
+sysClusterEntry = MibTableRow(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1, 2, 1),
+).setIndexNames((0, "F5-BIGIP-SYSTEM-MIB", "sysClusterName"))
+if mibBuilder.loadTexts:
+    sysClusterEntry.setStatus("current")
+sysClusterName = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1, 2, 1, 1), LongDisplayString()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterName.setStatus("current")
+sysClusterEnabled = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1, 2, 1, 2),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1))
+    .clone(namedValues=NamedValues(("false", 0), ("true", 1))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterEnabled.setStatus("current")
+sysClusterFloatMgmtIpType = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1, 2, 1, 3), InetAddressType()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterFloatMgmtIpType.setStatus("current")
+sysClusterFloatMgmtIp = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1, 2, 1, 4), InetAddress()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterFloatMgmtIp.setStatus("current")
+sysClusterFloatMgmtNetmaskType = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1, 2, 1, 5), InetAddressType()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterFloatMgmtNetmaskType.setStatus("current")
+sysClusterFloatMgmtNetmask = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1, 2, 1, 6), InetAddress()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterFloatMgmtNetmask.setStatus("current")
+sysClusterMinUpMbrs = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1, 2, 1, 7), Integer32()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterMinUpMbrs.setStatus("current")
+sysClusterMinUpMbrsEnable = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1, 2, 1, 8), Integer32()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterMinUpMbrsEnable.setStatus("current")
+sysClusterMinUpMbrsAction = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1, 2, 1, 9),
+    Integer32()
+    .subtype(
+        subtypeSpec=SingleValueConstraint(0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12)
+    )
+    .clone(
+        namedValues=NamedValues(
+            ("unusedhaaction", 0),
+            ("reboot", 1),
+            ("restart", 2),
+            ("failover", 3),
+            ("goactive", 4),
+            ("noaction", 5),
+            ("restartall", 6),
+            ("failoveraborttm", 7),
+            ("gooffline", 8),
+            ("goofflinerestart", 9),
+            ("goofflineaborttm", 10),
+            ("goofflinedownlinks", 11),
+            ("goofflinedownlinksrestart", 12),
+        )
+    ),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterMinUpMbrsAction.setStatus("current")
+sysClusterAvailabilityState = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1, 2, 1, 10),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1, 2, 3, 4))
+    .clone(
+        namedValues=NamedValues(
+            ("none", 0), ("green", 1), ("yellow", 2), ("red", 3), ("blue", 4)
+        )
+    ),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterAvailabilityState.setStatus("current")
+sysClusterEnabledStat = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1, 2, 1, 11),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1, 2, 3))
+    .clone(
+        namedValues=NamedValues(
+            ("none", 0), ("enabled", 1), ("disabled", 2), ("disabledbyparent", 3)
+        )
+    ),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterEnabledStat.setStatus("current")
+sysClusterDisabledParentType = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1, 2, 1, 12), Integer32()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterDisabledParentType.setStatus("current")
+sysClusterStatusReason = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1, 2, 1, 13), LongDisplayString()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterStatusReason.setStatus("current")
+sysClusterHaState = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1, 2, 1, 14),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1, 2, 3, 4))
+    .clone(
+        namedValues=NamedValues(
+            ("offline", 0),
+            ("forcedoffline", 1),
+            ("standby", 2),
+            ("active", 3),
+            ("unknown", 4),
+        )
+    ),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterHaState.setStatus("current")
+sysClusterPriSlotId = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1, 2, 1, 15), Integer32()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterPriSlotId.setStatus("current")
+sysClusterLastPriSlotId = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1, 2, 1, 16), Integer32()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterLastPriSlotId.setStatus("current")
+sysClusterPriSelTime = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 1, 2, 1, 17), Counter64()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterPriSelTime.setStatus("current")
+sysClusterMbrTable = MibTable(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 2, 2),
+)
+if mibBuilder.loadTexts:
+    sysClusterMbrTable.setStatus("current")
+sysClusterMbrEntry = MibTableRow(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 2, 2, 1),
+).setIndexNames(
+    (0, "F5-BIGIP-SYSTEM-MIB", "sysClusterMbrCluster"),
+    (0, "F5-BIGIP-SYSTEM-MIB", "sysClusterMbrSlotId"),
+)
+if mibBuilder.loadTexts:
+    sysClusterMbrEntry.setStatus("current")
+sysClusterMbrCluster = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 2, 2, 1, 1), LongDisplayString()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterMbrCluster.setStatus("current")
+sysClusterMbrSlotId = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 2, 2, 1, 2),
+    Integer32().subtype(subtypeSpec=ValueRangeConstraint(1, 2147483647)),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterMbrSlotId.setStatus("current")
+sysClusterMbrAvailabilityState = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 2, 2, 1, 3),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1, 2, 3, 4))
+    .clone(
+        namedValues=NamedValues(
+            ("none", 0), ("green", 1), ("yellow", 2), ("red", 3), ("blue", 4)
+        )
+    ),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterMbrAvailabilityState.setStatus("current")
+sysClusterMbrEnabledStat = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 2, 2, 1, 4),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1, 2, 3))
+    .clone(
+        namedValues=NamedValues(
+            ("none", 0), ("enabled", 1), ("disabled", 2), ("disabledbyparent", 3)
+        )
+    ),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterMbrEnabledStat.setStatus("current")
+sysClusterMbrDisabledParentType = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 2, 2, 1, 5), Integer32()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterMbrDisabledParentType.setStatus("current")
+sysClusterMbrStatusReason = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 2, 2, 1, 6), LongDisplayString()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterMbrStatusReason.setStatus("current")
+sysClusterMbrLicensed = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 2, 2, 1, 7),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1))
+    .clone(namedValues=NamedValues(("false", 0), ("true", 1))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterMbrLicensed.setStatus("current")
+sysClusterMbrState = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 2, 2, 1, 8),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1, 2, 3, 4))
+    .clone(
+        namedValues=NamedValues(
+            ("initial", 0),
+            ("quorumwait", 1),
+            ("quorum", 2),
+            ("running", 3),
+            ("shutdown", 4),
+        )
+    ),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterMbrState.setStatus("current")
+sysClusterMbrEnabled = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 2, 2, 1, 9),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1))
+    .clone(namedValues=NamedValues(("false", 0), ("true", 1))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterMbrEnabled.setStatus("current")
+sysClusterMbrPriming = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 2, 2, 1, 10),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1))
+    .clone(namedValues=NamedValues(("false", 0), ("true", 1))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterMbrPriming.setStatus("current")
+sysClusterMbrMgmtAddrType = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 2, 2, 1, 11), InetAddressType()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterMbrMgmtAddrType.setStatus("current")
+sysClusterMbrMgmtAddr = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 10, 2, 2, 1, 12), InetAddress()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysClusterMbrMgmtAddr.setStatus("current")
+sysSwStatusTable = MibTable(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 9, 4, 2),
+)
+if mibBuilder.loadTexts:
+    sysSwStatusTable.setStatus("current")
+sysSwStatusEntry = MibTableRow(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 9, 4, 2, 1),
+).setIndexNames(
+    (0, "F5-BIGIP-SYSTEM-MIB", "sysSwStatusSlotId"),
+    (0, "F5-BIGIP-SYSTEM-MIB", "sysSwStatusVolume"),
+)
+if mibBuilder.loadTexts:
+    sysSwStatusEntry.setStatus("current")
+sysSwStatusSlotId = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 9, 4, 2, 1, 1),
+    Integer32().subtype(subtypeSpec=ValueRangeConstraint(1, 2147483647)),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysSwStatusSlotId.setStatus("current")
+sysSwStatusVolume = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 9, 4, 2, 1, 2), LongDisplayString()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysSwStatusVolume.setStatus("current")
+sysSwStatusProduct = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 9, 4, 2, 1, 3), LongDisplayString()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysSwStatusProduct.setStatus("current")
+sysSwStatusVersion = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 9, 4, 2, 1, 4), LongDisplayString()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysSwStatusVersion.setStatus("current")
+sysSwStatusBuild = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 9, 4, 2, 1, 5), LongDisplayString()
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysSwStatusBuild.setStatus("current")
+sysSwStatusActive = MibTableColumn(
+    (1, 3, 6, 1, 4, 1, 3375, 2, 1, 9, 4, 2, 1, 6),
+    Integer32()
+    .subtype(subtypeSpec=SingleValueConstraint(0, 1))
+    .clone(namedValues=NamedValues(("false", 0), ("true", 1))),
+).setMaxAccess("readonly")
+if mibBuilder.loadTexts:
+    sysSwStatusActive.setStatus("current")
+mibBuilder.exportSymbols("F5-BIGIP-SYSTEM-MIB", bigipSystem=bigipSystem, sysNetwork=sysNetwork, sysPlatform=sysPlatform, sysHostInfoStat=sysHostInfoStat, sysSoftware=sysSoftware, sysClusters=sysClusters, sysInterfaces=sysInterfaces, sysTrunks=sysTrunks, sysDeviceModelOIDs=sysDeviceModelOIDs, sysInterface=sysInterface, sysIfxStat=sysIfxStat, sysTrunk=sysTrunk, sysTrunkCfgMember=sysTrunkCfgMember, sysMultiHost=sysMultiHost, sysMultiHostCpu=sysMultiHostCpu, sysSoftwareStatus=sysSoftwareStatus, sysCluster=sysCluster, sysClusterMbr=sysClusterMbr, bigip520=bigip520, bigip540=bigip540, bigip1000=bigip1000, bigip1500=bigip1500, bigip2400=bigip2400, bigip3400=bigip3400, bigip4100=bigip4100, bigip5100=bigip5100, bigip5110=bigip5110, bigip6400=bigip6400, bigip6800=bigip6800, bigip8400=bigip8400, bigip8800=bigip8800, em3000=em3000, wj300=wj300, wj400=wj400, wj500=wj500, wj800=wj800, bigipPb200=bigipPb200, bigip1600=bigip1600, bigip3600=bigip3600, bigip6900=bigip6900, bigip8900=bigip8900, bigip3900=bigip3900, bigip8950=bigip8950, em4000=em4000, bigip11050=bigip11050, em500=em500, arx1000=arx1000, arx2000=arx2000, arx4000=arx4000, arx500=arx500, bigip3410=bigip3410, bigipPb100=bigipPb100, bigipPb100n=bigipPb100n, sam4300=sam4300, firepass1200=firepass1200, firepass4100=firepass4100, firepass4300=firepass4300, swanWJ200=swanWJ200, TrafficShield4100=TrafficShield4100, wa4500=wa4500, bigipVirtualEdition=bigipVirtualEdition, unknown=unknown, sysInterfaceNumber=sysInterfaceNumber, sysInterfaceTable=sysInterfaceTable, sysInterfaceEntry=sysInterfaceEntry, sysInterfaceName=sysInterfaceName, sysInterfaceMediaMaxSpeed=sysInterfaceMediaMaxSpeed, sysInterfaceMediaMaxDuplex=sysInterfaceMediaMaxDuplex, sysInterfaceMediaActiveSpeed=sysInterfaceMediaActiveSpeed, sysInterfaceMediaActiveDuplex=sysInterfaceMediaActiveDuplex, sysInterfaceMacAddr=sysInterfaceMacAddr, sysInterfaceMtu=sysInterfaceMtu, sysInterfaceEnabled=sysInterfaceEnabled, sysInterfaceLearnMode=sysInterfaceLearnMode, sysInterfaceFlowCtrlReq=sysInterfaceFlowCtrlReq, sysInterfaceStpLink=sysInterfaceStpLink, sysInterfaceStpEdge=sysInterfaceStpEdge, sysInterfaceStpEdgeActive=sysInterfaceStpEdgeActive, sysInterfaceStpAuto=sysInterfaceStpAuto, sysInterfaceStpEnable=sysInterfaceStpEnable, sysInterfaceStpReset=sysInterfaceStpReset, sysInterfaceStatus=sysInterfaceStatus, sysInterfaceComboPort=sysInterfaceComboPort, sysInterfacePreferSfp=sysInterfacePreferSfp, sysInterfaceSfpMedia=sysInterfaceSfpMedia, sysInterfacePhyMaster=sysInterfacePhyMaster, sysIfxStatTable=sysIfxStatTable, sysIfxStatEntry=sysIfxStatEntry, sysIfxStatName=sysIfxStatName, sysIfxStatInMulticastPkts=sysIfxStatInMulticastPkts, sysIfxStatInBroadcastPkts=sysIfxStatInBroadcastPkts, sysIfxStatOutMulticastPkts=sysIfxStatOutMulticastPkts, sysIfxStatOutBroadcastPkts=sysIfxStatOutBroadcastPkts, sysIfxStatHcInOctets=sysIfxStatHcInOctets, sysIfxStatHcInUcastPkts=sysIfxStatHcInUcastPkts, sysIfxStatHcInMulticastPkts=sysIfxStatHcInMulticastPkts, sysIfxStatHcInBroadcastPkts=sysIfxStatHcInBroadcastPkts, sysIfxStatHcOutOctets=sysIfxStatHcOutOctets, sysIfxStatHcOutUcastPkts=sysIfxStatHcOutUcastPkts, sysIfxStatHcOutMulticastPkts=sysIfxStatHcOutMulticastPkts, sysIfxStatHcOutBroadcastPkts=sysIfxStatHcOutBroadcastPkts, sysIfxStatHighSpeed=sysIfxStatHighSpeed, sysIfxStatConnectorPresent=sysIfxStatConnectorPresent, sysIfxStatCounterDiscontinuityTime=sysIfxStatCounterDiscontinuityTime, sysIfxStatAlias=sysIfxStatAlias, sysTrunkTable=sysTrunkTable, sysTrunkEntry=sysTrunkEntry, sysTrunkName=sysTrunkName, sysTrunkStatus=sysTrunkStatus, sysTrunkAggAddr=sysTrunkAggAddr, sysTrunkCfgMbrCount=sysTrunkCfgMbrCount, sysTrunkOperBw=sysTrunkOperBw, sysTrunkStpEnable=sysTrunkStpEnable, sysTrunkStpReset=sysTrunkStpReset, sysTrunkLacpEnabled=sysTrunkLacpEnabled, sysTrunkActiveLacp=sysTrunkActiveLacp, sysTrunkShortTimeout=sysTrunkShortTimeout, sysTrunkCfgMemberTable=sysTrunkCfgMemberTable, sysTrunkCfgMemberEntry=sysTrunkCfgMemberEntry, sysTrunkCfgMemberTrunkName=sysTrunkCfgMemberTrunkName, sysTrunkCfgMemberName=sysTrunkCfgMemberName, sysMultiHostTable=sysMultiHostTable, sysMultiHostEntry=sysMultiHostEntry, sysMultiHostHostId=sysMultiHostHostId, sysMultiHostTotal=sysMultiHostTotal, sysMultiHostUsed=sysMultiHostUsed, sysMultiHostMode=sysMultiHostMode, sysMultiHostCpuCount=sysMultiHostCpuCount, sysMultiHostActiveCpuCount=sysMultiHostActiveCpuCount, sysMultiHostCpuTable=sysMultiHostCpuTable, sysMultiHostCpuEntry=sysMultiHostCpuEntry, sysMultiHostCpuHostId=sysMultiHostCpuHostId, sysMultiHostCpuIndex=sysMultiHostCpuIndex, sysMultiHostCpuId=sysMultiHostCpuId, sysMultiHostCpuUser=sysMultiHostCpuUser, sysMultiHostCpuNice=sysMultiHostCpuNice, sysMultiHostCpuSystem=sysMultiHostCpuSystem, sysMultiHostCpuIdle=sysMultiHostCpuIdle, sysMultiHostCpuIrq=sysMultiHostCpuIrq, sysMultiHostCpuSoftirq=sysMultiHostCpuSoftirq, sysMultiHostCpuIowait=sysMultiHostCpuIowait, sysMultiHostCpuUsageRatio=sysMultiHostCpuUsageRatio, sysMultiHostCpuUser5s=sysMultiHostCpuUser5s, sysMultiHostCpuNice5s=sysMultiHostCpuNice5s, sysMultiHostCpuSystem5s=sysMultiHostCpuSystem5s, sysMultiHostCpuIdle5s=sysMultiHostCpuIdle5s, sysMultiHostCpuIrq5s=sysMultiHostCpuIrq5s, sysMultiHostCpuSoftirq5s=sysMultiHostCpuSoftirq5s, sysMultiHostCpuIowait5s=sysMultiHostCpuIowait5s, sysMultiHostCpuUsageRatio5s=sysMultiHostCpuUsageRatio5s, sysMultiHostCpuUser1m=sysMultiHostCpuUser1m, sysMultiHostCpuNice1m=sysMultiHostCpuNice1m, sysMultiHostCpuSystem1m=sysMultiHostCpuSystem1m, sysMultiHostCpuIdle1m=sysMultiHostCpuIdle1m, sysMultiHostCpuIrq1m=sysMultiHostCpuIrq1m, sysMultiHostCpuSoftirq1m=sysMultiHostCpuSoftirq1m, sysMultiHostCpuIowait1m=sysMultiHostCpuIowait1m, sysMultiHostCpuUsageRatio1m=sysMultiHostCpuUsageRatio1m, sysMultiHostCpuUser5m=sysMultiHostCpuUser5m, sysMultiHostCpuNice5m=sysMultiHostCpuNice5m, sysMultiHostCpuSystem5m=sysMultiHostCpuSystem5m, sysMultiHostCpuIdle5m=sysMultiHostCpuIdle5m, sysMultiHostCpuIrq5m=sysMultiHostCpuIrq5m, sysMultiHostCpuSoftirq5m=sysMultiHostCpuSoftirq5m, sysMultiHostCpuIowait5m=sysMultiHostCpuIowait5m, sysMultiHostCpuUsageRatio5m=sysMultiHostCpuUsageRatio5m, sysMultiHostCpuStolen=sysMultiHostCpuStolen, sysMultiHostCpuStolen5s=sysMultiHostCpuStolen5s, sysMultiHostCpuStolen1m=sysMultiHostCpuStolen1m, sysMultiHostCpuStolen5m=sysMultiHostCpuStolen5m, sysClusterTable=sysClusterTable, sysClusterEntry=sysClusterEntry, sysClusterName=sysClusterName, sysClusterEnabled=sysClusterEnabled, sysClusterFloatMgmtIpType=sysClusterFloatMgmtIpType, sysClusterFloatMgmtIp=sysClusterFloatMgmtIp, sysClusterFloatMgmtNetmaskType=sysClusterFloatMgmtNetmaskType, sysClusterFloatMgmtNetmask=sysClusterFloatMgmtNetmask, sysClusterMinUpMbrs=sysClusterMinUpMbrs, sysClusterMinUpMbrsEnable=sysClusterMinUpMbrsEnable, sysClusterMinUpMbrsAction=sysClusterMinUpMbrsAction, sysClusterAvailabilityState=sysClusterAvailabilityState, sysClusterEnabledStat=sysClusterEnabledStat, sysClusterDisabledParentType=sysClusterDisabledParentType, sysClusterStatusReason=sysClusterStatusReason, sysClusterHaState=sysClusterHaState, sysClusterPriSlotId=sysClusterPriSlotId, sysClusterLastPriSlotId=sysClusterLastPriSlotId, sysClusterPriSelTime=sysClusterPriSelTime, sysClusterMbrTable=sysClusterMbrTable, sysClusterMbrEntry=sysClusterMbrEntry, sysClusterMbrCluster=sysClusterMbrCluster, sysClusterMbrSlotId=sysClusterMbrSlotId, sysClusterMbrAvailabilityState=sysClusterMbrAvailabilityState, sysClusterMbrEnabledStat=sysClusterMbrEnabledStat, sysClusterMbrDisabledParentType=sysClusterMbrDisabledParentType, sysClusterMbrStatusReason=sysClusterMbrStatusReason, sysClusterMbrLicensed=sysClusterMbrLicensed, sysClusterMbrState=sysClusterMbrState, sysClusterMbrEnabled=sysClusterMbrEnabled, sysClusterMbrPriming=sysClusterMbrPriming, sysClusterMbrMgmtAddrType=sysClusterMbrMgmtAddrType, sysClusterMbrMgmtAddr=sysClusterMbrMgmtAddr, sysSwStatusTable=sysSwStatusTable, sysSwStatusEntry=sysSwStatusEntry, sysSwStatusSlotId=sysSwStatusSlotId, sysSwStatusVolume=sysSwStatusVolume, sysSwStatusProduct=sysSwStatusProduct, sysSwStatusVersion=sysSwStatusVersion, sysSwStatusBuild=sysSwStatusBuild, sysSwStatusActive=sysSwStatusActive)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from cloudshell.snmp.core.domain.quali_mib_table import QualiMibTable
+from cloudshell.snmp.core.domain.snmp_response import SnmpResponse
+
+from cloudshell.f5.snmp.bulk_walker import AdaptiveBulkWalker
+
+if TYPE_CHECKING:
+    from logging import Logger
+    from typing import Dict, Iterable, List
+
+    from cloudshell.snmp.core.domain.snmp_oid import BaseSnmpOid
+    from cloudshell.snmp.core.snmp_service import SnmpService
+
+    from cloudshell.f5.snmp.bulk_walker import BulkWalkStats
+
+
+def get_table_walker(
+    snmp_service: SnmpService, logger: Logger
+) -> AdaptiveBulkWalker | PrefetchedSnmpService:
+    """Get walker for the tables which reuses columns prefetched by the service."""
+    if isinstance(snmp_service, PrefetchedSnmpService):
+        return snmp_service
+    return AdaptiveBulkWalker(snmp_service, logger)
+
+
+def get_row_value(row: dict, column: str, default: str = "") -> str:
+    """Get the value of the column of the QualiMibTable row, default if missing."""
+    response = row.get(column)
+    return response.safe_value if response else default
+
+
+class PrefetchedSnmpService(object):
+    """SNMP service proxy which answers from the columns walked in advance.
+
+    Walks, tables and gets of the prefetched columns are served from memory,
+    everything else goes to the wrapped SNMP service.
+    """
+
+    def __init__(
+        self,
+        snmp_service: SnmpService,
+        logger: Logger,
+        bulk_walker: AdaptiveBulkWalker = None,
+    ):
+        self._snmp = snmp_service
+        self._logger = logger
+        self.bulk_walker = bulk_walker or AdaptiveBulkWalker(snmp_service, logger)
+        self._columns: Dict[str, Dict[str, SnmpResponse]] = {}
+
+    def __getattr__(self, item):
+        return getattr(self._snmp, item)
+
+    @property
+    def stats(self) -> BulkWalkStats:
+        return self.bulk_walker.stats
+
+    def prefetch(
+        self, snmp_oid_objs: Iterable[BaseSnmpOid], max_concurrency: int = 1
+    ) -> None:
+        """Walk columns concurrently, ones which timed out are left to the service."""
+        snmp_oid_objs = list(snmp_oid_objs)
+        results = self.bulk_walker.walk_available(snmp_oid_objs, max_concurrency)
+        for snmp_oid_obj, responses in zip(snmp_oid_objs, results):
+            if responses is not None:
+                self.add_column(snmp_oid_obj, responses)
+        self._logger.info(
+            f"Prefetched {len(self._columns)} of {len(snmp_oid_objs)} columns, "
+            f"GETBULK: {self.bulk_walker.stats}"
+        )
+
+    def add_column(
+        self, snmp_oid_obj: BaseSnmpOid, responses: Iterable[SnmpResponse]
+    ) -> None:
+        """Add the column walked in advance by other means."""
+        self._columns[self._get_oid(snmp_oid_obj)] = {
+            str(response._raw_oid): response for response in responses
+        }
+
+    def is_prefetched(self, snmp_oid_obj: BaseSnmpOid) -> bool:
+        return self._get_oid(snmp_oid_obj) in self._columns
+
+    def walk(self, snmp_oid_obj: BaseSnmpOid, *args, **kwargs) -> List[SnmpResponse]:
+        column = self._columns.get(self._get_oid(snmp_oid_obj))
+        if column is None:
+            return self._snmp.walk(snmp_oid_obj, *args, **kwargs)
+        return list(column.values())
+
+    def walk_many(
+        self, snmp_oid_objs: Iterable[BaseSnmpOid], max_concurrency: int = 1
+    ) -> List[List[SnmpResponse]]:
+        """Walk columns which are not prefetched with the bulk walker."""
+        snmp_oid_objs = list(snmp_oid_objs)
+        columns = [self._columns.get(self._get_oid(obj)) for obj in snmp_oid_objs]
+        missing = [obj for obj, column in zip(snmp_oid_objs, columns) if column is None]
+        walked = iter(self.bulk_walker.walk_many(missing, max_concurrency))
+        return [
+            next(walked) if column is None else list(column.values())
+            for column in columns
+        ]
+
+    def get_table(self, snmp_oid_obj: BaseSnmpOid, *args, **kwargs) -> QualiMibTable:
+        column = self._columns.get(self._get_oid(snmp_oid_obj))
+        if column is None:
+            return self._snmp.get_table(snmp_oid_obj, *args, **kwargs)
+        table_name = snmp_oid_obj.get_object_type(snmp_engine=self._snmp_engine)[
+            0
+        ].getMibSymbol()[1]
+        return QualiMibTable.create_from_list(table_name, column.values())
+
+    def get_property(self, snmp_oid: BaseSnmpOid) -> SnmpResponse:
+        oid = self._get_oid(snmp_oid)
+        for column_oid, column in self._columns.items():
+            if oid.startswith(column_oid + "."):
+                return column.get(oid) or SnmpResponse(
+                    oid, None, snmp_engine=self._snmp_engine, logger=self._logger
+                )
+        return self._snmp.get_property(snmp_oid)
+
+    def _get_oid(self, snmp_oid_obj: BaseSnmpOid) -> str:
+        return str(snmp_oid_obj.get_oid(self._snmp_engine))
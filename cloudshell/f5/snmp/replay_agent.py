@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import argparse
+import bisect
+import logging
+import socketserver
+import threading
+import time
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+from pyasn1.codec.ber import decoder, encoder
+from pyasn1.error import PyAsn1Error
+from pysnmp.proto import api
+
+from cloudshell.snmp.cloudshell_snmp import Snmp
+from cloudshell.snmp.snmp_parameters import SNMPReadParameters
+
+from cloudshell.f5.snmp.snmp_recording import read_snapshot
+
+if TYPE_CHECKING:
+    from logging import Logger
+    from typing import List, Optional, Tuple
+
+    from cloudshell.f5.snmp.snmp_recording import RecordedVarBinds
+
+
+class _ReplayRequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        data, sock = self.request
+        agent = self.server.agent
+        response = agent.get_response(data)
+        if response is None:
+            return
+        if agent.latency:
+            time.sleep(agent.latency)
+        sock.sendto(response, self.client_address)
+
+
+class _ReplayServer(socketserver.ThreadingUDPServer):
+    daemon_threads = True
+
+    def __init__(self, agent: SnmpReplayAgent, address: Tuple[str, int]):
+        self.agent = agent
+        super(_ReplayServer, self).__init__(address, _ReplayRequestHandler)
+
+
+class SnmpReplayAgent(object):
+    """Local SNMP v1/v2c agent answering from the recorded snapshot.
+
+    Every request is answered in its own thread after the latency, so
+    concurrent requests are delayed independently like on the network. Any
+    community is accepted.
+    """
+
+    def __init__(
+        self,
+        var_binds: RecordedVarBinds,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+    ):
+        """Replay agent.
+
+        :param port: UDP port to listen on, any free port if 0
+        :param latency: delay of every response, seconds
+        """
+        self._var_binds = var_binds
+        self._oids = sorted(var_binds)
+        self._host = host
+        self._port = port
+        self._server: Optional[_ReplayServer] = None
+        self._lock = threading.Lock()
+        self.latency = latency
+        self.requests = 0
+
+    @classmethod
+    def from_snapshot(cls, path: str, **kwargs) -> SnmpReplayAgent:
+        return cls(read_snapshot(path), **kwargs)
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        if self._server:
+            return self._server.server_address
+        return self._host, self._port
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self) -> None:
+        self._server = _ReplayServer(self, (self._host, self._port))
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def get_response(self, whole_msg: bytes) -> Optional[bytes]:
+        """Get encoded response to the request, None if it can't be answered."""
+        try:
+            proto_module = api.protoModules[int(api.decodeMessageVersion(whole_msg))]
+            request, _ = decoder.decode(whole_msg, asn1Spec=proto_module.Message())
+        except (KeyError, PyAsn1Error):
+            return
+        with self._lock:
+            self.requests += 1
+        response = proto_module.apiMessage.getResponse(request)
+        request_pdu = proto_module.apiMessage.getPDU(request)
+        response_pdu = proto_module.apiMessage.getPDU(response)
+        var_binds = proto_module.apiPDU.getVarBinds(request_pdu)
+
+        if request_pdu.isSameTypeWith(proto_module.GetRequestPDU()):
+            values = [self._var_binds.get(tuple(oid)) for oid, _ in var_binds]
+            response_var_binds = [
+                (oid, value) for (oid, _), value in zip(var_binds, values)
+            ]
+            on_missing = proto_module.apiPDU.setNoSuchInstanceError
+        elif request_pdu.isSameTypeWith(proto_module.GetNextRequestPDU()):
+            response_var_binds = [self._get_next(oid) for oid, _ in var_binds]
+            on_missing = proto_module.apiPDU.setEndOfMibError
+        elif request_pdu.isSameTypeWith(api.v2c.GetBulkRequestPDU()):
+            response_var_binds = self._get_bulk(
+                [oid for oid, _ in var_binds],
+                api.v2c.apiBulkPDU.getNonRepeaters(request_pdu),
+                api.v2c.apiBulkPDU.getMaxRepetitions(request_pdu),
+            )
+            on_missing = proto_module.apiPDU.setEndOfMibError
+        else:
+            proto_module.apiPDU.setErrorStatus(response_pdu, 5)
+            proto_module.apiPDU.setVarBinds(response_pdu, var_binds)
+            return encoder.encode(response)
+
+        missing = [
+            index
+            for index, (_, value) in enumerate(response_var_binds, 1)
+            if value is None
+        ]
+        if missing and proto_module is api.v1:
+            # SNMPv1 reports the first missing var-bind and echoes the request
+            proto_module.apiPDU.setVarBinds(response_pdu, var_binds)
+            on_missing(response_pdu, missing[0])
+        else:
+            proto_module.apiPDU.setVarBinds(
+                response_pdu,
+                [
+                    (oid, proto_module.Null("") if value is None else value)
+                    for oid, value in response_var_binds
+                ],
+            )
+            for index in missing:
+                on_missing(response_pdu, index)
+        return encoder.encode(response)
+
+    def _get_next(self, oid) -> Tuple[object, object]:
+        position = bisect.bisect_right(self._oids, tuple(oid))
+        if position < len(self._oids):
+            next_oid = self._oids[position]
+            return api.v2c.ObjectIdentifier(next_oid), self._var_binds[next_oid]
+        return oid, None
+
+    def _get_bulk(
+        self, oids: List[object], non_repeaters: int, max_repetitions: int
+    ) -> List[Tuple[object, object]]:
+        non_repeaters = max(0, min(int(non_repeaters), len(oids)))
+        result = [self._get_next(oid) for oid in oids[:non_repeaters]]
+        repeaters = oids[non_repeaters:]
+        for _ in range(max(0, int(max_repetitions))):
+            if not repeaters:
+                break
+            row = [self._get_next(oid) for oid in repeaters]
+            result.extend(row)
+            if all(value is None for _, value in row):
+                break
+            repeaters = [oid for oid, _ in row]
+        return result
+
+
+class ReplaySnmpConfigurator(object):
+    """Stand-in for the SNMP configurator of the flows using the replay agent."""
+
+    def __init__(
+        self,
+        agent: SnmpReplayAgent,
+        logger: Logger,
+        community: str = "public",
+        snmp: Snmp = None,
+    ):
+        self._agent = agent
+        self._logger = logger
+        self._community = community
+        self._snmp = snmp or Snmp()
+        self.resource_config = SimpleNamespace(address=agent.address[0])
+
+    def get_service(self):
+        host, port = self._agent.address
+        return self._snmp.get_snmp_service(
+            SNMPReadParameters(host, self._community, port=port), self._logger
+        )
+
+
+def main(args: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Serve the recorded SNMP snapshot on the local UDP port"
+    )
+    parser.add_argument("snapshot", help="snmprec file, gzip compressed if .gz")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=16161)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    options = parser.parse_args(args)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logger = logging.getLogger(__name__)
+
+    agent = SnmpReplayAgent.from_snapshot(
+        options.snapshot,
+        host=options.host,
+        port=options.port,
+        latency=options.latency,
+    )
+    with agent:
+        logger.info(
+            f"Serving {options.snapshot} on {agent.address[0]}:{agent.address[1]}"
+        )
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import gzip
+import string
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from pysnmp.proto import api, rfc1902
+
+from cloudshell.f5.snmp.mib_cache import write_atomic
+
+if TYPE_CHECKING:
+    from typing import Dict, Iterable, Tuple
+
+    from pysnmp.entity.engine import SnmpEngine
+
+    from cloudshell.snmp.core.snmp_service import SnmpService
+
+    RecordedVarBinds = Dict[Tuple[int, ...], rfc1902.ObjectSyntax]
+
+# snmprec value tags, the same as the ASN.1 tags of the types
+SNMPREC_TYPES = {
+    2: rfc1902.Integer32,
+    4: rfc1902.OctetString,
+    6: rfc1902.ObjectName,
+    64: rfc1902.IpAddress,
+    65: rfc1902.Counter32,
+    66: rfc1902.Gauge32,
+    67: rfc1902.TimeTicks,
+    68: rfc1902.Opaque,
+    70: rfc1902.Counter64,
+}
+SNMPREC_TAGS = {value_type.tagSet: tag for tag, value_type in SNMPREC_TYPES.items()}
+# values written as text, the rest of the octet strings are written in hex
+PRINTABLE_CHARS = frozenset(
+    (string.ascii_letters + string.digits + string.punctuation + " ").encode()
+)
+
+
+def _open(path: str, mode: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def format_snmprec_line(oid: Iterable[int], value) -> str:
+    tag = SNMPREC_TAGS[value.tagSet]
+    if tag in (4, 68):
+        octets = value.asOctets()
+        if tag == 4 and set(octets) <= PRINTABLE_CHARS:
+            text = octets.decode()
+        else:
+            return f"{'.'.join(map(str, oid))}|{tag}x|{octets.hex()}"
+    else:
+        text = value.prettyPrint()
+    return f"{'.'.join(map(str, oid))}|{tag}|{text}"
+
+
+def parse_snmprec_line(line: str) -> Tuple[Tuple[int, ...], rfc1902.ObjectSyntax]:
+    oid, tag, text = line.rstrip("\n").split("|", 2)
+    if tag.endswith("x"):
+        value = SNMPREC_TYPES[int(tag[:-1])](hexValue=text)
+    else:
+        value_type = SNMPREC_TYPES[int(tag)]
+        if value_type in (rfc1902.OctetString, rfc1902.ObjectName, rfc1902.IpAddress):
+            value = value_type(text)
+        else:
+            value = value_type(int(text))
+    return tuple(map(int, oid.split("."))), value
+
+
+def write_snapshot(path: str, var_binds: RecordedVarBinds) -> None:
+    """Write var-binds in the snmprec format, gzip compressed for .gz files."""
+    lines = [
+        format_snmprec_line(oid, var_binds[oid]) + "\n" for oid in sorted(var_binds)
+    ]
+    data = "".join(lines).encode()
+    write_atomic(path, gzip.compress(data) if path.endswith(".gz") else data)
+
+
+def read_snapshot(path: str) -> RecordedVarBinds:
+    with _open(path, "r") as snapshot_file:
+        return dict(
+            parse_snmprec_line(line)
+            for line in snapshot_file
+            if line.strip() and not line.startswith("#")
+        )
+
+
+class SnmpRecorder(object):
+    """Records every response var-bind received by the SNMP engine.
+
+    The snapshot written by the recorder is served by SnmpReplayAgent, so the
+    recorded autoload can be repeated without the device.
+    """
+
+    def __init__(self, snmp_service: SnmpService):
+        self._snmp_engine: SnmpEngine = snmp_service._snmp_engine
+        self.var_binds: RecordedVarBinds = {}
+        self.requests = Counter()
+        self.responses = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self) -> None:
+        self._snmp_engine.observer.registerObserver(self._on_request, "rfc3412.sendPdu")
+        self._snmp_engine.observer.registerObserver(
+            self._on_response, "rfc3412.receiveMessage:response"
+        )
+
+    def stop(self) -> None:
+        self._snmp_engine.observer.unregisterObserver(self._on_request)
+        self._snmp_engine.observer.unregisterObserver(self._on_response)
+
+    def save(self, path: str) -> None:
+        write_snapshot(path, self.var_binds)
+
+    def _on_request(self, snmp_engine, execpoint, variables, cb_ctx):
+        self.requests[variables["pdu"].__class__.__name__] += 1
+
+    def _on_response(self, snmp_engine, execpoint, variables, cb_ctx):
+        pdu = variables["pdu"]
+        self.responses += 1
+        # SNMPv1 errors echo the requested var-binds
+        if api.v2c.apiPDU.getErrorStatus(pdu):
+            return
+        for oid, value in api.v2c.apiPDU.getVarBinds(pdu):
+            if value.tagSet in SNMPREC_TAGS:
+                self.var_binds[tuple(oid)] = value
+
+    def __str__(self):
+        requests = ", ".join(
+            f"{count} {name}" for name, count in sorted(self.requests.items())
+        )
+        return (
+            f"{requests or 'no requests'}, {self.responses} responses, "
+            f"{len(self.var_binds)} var-binds recorded"
+        )
@@ -0,0 +1,545 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import socketserver
+import threading
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from pysnmp.smi.builder import MibBuilder
+
+from cloudshell.f5.snmp.mib_cache import F5MibCache
+
+if TYPE_CHECKING:
+    from logging import Logger
+    from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+    Oid = Tuple[int, ...]
+    TrapHandler = Callable[["SnmpTrap"], None]
+
+TRAP_MIBS = (
+    "SNMPv2-MIB",
+    "F5-BIGIP-COMMON-MIB",
+    "F5-BIGIP-SYSTEM-MIB",
+    "F5-BIGIP-LOCAL-MIB",
+)
+SYS_UP_TIME = (1, 3, 6, 1, 2, 1, 1, 3, 0)
+SNMP_TRAP_OID = (1, 3, 6, 1, 6, 3, 1, 1, 4, 1, 0)
+# SNMPv1 generic traps are mapped to snmpTraps.<generic trap + 1>, RFC 3584
+SNMP_TRAPS = (1, 3, 6, 1, 6, 3, 1, 1, 5)
+ENTERPRISE_SPECIFIC = 6
+
+# BER tags of the SNMP messages
+INTEGER = 0x02
+OCTET_STRING = 0x04
+OBJECT_IDENTIFIER = 0x06
+SEQUENCE = 0x30
+IP_ADDRESS = 0x40
+TIME_TICKS = 0x43
+OPAQUE = 0x44
+# Counter32, Gauge32, TimeTicks and Counter64
+UNSIGNED_TAGS = frozenset((0x41, 0x42, TIME_TICKS, 0x46))
+RESPONSE = 0xA2
+TRAP_V1 = 0xA4
+INFORM_REQUEST = 0xA6
+TRAP_V2 = 0xA7
+
+
+class MibSymbol(object):
+    """MIB object the OID belongs to, the names of its enumeration values."""
+
+    __slots__ = ("mib", "name", "oid", "named_values")
+
+    def __init__(self, mib: str, name: str, oid: Oid, named_values: Dict[int, str]):
+        self.mib = mib
+        self.name = name
+        self.oid = oid
+        self.named_values = named_values
+
+    def __str__(self):
+        return f"{self.mib}::{self.name}"
+
+
+class _TrieNode(object):
+    __slots__ = ("value", "children")
+
+    def __init__(self):
+        self.value = None
+        self.children: Dict[int, _TrieNode] = {}
+
+
+class OidTrie(object):
+    """Values by the OID, looked up by the longest prefix of the OID."""
+
+    def __init__(self):
+        self._root = _TrieNode()
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            if node.value is not None:
+                yield node.value
+            nodes.extend(node.children.values())
+
+    def add(self, oid: Iterable[int], value: Any) -> None:
+        node = self._root
+        for sub_id in oid:
+            child = node.children.get(sub_id)
+            if child is None:
+                child = node.children[sub_id] = _TrieNode()
+            node = child
+        if node.value is None:
+            self._size += 1
+        node.value = value
+
+    def get(self, oid: Iterable[int]) -> Any:
+        """Get the value of the exact OID, None if there is none."""
+        node = self._root
+        for sub_id in oid:
+            node = node.children.get(sub_id)
+            if node is None:
+                return None
+        return node.value
+
+    def find(self, oid: Oid) -> Tuple[Any, int]:
+        """Get the value of the longest prefix of the OID and the prefix length.
+
+        The value is None if no prefix has a value.
+        """
+        node = self._root
+        value, length = node.value, 0
+        for position, sub_id in enumerate(oid, 1):
+            node = node.children.get(sub_id)
+            if node is None:
+                break
+            if node.value is not None:
+                value, length = node.value, position
+        return value, length
+
+
+def build_mib_trie(mib_builder: MibBuilder, mibs: Iterable[str] = TRAP_MIBS) -> OidTrie:
+    """Build the trie of the MIB objects of the loaded MIBs."""
+    mib_builder.loadModules(*mibs)
+    (mib_node,) = mib_builder.importSymbols("SNMPv2-SMI", "MibNode")
+    trie = OidTrie()
+    for mib in mibs:
+        for name, symbol in mib_builder.mibSymbols[mib].items():
+            if not isinstance(symbol, mib_node):
+                continue
+            named_values = {}
+            if hasattr(symbol, "getSyntax"):
+                named_values = {
+                    int(value): value_name
+                    for value_name, value in getattr(
+                        symbol.getSyntax(), "namedValues", {}
+                    ).items()
+                }
+            oid = tuple(symbol.getName())
+            trie.add(oid, MibSymbol(mib, name, oid, named_values))
+    return trie
+
+
+def read_tlv(data: bytes, position: int) -> Tuple[int, int, int]:
+    """Read the BER tag and length, get the tag and the start and end of the value.
+
+    Only the single byte tags and the definite lengths SNMP uses are read.
+    """
+    tag = data[position]
+    length = data[position + 1]
+    position += 2
+    if length & 0x80:
+        count = length & 0x7F
+        if not count or count > 4:
+            raise ValueError(f"Unsupported length of the tag {tag:#x}")
+        length = int.from_bytes(data[position : position + count], "big")
+        position += count
+    end = position + length
+    if end > len(data):
+        raise ValueError(f"Truncated value of the tag {tag:#x}")
+    return tag, position, end
+
+
+def decode_oid(data: bytes) -> Oid:
+    if not data:
+        raise ValueError("Empty OID")
+    sub_ids = []
+    sub_id = 0
+    for byte in data:
+        sub_id = (sub_id << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            sub_ids.append(sub_id)
+            sub_id = 0
+    if data[-1] & 0x80:
+        raise ValueError("Truncated OID")
+    first = sub_ids[0]
+    if first < 80:
+        return (first // 40, first % 40, *sub_ids[1:])
+    return (2, first - 80, *sub_ids[1:])
+
+
+class NotificationMessage(object):
+    """SNMPv1/v2c message read with the minimal BER reader.
+
+    Notifications come in bursts, reading just the tags of the trap and the
+    inform PDUs is an order of magnitude faster than the generic ASN.1
+    decoding. pdu_tag is None for the other PDUs, var_binds are the OID,
+    the tag and the octets of the value. The snmpTrapOID and sysUpTime
+    var-binds of SNMPv2 and the SNMPv1 trap fields are oid and uptime,
+    SNMPv1 traps are translated to SNMPv2 OIDs as in RFC 3584.
+    """
+
+    __slots__ = (
+        "_data",
+        "_pdu_position",
+        "version",
+        "community",
+        "pdu_tag",
+        "oid",
+        "uptime",
+        "var_binds",
+    )
+
+    def __init__(self, data: bytes):
+        self._data = data
+        self.oid: Oid = ()
+        self.uptime = 0
+        self.var_binds: List[Tuple[Oid, int, bytes]] = []
+        self.pdu_tag: Optional[int] = None
+        tag, position, end = read_tlv(data, 0)
+        self._expect(tag, SEQUENCE)
+        tag, start, position = read_tlv(data, position)
+        self._expect(tag, INTEGER)
+        self.version = int.from_bytes(data[start:position], "big")
+        tag, start, position = read_tlv(data, position)
+        self._expect(tag, OCTET_STRING)
+        self.community = data[start:position]
+        self._pdu_position = position
+        pdu_tag, position, end = read_tlv(data, position)
+        if pdu_tag == TRAP_V1 and self.version == 0:
+            self._read_v1_trap(position, end)
+        elif pdu_tag in (TRAP_V2, INFORM_REQUEST) and self.version == 1:
+            self._read_v2_notification(position, end)
+        else:
+            return
+        self.pdu_tag = pdu_tag
+
+    def _read_v1_trap(self, position: int, end: int) -> None:
+        values = []
+        for expected in (OBJECT_IDENTIFIER, IP_ADDRESS, INTEGER, INTEGER, TIME_TICKS):
+            tag, start, position = read_tlv(self._data, position)
+            self._expect(tag, expected)
+            values.append(self._data[start:position])
+        enterprise, _, generic_trap, specific_trap, uptime = values
+        generic_trap = int.from_bytes(generic_trap, "big")
+        if generic_trap == ENTERPRISE_SPECIFIC:
+            specific_trap = int.from_bytes(specific_trap, "big")
+            self.oid = decode_oid(enterprise) + (0, specific_trap)
+        else:
+            self.oid = SNMP_TRAPS + (generic_trap + 1,)
+        self.uptime = int.from_bytes(uptime, "big")
+        self._read_var_binds(position, end)
+
+    def _read_v2_notification(self, position: int, end: int) -> None:
+        # request-id, error-status and error-index
+        for _ in range(3):
+            tag, _, position = read_tlv(self._data, position)
+            self._expect(tag, INTEGER)
+        self._read_var_binds(position, end)
+        var_binds = []
+        for oid, tag, value in self.var_binds:
+            if oid == SNMP_TRAP_OID and tag == OBJECT_IDENTIFIER:
+                self.oid = decode_oid(value)
+            elif oid == SYS_UP_TIME and tag == TIME_TICKS:
+                self.uptime = int.from_bytes(value, "big")
+            else:
+                var_binds.append((oid, tag, value))
+        self.var_binds = var_binds
+
+    def _read_var_binds(self, position: int, end: int) -> None:
+        data = self._data
+        tag, position, end = read_tlv(data, position)
+        self._expect(tag, SEQUENCE)
+        while position < end:
+            tag, position, var_bind_end = read_tlv(data, position)
+            self._expect(tag, SEQUENCE)
+            tag, start, position = read_tlv(data, position)
+            self._expect(tag, OBJECT_IDENTIFIER)
+            oid = decode_oid(data[start:position])
+            tag, start, position = read_tlv(data, position)
+            self.var_binds.append((oid, tag, data[start:position]))
+            position = var_bind_end
+
+    def get_response(self) -> bytes:
+        """Get the response to the inform, the same message with Response PDU."""
+        data = bytearray(self._data)
+        data[self._pdu_position] = RESPONSE
+        return bytes(data)
+
+    @staticmethod
+    def _expect(tag: int, expected: int) -> None:
+        if tag != expected:
+            raise ValueError(f"Unexpected tag {tag:#x} instead of {expected:#x}")
+
+
+class SnmpTrap(object):
+    """Notification received as SNMPv1 or SNMPv2c trap or inform.
+
+    var_binds are the name of the MIB object, the instance index and the
+    value, the values of the enumerations are their names. Unknown OIDs
+    are named by the dotted OID.
+    """
+
+    __slots__ = (
+        "source",
+        "version",
+        "community",
+        "is_inform",
+        "timestamp",
+        "uptime",
+        "oid",
+        "symbol",
+        "var_binds",
+    )
+
+    def __init__(
+        self,
+        source: Tuple[str, int],
+        version: int,
+        community: str,
+        oid: Oid,
+        symbol: Optional[MibSymbol],
+    ):
+        self.source = source
+        self.version = version
+        self.community = community
+        self.is_inform = False
+        self.timestamp = time.time()
+        self.uptime = 0
+        self.oid = oid
+        self.symbol = symbol
+        self.var_binds: List[Tuple[str, Oid, Any]] = []
+
+    @property
+    def name(self) -> str:
+        if self.symbol is not None and self.symbol.oid == self.oid:
+            return self.symbol.name
+        return ".".join(map(str, self.oid))
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Get the value of the first var-bind of the MIB object."""
+        for var_bind_name, _, value in self.var_binds:
+            if var_bind_name == name:
+                return value
+        return default
+
+    def __str__(self):
+        values = ", ".join(f"{name}={value!r}" for name, _, value in self.var_binds)
+        return f"{self.name} from {self.source[0]}: {values}"
+
+
+class _TrapRequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        data, sock = self.request
+        response = self.server.receiver.receive(data, self.client_address)
+        if response is not None:
+            sock.sendto(response, self.client_address)
+
+
+class _TrapServer(socketserver.UDPServer):
+    def __init__(self, receiver: F5TrapReceiver, address: Tuple[str, int]):
+        self.receiver = receiver
+        super(_TrapServer, self).__init__(address, _TrapRequestHandler)
+
+
+class F5TrapReceiver(object):
+    """Local SNMPv1/v2c trap and inform receiver dispatching to the handlers.
+
+    Trap OIDs and var-binds are resolved with the trie of the shipped MIBs
+    built once, so a trap costs the BER decoding and the dict lookups of
+    the OID sub-identifiers only. Handlers subscribe to a notification or
+    to any MIB subtree, e.g. bigipNotifications, the trap is dispatched to
+    the handlers of the longest subscribed prefix of its OID. Traps are
+    handled one by one in the receiving thread, the handlers are expected
+    to be quick. Informs are acknowledged after the dispatch.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        host: str = "0.0.0.0",
+        port: int = 162,
+        communities: Iterable[str] = None,
+        mib_cache: F5MibCache = None,
+    ):
+        """Trap receiver.
+
+        :param port: UDP port to listen on, any free port if 0
+        :param communities: accepted communities, any if not set
+        """
+        self._logger = logger
+        self._host = host
+        self._port = port
+        self._communities = set(communities) if communities is not None else None
+        mib_builder = MibBuilder()
+        (mib_cache or F5MibCache()).attach(mib_builder)
+        self.mib_trie = build_mib_trie(mib_builder)
+        self._symbols = {symbol.name: symbol for symbol in self.mib_trie}
+        self._handlers = OidTrie()
+        self._server: Optional[_TrapServer] = None
+        self.stats: Dict[str, int] = defaultdict(int)
+
+    def subscribe(self, name: Optional[str], handler: TrapHandler) -> None:
+        """Call the handler for the traps of the MIB object, all if None."""
+        oid = ()
+        if name is not None:
+            symbol = self._symbols.get(name)
+            if symbol is None:
+                raise ValueError(f"Unknown MIB object {name}")
+            oid = symbol.oid
+        handlers = self._handlers.get(oid)
+        if handlers is None:
+            handlers = []
+            self._handlers.add(oid, handlers)
+        handlers.append(handler)
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        if self._server:
+            return self._server.server_address
+        return self._host, self._port
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self) -> None:
+        self._server = _TrapServer(self, (self._host, self._port))
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def receive(self, whole_msg: bytes, source: Tuple[str, int]) -> Optional[bytes]:
+        """Dispatch the trap of the message, get the response to the inform."""
+        self.stats["received"] += 1
+        trap, response = self.parse(whole_msg, source)
+        if trap is None:
+            self.stats["dropped"] += 1
+            return
+        self.dispatch(trap)
+        return response
+
+    def parse(
+        self, whole_msg: bytes, source: Tuple[str, int]
+    ) -> Tuple[Optional[SnmpTrap], Optional[bytes]]:
+        """Get the trap of the message and the response if it's an inform."""
+        try:
+            message = NotificationMessage(whole_msg)
+        except (IndexError, ValueError) as e:
+            self._logger.debug(f"Malformed SNMP message from {source[0]}: {e}")
+            return None, None
+        if message.pdu_tag is None:
+            self._logger.debug(f"Not a notification from {source[0]}")
+            return None, None
+        community = message.community.decode("utf-8", "replace")
+        if self._communities is not None and community not in self._communities:
+            self._logger.debug(f"Unknown community of the trap from {source[0]}")
+            return None, None
+
+        symbol, _ = self.mib_trie.find(message.oid)
+        trap = SnmpTrap(source, message.version, community, message.oid, symbol)
+        trap.uptime = message.uptime
+        trap.is_inform = message.pdu_tag == INFORM_REQUEST
+        for oid, tag, value in message.var_binds:
+            symbol, length = self.mib_trie.find(oid)
+            if symbol is None:
+                name, index = ".".join(map(str, oid)), ()
+            else:
+                name, index = symbol.name, oid[length:]
+            try:
+                value = self._to_python(tag, value, symbol)
+            except (IndexError, ValueError) as e:
+                self._logger.debug(f"Malformed {name} value from {source[0]}: {e}")
+                return None, None
+            trap.var_binds.append((name, index, value))
+        response = message.get_response() if trap.is_inform else None
+        return trap, response
+
+    def _to_python(self, tag: int, value: bytes, symbol: Optional[MibSymbol]) -> Any:
+        if tag == INTEGER:
+            number = int.from_bytes(value, "big", signed=True)
+            if symbol is not None and symbol.named_values:
+                return symbol.named_values.get(number, number)
+            return number
+        if tag in UNSIGNED_TAGS:
+            return int.from_bytes(value, "big")
+        if tag == OCTET_STRING:
+            return value.decode("utf-8", "replace")
+        if tag == IP_ADDRESS:
+            return ".".join(map(str, value))
+        if tag == OBJECT_IDENTIFIER:
+            oid = decode_oid(value)
+            oid_symbol, length = self.mib_trie.find(oid)
+            if oid_symbol is None:
+                return ".".join(map(str, oid))
+            return ".".join([oid_symbol.name, *map(str, oid[length:])])
+        if tag == OPAQUE:
+            return value
+        # NULL and the exceptions noSuchObject, noSuchInstance, endOfMibView
+        return None
+
+    def dispatch(self, trap: SnmpTrap) -> None:
+        handlers, _ = self._handlers.find(trap.oid)
+        if not handlers:
+            self.stats["unhandled"] += 1
+            self._logger.debug(f"No handlers of {trap}")
+            return
+        self.stats["dispatched"] += 1
+        for handler in handlers:
+            try:
+                handler(trap)
+            except Exception:
+                self._logger.exception(f"Handler of {trap.name} failed")
+
+
+def main(args: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Receive the SNMP traps and informs and log them"
+    )
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=10162)
+    parser.add_argument(
+        "--community", action="append", help="accepted community, any if not set"
+    )
+    options = parser.parse_args(args)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logger = logging.getLogger(__name__)
+
+    receiver = F5TrapReceiver(
+        logger, options.host, options.port, communities=options.community
+    )
+    receiver.subscribe(None, lambda trap: logger.info(str(trap)))
+    with receiver:
+        logger.info(f"Receiving traps on {receiver.address[0]}:{receiver.address[1]}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
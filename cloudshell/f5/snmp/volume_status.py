@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+from pyasn1.type import univ
+
+from cloudshell.snmp.core.domain.snmp_oid import SnmpMibObject
+
+from cloudshell.f5.snmp.bulk_walker import AdaptiveBulkWalker
+from cloudshell.f5.snmp.index_codec import INTEGER, STRING, get_index_codec
+
+if TYPE_CHECKING:
+    from logging import Logger
+    from typing import Dict, Iterable, List, Optional, Tuple
+
+    from cloudshell.snmp.core.domain.snmp_response import SnmpResponse
+    from cloudshell.snmp.core.snmp_service import SnmpService
+
+    # slot and volume name
+    VolumeKey = Tuple[int, bytes]
+
+SYSTEM_MIB = "F5-BIGIP-SYSTEM-MIB"
+SW_VOLUME_ACTIVE = SnmpMibObject(SYSTEM_MIB, "sysSwVolumeActive")
+SW_STATUS_COLUMNS = (
+    SnmpMibObject(SYSTEM_MIB, "sysSwStatusProduct"),
+    SnmpMibObject(SYSTEM_MIB, "sysSwStatusVersion"),
+    SnmpMibObject(SYSTEM_MIB, "sysSwStatusBuild"),
+    SnmpMibObject(SYSTEM_MIB, "sysSwStatusActive"),
+)
+# both tables are indexed by the slot and the volume name
+VOLUME_INDEX = (INTEGER, STRING)
+VOLUME_NAME = re.compile(r"HD(?P<volume>\d+(\.\d+)?)")
+# BIGIP-16.1.3-0.0.12.iso, Hotfix-BIGIP-16.1.3.1-0.0.11-ENG.iso
+IMAGE_NAME = re.compile(r"BIGIP-(?P<version>\d+(\.\d+)+)-(?P<build>\d+(\.\d+)+)")
+
+
+def get_image_version(filename: str) -> Optional[Tuple[str, str]]:
+    """Get the version and the build of the image, None if the name is unknown."""
+    match = IMAGE_NAME.search(filename)
+    if match is None:
+        return
+    return match.group("version"), match.group("build")
+
+
+class F5SnmpVolumeStatus(object):
+    """Software volumes and their install status read over SNMP.
+
+    sysSwVolumeTable and sysSwStatusTable are walked instead of parsing
+    show sys software, get_volumes returns the same dict as
+    F5SysConfigActions.show_version_per_volume plus the product and the
+    build. The MIB has no install progress, a volume is complete once its
+    product and version are set and installing before, get_install_status
+    also checks they are the ones of the image being installed. Volumes of several
+    slots are merged, the volume is running if it's active on any slot and
+    complete if it's complete on all of them.
+    """
+
+    COMPLETE = "complete"
+    INSTALLING = "installing"
+    FAILED = "failed"
+
+    def __init__(self, snmp_service: SnmpService, logger: Logger):
+        self._snmp = snmp_service
+        self._logger = logger
+        self._bulk_walker = AdaptiveBulkWalker(snmp_service, logger)
+        self._index_codec = get_index_codec(VOLUME_INDEX)
+
+    def get_volumes(self) -> Optional[Dict[float, Dict[str, str]]]:
+        """Get the volumes by the number, None if the tables timed out."""
+        slot_volumes = self._get_slot_volumes()
+        if slot_volumes is None:
+            return None
+        volumes: Dict[float, Dict[str, str]] = {}
+        for number, slot_volume in slot_volumes:
+            volume = volumes.get(number)
+            if volume is None:
+                volumes[number] = dict(slot_volume)
+                continue
+            if slot_volume["is_running"] == "yes":
+                volume["is_running"] = "yes"
+            if slot_volume["status"] == self.INSTALLING:
+                volume["status"] = self.INSTALLING
+        return volumes
+
+    def get_install_status(
+        self, number: float, version: str, build: str
+    ) -> Optional[str]:
+        """Get the install status of the version and the build on the volume.
+
+        The volume is complete once every slot has them, failed if any slot
+        has other software installed. None if the tables timed out or the
+        volume isn't created yet.
+        """
+        slot_volumes = self._get_slot_volumes()
+        if slot_volumes is None:
+            return None
+        statuses = set()
+        for slot_number, slot_volume in slot_volumes:
+            if slot_number != number:
+                continue
+            if (
+                slot_volume["status"] == self.INSTALLING
+                or slot_volume["build"] == "none"
+            ):
+                statuses.add(self.INSTALLING)
+            elif (slot_volume["version"], slot_volume["build"]) == (version, build):
+                statuses.add(self.COMPLETE)
+            else:
+                statuses.add(self.FAILED)
+        for status in (self.FAILED, self.INSTALLING, self.COMPLETE):
+            if status in statuses:
+                return status
+        return None
+
+    def _get_slot_volumes(self) -> Optional[List[Tuple[float, Dict[str, str]]]]:
+        """Get the volumes of every slot with their number, None on timeout."""
+        results = self._bulk_walker.walk_available(
+            (SW_VOLUME_ACTIVE,) + SW_STATUS_COLUMNS, len(SW_STATUS_COLUMNS) + 1
+        )
+        if any(responses is None for responses in results):
+            self._logger.warning("Software volume tables walk timed out")
+            return None
+        volume_active, product, version, build, status_active = (
+            self._get_column(snmp_oid_obj, responses)
+            for snmp_oid_obj, responses in zip(
+                (SW_VOLUME_ACTIVE,) + SW_STATUS_COLUMNS, results
+            )
+        )
+
+        slot_volumes = []
+        for key in sorted(volume_active.keys() | product.keys()):
+            match = VOLUME_NAME.fullmatch(key[1].decode("utf-8", "replace"))
+            if match is None:
+                continue
+            volume_product = self._get_string(product, key)
+            volume_version = self._get_string(version, key)
+            is_running = bool(volume_active.get(key) or status_active.get(key))
+            is_complete = volume_product != "none" and volume_version != "none"
+            slot_volumes.append(
+                (
+                    float(match.group("volume")),
+                    {
+                        "volume": match.group("volume"),
+                        "product": volume_product,
+                        "version": volume_version,
+                        "build": self._get_string(build, key),
+                        "is_running": "yes" if is_running else "no",
+                        "status": self.COMPLETE if is_complete else self.INSTALLING,
+                    },
+                )
+            )
+        return slot_volumes
+
+    def _get_column(
+        self, snmp_oid_obj: SnmpMibObject, responses: Iterable[SnmpResponse]
+    ) -> Dict[VolumeKey, univ.Asn1Item]:
+        """Get the values of the column by the slot and the volume name."""
+        column_length = len(
+            univ.ObjectIdentifier(snmp_oid_obj.get_oid(self._snmp._snmp_engine))
+        )
+        column = {}
+        for response in responses:
+            index = tuple(response._raw_oid[column_length:])
+            try:
+                column[self._index_codec.split(index)] = response.raw_value
+            except IndexError:
+                self._logger.debug(f"Unexpected {snmp_oid_obj.object_name} {index}")
+        return column
+
+    @staticmethod
+    def _get_string(column: Dict[VolumeKey, univ.Asn1Item], key: VolumeKey) -> str:
+        value = column.get(key)
+        if value is None:
+            return "none"
+        return bytes(value).decode("utf-8", "replace").strip() or "none"
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import time
+from functools import partial
+from typing import TYPE_CHECKING
+
+from pyasn1.error import PyAsn1Error
+from pysnmp.proto import api
+from pysnmp.smi import view
+from pysnmp.smi.error import SmiError
+
+from cloudshell.f5.snmp.async_snmp import END_OF_WALK_TAGS
+
+if TYPE_CHECKING:
+    from typing import Dict, Iterable, List, Tuple
+
+    from cloudshell.snmp.core.snmp_service import SnmpService
+
+    Oid = Tuple[int, ...]
+
+GET_REQUEST_TAG_SET = api.v2c.GetRequestPDU.tagSet
+
+
+class TableWalkStats(object):
+    """SNMP requests sent for one table, column or scalar."""
+
+    def __init__(self, operation: str, name: str, oid: Oid):
+        """Table walk stats.
+
+        :param operation: "walk" for GETNEXT and GETBULK requests, "get" for GET
+        :param oid: OID of the MIB node the requests are attributed to
+        """
+        self.operation = operation
+        self.name = name
+        self.oid = oid
+        self.walks = 0
+        self.rows = 0
+        self.requests = 0
+        self.responses = 0
+        self.bytes = 0
+        self.elapsed = 0.0
+
+    @property
+    def timeouts(self) -> int:
+        return self.requests - self.responses
+
+    def as_dict(self) -> dict:
+        return {
+            "operation": self.operation,
+            "name": self.name,
+            "oid": ".".join(map(str, self.oid)),
+            "walks": self.walks,
+            "rows": self.rows,
+            "requests": self.requests,
+            "timeouts": self.timeouts,
+            "bytes": self.bytes,
+            "elapsed": round(self.elapsed, 3),
+        }
+
+    def __str__(self):
+        walks = f"{self.walks} walks, " if self.operation == "walk" else ""
+        return (
+            f"{self.operation} {self.name}: {walks}{self.rows} rows, "
+            f"{self.requests} requests, {self.timeouts} timeouts, "
+            f"{self.bytes} bytes, {self.elapsed:.2f}s"
+        )
+
+
+class WalkSummary(object):
+    """Per table SNMP stats of the autoload, the slowest tables first."""
+
+    def __init__(self, tables: Iterable[TableWalkStats], elapsed: float):
+        """Walk summary.
+
+        :param elapsed: wall time of the autoload, the time of the tables
+            overlaps when they are walked concurrently
+        """
+        self.tables: List[TableWalkStats] = sorted(
+            tables, key=lambda stats: stats.elapsed, reverse=True
+        )
+        self.elapsed = elapsed
+
+    @property
+    def total_requests(self) -> int:
+        return sum(stats.requests for stats in self.tables)
+
+    @property
+    def total_timeouts(self) -> int:
+        return sum(stats.timeouts for stats in self.tables)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(stats.bytes for stats in self.tables)
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.total_requests,
+            "timeouts": self.total_timeouts,
+            "bytes": self.total_bytes,
+            "elapsed": round(self.elapsed, 3),
+            "tables": [stats.as_dict() for stats in self.tables],
+        }
+
+    def __str__(self):
+        lines = [
+            f"SNMP requests of {len(self.tables)} tables: {self.total_requests} "
+            f"requests, {self.total_timeouts} timeouts, {self.total_bytes} bytes "
+            f"in {self.elapsed:.2f}s"
+        ]
+        lines.extend(f"  {stats}" for stats in self.tables)
+        return "\n".join(lines)
+
+
+class WalkStatsRecorder(object):
+    """Attributes the SNMP requests of the engine to the tables they read.
+
+    Every walk is attributed to the MIB node it starts from, its GETNEXT and
+    GETBULK requests are followed by the OID they continue from, so walks
+    running concurrently are told apart. GET requests are attributed to the
+    column or the scalar of the instance. Bytes are the sizes of the SNMP
+    messages sent and received. Requests sent by other means, e.g. by the
+    asyncio client, are passed to record_request and record_response.
+
+    The stats accumulate over the start and stop calls, elapsed is the time
+    the recorder was started.
+    """
+
+    def __init__(self, snmp_service: SnmpService):
+        self._snmp_engine = snmp_service._snmp_engine
+        self._tables: Dict[Tuple[str, Oid], TableWalkStats] = {}
+        # request ID -> stats, subtree of the walk, time of the first send
+        self._in_flight: Dict[int, Tuple[TableWalkStats, Oid, float]] = {}
+        # OID the next request of the walk continues from -> stats, subtree
+        self._walks: Dict[Oid, Tuple[TableWalkStats, Oid]] = {}
+        self._observers = ()
+        self._start_time = None
+        self._elapsed = 0.0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self) -> None:
+        if self._start_time is not None:
+            return
+        self._start_time = time.time()
+        # the observer refuses callbacks registered before even if they were
+        # unregistered, new ones are registered on every start
+        self._observers = partial(self._on_request), partial(self._on_response)
+        self._snmp_engine.observer.registerObserver(
+            self._observers[0], "rfc3412.sendPdu"
+        )
+        self._snmp_engine.observer.registerObserver(
+            self._observers[1], "rfc3412.receiveMessage:response"
+        )
+
+    def stop(self) -> None:
+        if self._start_time is None:
+            return
+        for observer in self._observers:
+            self._snmp_engine.observer.unregisterObserver(observer)
+        self._observers = ()
+        self._elapsed += time.time() - self._start_time
+        self._start_time = None
+
+    @property
+    def summary(self) -> WalkSummary:
+        elapsed = self._elapsed
+        if self._start_time is not None:
+            elapsed += time.time() - self._start_time
+        return WalkSummary(self._tables.values(), elapsed)
+
+    def record_request(self, pdu, size: int) -> None:
+        """Record the request PDU sent in the message of the size."""
+        request_id = int(api.v2c.apiPDU.getRequestID(pdu))
+        if request_id in self._in_flight:
+            # retransmission of the request which timed out
+            stats, _, _ = self._in_flight[request_id]
+        else:
+            var_binds = api.v2c.apiPDU.getVarBinds(pdu)
+            if not var_binds:
+                return
+            oid = tuple(var_binds[0][0])
+            if pdu.tagSet == GET_REQUEST_TAG_SET:
+                stats, subtree = self._get_stats("get", oid), oid
+            else:
+                stats, subtree = self._walks.pop(oid, (None, None))
+                if stats is None:
+                    stats, subtree = self._get_stats("walk", oid), oid
+                    stats.walks += 1
+            self._in_flight[request_id] = stats, subtree, time.time()
+        stats.requests += 1
+        stats.bytes += size
+
+    def record_response(self, pdu, size: int) -> None:
+        """Record the response PDU received in the message of the size."""
+        request = self._in_flight.pop(int(api.v2c.apiPDU.getRequestID(pdu)), None)
+        if request is None:
+            return
+        stats, subtree, send_time = request
+        stats.responses += 1
+        stats.bytes += size
+        stats.elapsed += time.time() - send_time
+        # SNMPv1 errors echo the requested var-binds
+        if api.v2c.apiPDU.getErrorStatus(pdu):
+            return
+
+        length = len(subtree)
+        last_oid = None
+        for oid, value in api.v2c.apiPDU.getVarBinds(pdu):
+            oid = tuple(oid)
+            if value.tagSet in END_OF_WALK_TAGS or oid[:length] != subtree:
+                continue
+            stats.rows += 1
+            last_oid = oid
+        if last_oid and stats.operation == "walk":
+            self._walks[last_oid] = stats, subtree
+
+    def _on_request(self, snmp_engine, execpoint, variables, cb_ctx):
+        self.record_request(variables["pdu"], len(variables["outgoingMessage"]))
+
+    def _on_response(self, snmp_engine, execpoint, variables, cb_ctx):
+        self.record_response(variables["pdu"], len(variables["wholeMsg"]))
+
+    def _get_stats(self, operation: str, oid: Oid) -> TableWalkStats:
+        name, node_oid = self._get_node(oid, instance=operation == "get")
+        key = operation, node_oid
+        stats = self._tables.get(key)
+        if stats is None:
+            stats = self._tables[key] = TableWalkStats(operation, name, node_oid)
+        return stats
+
+    def _get_node(self, oid: Oid, instance: bool) -> Tuple[str, Oid]:
+        """Get the name and the OID of the MIB node of the OID.
+
+        :param instance: the OID is an instance of the node
+        """
+        view_controller = self._snmp_engine.getUserContext("mibViewController")
+        if view_controller is None:
+            # created the same way the OIDs of the SNMP service are resolved
+            view_controller = view.MibViewController(self._snmp_engine.getMibBuilder())
+            self._snmp_engine.setUserContext(mibViewController=view_controller)
+        try:
+            node_oid, _, suffix = view_controller.getNodeNameByOid(oid)
+            mib_name, symbol, _ = view_controller.getNodeLocation(node_oid)
+        except (PyAsn1Error, SmiError):
+            # an unknown OID, group the instances by the parent
+            node_oid = oid[:-1] if instance and len(oid) > 1 else oid
+            return ".".join(map(str, node_oid)), node_oid
+        if not instance and suffix:
+            # a walk from the middle of the subtree
+            return ".".join(map(str, oid)), oid
+        return f"{mib_name}::{symbol}", tuple(node_oid)
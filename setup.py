@@ -18,6 +18,7 @@ setup(
     author_email="info@qualisystems.com",
     packages=find_packages(),
     install_requires=required,
+    extras_require={"stats": ["numpy>=1.17"]},
     python_requires="~=3.7",
     test_suite="tests",
     tests_require=required_for_tests,
@@ -0,0 +1,112 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from cloudshell.shell.core.driver_context import (
+    AutoLoadAttribute,
+    AutoLoadDetails,
+    AutoLoadResource,
+)
+
+from cloudshell.f5.autoload.autoload_cache import AUTOLOAD_CACHE_DIR_ENV, AutoloadCache
+
+
+class TestAutoloadCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.autoload_cache = AutoloadCache(self._tmp_dir.name)
+        resource_model = Mock(
+            shell_name="F5 BIG-IP Shell", family_name="CS_Router", cs_resource_id="1"
+        )
+        resource_model.name = "bigip"
+        self.resource_model = resource_model
+        self.key = self.autoload_cache.get_key("192.168.1.1", resource_model)
+        self.markers = {
+            "boot_time": 1600000000.0,
+            "if_table_last_change": 100,
+            "interface_number": 4,
+        }
+        self.details = AutoLoadDetails(
+            [AutoLoadResource("GenericPort", "1.1", "CH0/P1", "uid")],
+            [AutoLoadAttribute("CH0/P1", "GenericPort.MTU", "1500")],
+        )
+        self.autoload_cache.store(self.key, self.markers, self.details)
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_get(self):
+        markers = dict(self.markers, boot_time=self.markers["boot_time"] + 1)
+        details = self.autoload_cache.get(self.key, markers)
+
+        self.assertEqual(
+            [vars(resource) for resource in details.resources],
+            [vars(resource) for resource in self.details.resources],
+        )
+        self.assertEqual(
+            [vars(attribute) for attribute in details.attributes],
+            [vars(attribute) for attribute in self.details.attributes],
+        )
+
+    def test_device_changed(self):
+        for name, value in (
+            ("boot_time", self.markers["boot_time"] + 3600),
+            ("if_table_last_change", 200),
+            ("interface_number", 5),
+        ):
+            markers = dict(self.markers, **{name: value})
+            self.assertIsNone(self.autoload_cache.get(self.key, markers))
+
+    def test_invalidate(self):
+        self.autoload_cache.invalidate(self.key)
+        self.assertIsNone(self.autoload_cache.get(self.key, self.markers))
+
+    def test_malformed_entry(self):
+        path = os.path.join(self._tmp_dir.name, self.key + ".json")
+        for data in (
+            [],
+            {"markers": self.markers},
+            {"markers": self.markers, "resources": [{"name": "1.1"}]},
+        ):
+            with open(path, "w") as cache_file:
+                json.dump(data, cache_file)
+            self.assertIsNone(self.autoload_cache.get(self.key, self.markers))
+
+    def test_user_cache_dir(self):
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": self._tmp_dir.name}):
+            os.environ.pop(AUTOLOAD_CACHE_DIR_ENV, None)
+            self.assertEqual(
+                os.path.dirname(AutoloadCache().cache_dir), self._tmp_dir.name
+            )
+
+    @unittest.skipUnless(hasattr(os, "getuid"), "POSIX permissions")
+    def test_skip_shared_cache_dir(self):
+        os.chmod(self._tmp_dir.name, 0o777)
+        autoload_cache = AutoloadCache(self._tmp_dir.name)
+
+        self.assertFalse(autoload_cache.is_private)
+        self.assertIsNone(autoload_cache.get(self.key, self.markers))
+        autoload_cache.invalidate(self.key)
+        key = autoload_cache.get_key("192.168.1.2", self.resource_model)
+        autoload_cache.store(key, self.markers, self.details)
+        self.assertEqual(os.listdir(self._tmp_dir.name), [self.key + ".json"])
+
+    def test_key_of_discovery_options(self):
+        options = {"port_engine": "if-mib", "supported_os": ["BIG-IP"]}
+        key = self.autoload_cache.get_key("192.168.1.1", self.resource_model, **options)
+
+        self.assertNotEqual(key, self.key)
+        self.assertEqual(
+            key,
+            self.autoload_cache.get_key(
+                "192.168.1.1", self.resource_model, **dict(reversed(options.items()))
+            ),
+        )
+        self.assertNotEqual(
+            key,
+            self.autoload_cache.get_key(
+                "192.168.1.1", self.resource_model, **dict(options, port_engine="sys")
+            ),
+        )
@@ -0,0 +1,87 @@
+import unittest
+
+from cloudshell.shell.standards.networking.autoload_model import NetworkingResourceModel
+
+from cloudshell.f5.autoload.autoload_stages import (
+    AutoloadStage,
+    StagedDetailsBuilder,
+    merge_details,
+)
+
+
+class TestStagedDetailsBuilder(unittest.TestCase):
+    def setUp(self):
+        self.model = NetworkingResourceModel(
+            "bigip", "F5 BIG-IP Shell", "CS_Router", cs_resource_id="id"
+        )
+        self.model.vendor = "F5"
+        entities = self.model.entities
+        self.chassis = entities.Chassis(index="1")
+        self.model.connect_chassis(self.chassis)
+        module = entities.Module(index="1")
+        self.chassis.connect_module(module)
+        module.connect_port(entities.Port(index="1", name="1.1"))
+        # filtered out like by the resource model build
+        self.chassis.connect_module(entities.Module(index="2"))
+        self.chassis.connect_port(entities.Port(index="2", name="mgmt"))
+        self.builder = StagedDetailsBuilder(self.model)
+
+    def test_stages_build_the_model(self):
+        stages = [self.builder.build_root()]
+        stages.extend(
+            details
+            for _, details in self.builder.iter_stages(
+                AutoloadStage.CHASSIS, AutoloadStage.MODULES, AutoloadStage.PORTS
+            )
+        )
+        self.model.connect_port_channel(
+            self.model.entities.PortChannel(index="1", name="trunk1")
+        )
+        stages.append(self.builder.build_stage(AutoloadStage.PORT_CHANNELS))
+
+        details = merge_details(*stages)
+        expected = self.model.build(filter_empty_modules=True, use_new_unique_id=True)
+        for name in ("resources", "attributes"):
+            self.assertCountEqual(
+                map(vars, getattr(details, name)), map(vars, getattr(expected, name))
+            )
+
+    def test_stage_resources(self):
+        stages = dict(
+            self.builder.iter_stages(
+                AutoloadStage.CHASSIS, AutoloadStage.MODULES, AutoloadStage.PORTS
+            )
+        )
+
+        self.assertEqual(
+            [
+                resource.relative_address
+                for resource in stages[AutoloadStage.PORTS].resources
+            ],
+            ["CH1/M1/P1", "CH1/P2"],
+        )
+        self.assertEqual(
+            [
+                resource.relative_address
+                for resource in stages[AutoloadStage.MODULES].resources
+            ],
+            ["CH1/M1"],
+        )
+
+    def test_resources_built_once(self):
+        self.builder.build_stage(AutoloadStage.PORTS)
+        self.chassis.connect_port(self.model.entities.Port(index="3", name="1.3"))
+
+        details = self.builder.build_stage(AutoloadStage.PORTS)
+
+        self.assertEqual([resource.name for resource in details.resources], ["1.3"])
+
+    def test_empty_stages_skipped(self):
+        stages = [
+            stage
+            for stage, _ in self.builder.iter_stages(
+                AutoloadStage.PORT_CHANNELS, AutoloadStage.CHASSIS
+            )
+        ]
+
+        self.assertEqual(stages, [AutoloadStage.CHASSIS])
@@ -0,0 +1,91 @@
+import unittest
+
+from pysnmp.proto import rfc1902
+
+from cloudshell.f5.autoload.cluster_table import (
+    CLUSTER_INDEX,
+    CLUSTER_MEMBER_INDEX,
+    MULTI_HOST_INDEX,
+    F5ClusterTable,
+    get_port_slot_id,
+)
+from cloudshell.f5.snmp.index_codec import join_index
+from cloudshell.f5.snmp.mib_profile import MibProfile
+from cloudshell.f5.snmp.volume_status import VOLUME_INDEX
+
+from tests.f5.replay import replay_snmp_service
+
+F5_SYSTEM = (1, 3, 6, 1, 4, 1, 3375, 2, 1)
+DEFAULT = join_index(("default",), CLUSTER_INDEX)
+VM = join_index(("vm",), MULTI_HOST_INDEX)
+
+
+def _get_var_binds():
+    var_binds = {
+        F5_SYSTEM + (10, 1, 2, 1, 15) + DEFAULT: rfc1902.Integer32(1),
+        # a host which isn't a blade
+        F5_SYSTEM + (7, 4, 2, 1, 2) + VM: rfc1902.Counter64(1),
+    }
+    for slot_id in (1, 3):
+        member = join_index(("default", slot_id), CLUSTER_MEMBER_INDEX)
+        state = 3 if slot_id == 1 else 1
+        var_binds[F5_SYSTEM + (10, 2, 2, 1, 3) + member] = rfc1902.Integer32(1)
+        var_binds[F5_SYSTEM + (10, 2, 2, 1, 8) + member] = rfc1902.Integer32(state)
+        host = join_index((f"blade{slot_id}",), MULTI_HOST_INDEX)
+        var_binds[F5_SYSTEM + (7, 4, 2, 1, 2) + host] = rfc1902.Counter64(2**30)
+        for cpu in range(1, slot_id * 2 + 1):
+            var_binds[F5_SYSTEM + (7, 5, 2, 1, 3) + host + (cpu,)] = rfc1902.Integer32(
+                cpu
+            )
+        for volume, version, active in (("HD1.1", "16.1.3", 0), ("HD1.2", "17.1.0", 1)):
+            index = join_index((slot_id, volume), VOLUME_INDEX)
+            var_binds[F5_SYSTEM + (9, 4, 2, 1, 3) + index] = rfc1902.OctetString(
+                "BIG-IP"
+            )
+            var_binds[F5_SYSTEM + (9, 4, 2, 1, 4) + index] = rfc1902.OctetString(
+                version
+            )
+            var_binds[F5_SYSTEM + (9, 4, 2, 1, 6) + index] = rfc1902.Integer32(active)
+    return var_binds
+
+
+class TestGetPortSlotId(unittest.TestCase):
+    def test_blade_port(self):
+        self.assertEqual(get_port_slot_id("2/1.3"), 2)
+
+    def test_appliance_port(self):
+        self.assertIsNone(get_port_slot_id("1.3"))
+        self.assertIsNone(get_port_slot_id("mgmt"))
+
+
+class TestF5ClusterTable(unittest.TestCase):
+    def _get_table(self, var_binds):
+        with replay_snmp_service(var_binds, MibProfile.AUTOLOAD) as (
+            snmp_service,
+            logger,
+        ):
+            table = F5ClusterTable(snmp_service, logger, max_concurrency=4)
+            table.load_blade_tables()
+        return table
+
+    def test_blades(self):
+        table = self._get_table(_get_var_binds())
+
+        self.assertEqual(table.primary_slots, {"default": 1})
+        self.assertEqual(sorted(table.blades), [1, 3])
+        blade = table.blades[3]
+        self.assertEqual(blade.cluster_name, "default")
+        self.assertEqual(blade.host_id, "blade3")
+        self.assertEqual(blade.state, "quorumwait")
+        self.assertEqual(blade.availability, "green")
+        self.assertEqual(blade.memory, 2**30)
+        self.assertEqual(blade.cpu_count, 6)
+        self.assertEqual((blade.product, blade.version), ("BIG-IP", "17.1.0"))
+        self.assertEqual(table.blades[1].cpu_count, 2)
+        self.assertEqual(table.blades[1].state, "running")
+
+    def test_not_clustered(self):
+        table = self._get_table({(1, 3, 6, 1, 2, 1, 1, 5, 0): rfc1902.OctetString("")})
+
+        self.assertEqual(table.blades, {})
+        self.assertEqual(table.blade_columns, [])
@@ -0,0 +1,38 @@
+from unittest import TestCase
+
+from cloudshell.f5.autoload.port_classifier import PortClassifier
+
+
+class TestPortClassifier(TestCase):
+    def setUp(self):
+        self.classifier = PortClassifier(
+            ["port-channel", "bundle"], ["mgmt", "loopback", "a.b"]
+        )
+
+    def test_classify(self):
+        self.assertEqual(self.classifier.classify("1.1"), PortClassifier.PORT)
+        self.assertEqual(
+            self.classifier.classify("Port-Channel1"), PortClassifier.PORT_CHANNEL
+        )
+        self.assertEqual(self.classifier.classify("MGMT"), PortClassifier.EXCLUDED)
+        # names are matched literally
+        self.assertEqual(self.classifier.classify("aXb"), PortClassifier.PORT)
+
+    def test_port_channel_precedes_exclude(self):
+        self.assertEqual(
+            self.classifier.classify("bundle-mgmt"), PortClassifier.PORT_CHANNEL
+        )
+
+    def test_empty_lists(self):
+        classifier = PortClassifier([], [""])
+        self.assertEqual(classifier.classify("mgmt"), PortClassifier.PORT)
+
+    def test_is_configured_with(self):
+        self.assertTrue(
+            self.classifier.is_configured_with(
+                ("port-channel", "bundle"), ["mgmt", "loopback", "a.b"]
+            )
+        )
+        self.assertFalse(
+            self.classifier.is_configured_with(["port-channel", "bundle"], ["mgmt"])
+        )
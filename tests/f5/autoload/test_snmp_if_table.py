@@ -0,0 +1,65 @@
+import unittest
+from unittest.mock import Mock
+
+from cloudshell.snmp.autoload.constants import port_constants
+
+from cloudshell.f5.autoload.snmp_if_table import F5IfPort, F5IfPortChannel
+
+
+class TestF5IfPort(unittest.TestCase):
+    def setUp(self):
+        self.snmp = Mock()
+        self.snmp.get_property.side_effect = lambda oid: Mock(
+            safe_value=f"{oid.object_name}.{oid.index}"
+        )
+        port_name_response = Mock(
+            index="7", mib_id=port_constants.PORT_DESCR_NAME.mib_id, safe_value="1.1"
+        )
+        self.port = F5IfPort(self.snmp, Mock(), port_name_response, Mock())
+
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(self.port, "__dict__"))
+
+    def test_name_from_response(self):
+        self.assertEqual(self.port.if_index, "7")
+        self.assertEqual(self.port.if_descr_name, "1.1")
+        self.snmp.get_property.assert_not_called()
+
+    def test_column_read_once(self):
+        self.assertEqual(self.port.if_mtu, "ifMtu.7")
+        self.assertEqual(self.port.if_mtu, "ifMtu.7")
+        self.assertEqual(self.port.if_name, "ifName.7")
+        self.assertEqual(self.port.port_name, "ifName.7")
+        self.assertEqual(self.snmp.get_property.call_count, 2)
+
+    def test_missing_column_read_once(self):
+        self.snmp.get_property.side_effect = None
+        self.snmp.get_property.return_value = Mock(safe_value="")
+
+        self.assertEqual(self.port.if_type, "other")
+        self.assertEqual(self.port.if_speed, "")
+        self.assertEqual(self.port.if_speed, "")
+        self.assertEqual(self.port.if_type, "other")
+        self.assertEqual(self.snmp.get_property.call_count, 2)
+
+    def test_if_type(self):
+        self.snmp.get_property.side_effect = None
+        self.snmp.get_property.return_value = Mock(safe_value="'ethernetCsmacd'")
+
+        self.assertEqual(self.port.if_type, "ethernetCsmacd")
+
+
+class TestF5IfPortChannel(unittest.TestCase):
+    def test_associated_ports(self):
+        attributes = Mock(
+            port_channel_ports={
+                "1": {"dot3adAggPortAttachedAggID": Mock(safe_value="9")},
+                "2": {"dot3adAggPortAttachedAggID": Mock(safe_value="8")},
+            }
+        )
+        port_name_response = Mock(index="9", mib_id="ifName", safe_value="trunk1")
+        port_channel = F5IfPortChannel(Mock(), Mock(), port_name_response, attributes)
+
+        self.assertEqual(port_channel.if_name, "trunk1")
+        self.assertEqual(port_channel.associated_port_list, ["1"])
+        self.assertFalse(hasattr(port_channel, "__dict__"))
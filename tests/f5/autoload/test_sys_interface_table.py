@@ -0,0 +1,55 @@
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+
+from cloudshell.f5.autoload.sys_interface_table import (
+    F5SysInterfacePort,
+    F5SysInterfaceTable,
+)
+
+
+class TestF5SysInterfacePort(unittest.TestCase):
+    def test_port_attributes(self):
+        row = {
+            "sysInterfaceMacAddr": Mock(safe_value="00:01:d7:00:00:01"),
+            "sysInterfaceMtu": Mock(safe_value="9198"),
+            "sysInterfaceMediaActiveSpeed": Mock(safe_value="1000"),
+            "sysInterfaceMediaActiveDuplex": Mock(safe_value="full"),
+            "sysIfxStatHighSpeed": Mock(safe_value="0"),
+            "sysIfxStatAlias": Mock(safe_value="uplink"),
+            "sysInterfaceStatus": Mock(safe_value="up"),
+        }
+        port = F5SysInterfacePort("1.1", row)
+
+        self.assertEqual(port.if_index, "1-1")
+        self.assertEqual(port.port_name, "1.1")
+        self.assertEqual(port.if_mac, "00:01:d7:00:00:01")
+        self.assertEqual(port.if_mtu, "9198")
+        self.assertEqual(port.if_speed, 1000000000)
+        self.assertEqual(port.duplex, "Full")
+        self.assertEqual(port.if_port_description, "uplink")
+        self.assertEqual(port.status, "up")
+
+    def test_missing_columns(self):
+        port = F5SysInterfacePort("1.2", {})
+
+        self.assertEqual(port.if_mtu, 0)
+        self.assertEqual(port.if_speed, 0)
+        self.assertEqual(port.duplex, "Half")
+
+
+class TestF5SysInterfaceTable(unittest.TestCase):
+    @patch.object(F5SysInterfaceTable, "_load_snmp_tables")
+    def test_if_entities_loaded_once(self, load_snmp_tables):
+        table = F5SysInterfaceTable(Mock(), MagicMock())
+        table._sys_interface_table = {
+            "1.1": {"sysInterfaceName": Mock(safe_value="1.1")},
+            "1.2": {"sysInterfaceName": Mock(safe_value="1.2")},
+        }
+        table._trunk_table = Mock(**{"get_port_channels.return_value": {}})
+
+        self.assertEqual(list(table.if_ports), ["1-1", "1-2"])
+        # no trunks, the empty port channels don't load the ports again
+        self.assertEqual(table.if_port_channels, {})
+        self.assertEqual(table.if_port_channels, {})
+        self.assertEqual(table._unmapped_ports_list, ["1-1", "1-2"])
+        table._trunk_table.get_port_channels.assert_called_once()
@@ -0,0 +1,67 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from pyasn1.type import univ
+
+from cloudshell.f5.autoload.trunk_table import TRUNK_MEMBER_INDEX, F5TrunkTable
+from cloudshell.f5.snmp.index_codec import join_index
+
+MEMBER_NAME = "1.3.6.1.4.1.3375.2.1.2.12.3.2.1.1"
+
+
+class TestF5TrunkTable(unittest.TestCase):
+    def setUp(self):
+        with patch.object(F5TrunkTable, "_load_snmp_tables"):
+            self.table = F5TrunkTable(Mock(), Mock())
+        self.table.trunks.update(
+            {
+                "trunk1": {"sysTrunkOperBw": Mock(safe_value="20000")},
+                "uplink": {},
+                "ha/1": {},
+            }
+        )
+        self.table.members.update({"trunk1": ["1.2", "1.1", "mgmt"]})
+
+    def test_iter_indexed(self):
+        snmp_oid_obj = Mock(object_name="sysTrunkCfgMemberName")
+        snmp_oid_obj.get_oid.return_value = MEMBER_NAME
+        responses = [
+            Mock(_raw_oid=univ.ObjectIdentifier(MEMBER_NAME) + index)
+            for index in (
+                join_index(("trunk1", "1.1"), TRUNK_MEMBER_INDEX),
+                join_index(("trünk", ""), TRUNK_MEMBER_INDEX),
+                # the member name is truncated
+                join_index(("trunk1", "1.2"), TRUNK_MEMBER_INDEX)[:-1],
+            )
+        ]
+
+        self.assertEqual(
+            [
+                names
+                for names, _ in self.table._iter_indexed(
+                    snmp_oid_obj, responses, TRUNK_MEMBER_INDEX
+                )
+            ],
+            [("trunk1", "1.1"), ("trünk", "")],
+        )
+
+    def test_get_port_channels(self):
+        ports = {"1.1": Mock(if_index="11"), "1.2": Mock(if_index="12")}
+
+        port_channels = self.table.get_port_channels(ports)
+
+        self.assertEqual(sorted(port_channels), ["ha/1", "trunk1", "uplink"])
+        trunk = port_channels["trunk1"]
+        self.assertEqual(trunk.associated_port_list, ["11", "12"])
+        self.assertEqual(trunk.if_speed, "20000")
+        self.assertEqual(port_channels["uplink"].associated_port_list, [])
+
+    def test_port_channel_ids(self):
+        self.table.trunks["uplink1"] = {}
+
+        port_channels = self.table.get_port_channels({})
+
+        self.assertEqual(port_channels["trunk1"].port_channel_id, "trunk1")
+        self.assertEqual(port_channels["uplink1"].port_channel_id, "uplink1")
+        self.assertEqual(port_channels["ha/1"].port_channel_id, "ha-1")
+        self.assertEqual(port_channels["uplink"].port_channel_id, "uplink")
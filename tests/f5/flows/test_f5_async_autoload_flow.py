@@ -0,0 +1,63 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from pysnmp.proto.errind import requestTimedOut
+
+from cloudshell.shell.standards.networking.autoload_model import NetworkingResourceModel
+from cloudshell.snmp.snmp_parameters import SNMPReadParameters
+
+from cloudshell.f5.flows.f5_async_autoload_flow import AsyncBigIPAutoloadFlow
+from cloudshell.f5.flows.f5_autoload_flow import BigIPAutoloadFlow
+from cloudshell.f5.snmp.async_snmp import AsyncSnmpClient
+
+from tests.f5.flows.test_f5_autoload_flow import IF_X_ENTRY, _get_var_binds
+from tests.f5.replay import replay_configurator
+
+
+def _get_resource_model():
+    return NetworkingResourceModel("bigip", "F5 BIG-IP Shell", "CS_Router")
+
+
+def _to_dicts(details):
+    return (
+        sorted((vars(resource) for resource in details.resources), key=str),
+        sorted((vars(attribute) for attribute in details.attributes), key=str),
+    )
+
+
+class TestAsyncBigIPAutoloadFlow(unittest.TestCase):
+    def _discover(self, version):
+        with replay_configurator(_get_var_binds()) as (snmp_configurator, logger):
+            expected = BigIPAutoloadFlow(snmp_configurator, logger).discover(
+                ["BIG-IP"], _get_resource_model()
+            )
+            host, port = snmp_configurator._agent.address
+            flow = AsyncBigIPAutoloadFlow(
+                SNMPReadParameters(host, "public", version=version, port=port),
+                logger,
+                timeout=0.5,
+            )
+            details = asyncio.run(flow.discover(["BIG-IP"], _get_resource_model()))
+        return expected, details
+
+    def test_discover_as_sync_flow(self):
+        for version in ("2", "1"):
+            expected, details = self._discover(version)
+            self.assertEqual(_to_dicts(details), _to_dicts(expected))
+
+    def test_failed_column_left_to_snmp_service(self):
+        walk = AsyncSnmpClient.walk
+        walked = []
+
+        async def walk_if_name_fails(client, oid):
+            walked.append(tuple(oid))
+            if tuple(oid) == IF_X_ENTRY + (1,):
+                raise requestTimedOut
+            return await walk(client, oid)
+
+        with patch.object(AsyncSnmpClient, "walk", walk_if_name_fails):
+            expected, details = self._discover("2")
+
+        self.assertIn(IF_X_ENTRY + (1,), walked)
+        self.assertEqual(_to_dicts(details), _to_dicts(expected))
@@ -0,0 +1,58 @@
+import unittest
+
+from pysnmp.proto import rfc1902
+
+from cloudshell.shell.standards.networking.autoload_model import NetworkingResourceModel
+
+from cloudshell.f5.flows.f5_autoload_flow import BigIPAutoloadFlow
+from cloudshell.f5.snmp.mib_profile import MibProfile
+
+from tests.f5.replay import replay_configurator
+
+SYSTEM = (1, 3, 6, 1, 2, 1, 1)
+IF_ENTRY = (1, 3, 6, 1, 2, 1, 2, 2, 1)
+IF_X_ENTRY = (1, 3, 6, 1, 2, 1, 31, 1, 1, 1)
+IP_ADDR_ENTRY = (1, 3, 6, 1, 2, 1, 4, 20, 1)
+
+
+def _get_var_binds():
+    var_binds = {
+        SYSTEM + (1, 0): rfc1902.OctetString("Linux bigip1 BIG-IP 16.1.3 x86_64"),
+        SYSTEM + (2, 0): rfc1902.ObjectName("1.3.6.1.4.1.3375.2.1.3.4.43"),
+        SYSTEM + (4, 0): rfc1902.OctetString("admin"),
+        SYSTEM + (5, 0): rfc1902.OctetString("bigip1"),
+        SYSTEM + (6, 0): rfc1902.OctetString("lab"),
+    }
+    for if_index, name in ((1, "1.1"), (2, "1.2")):
+        var_binds[IF_ENTRY + (1, if_index)] = rfc1902.Integer32(if_index)
+        var_binds[IF_ENTRY + (2, if_index)] = rfc1902.OctetString(name)
+        var_binds[IF_ENTRY + (3, if_index)] = rfc1902.Integer32(6)
+        var_binds[IF_ENTRY + (4, if_index)] = rfc1902.Integer32(1500)
+        var_binds[IF_ENTRY + (6, if_index)] = rfc1902.OctetString(bytes(6))
+        var_binds[IF_X_ENTRY + (1, if_index)] = rfc1902.OctetString(name)
+        var_binds[IF_X_ENTRY + (15, if_index)] = rfc1902.Gauge32(10000)
+    var_binds[IP_ADDR_ENTRY + (2, 10, 0, 0, 1)] = rfc1902.Integer32(1)
+    var_binds[IP_ADDR_ENTRY + (3, 10, 0, 0, 1)] = rfc1902.IpAddress("255.255.255.0")
+    return var_binds
+
+
+class TestBigIPAutoloadFlow(unittest.TestCase):
+    def test_discover_with_mib_profiles(self):
+        resources = {}
+        with replay_configurator(_get_var_binds()) as (snmp_configurator, logger):
+            for mib_profile in MibProfile:
+                flow = BigIPAutoloadFlow(
+                    snmp_configurator,
+                    logger,
+                    mib_profile=mib_profile,
+                )
+                details = flow.discover(
+                    ["BIG-IP"],
+                    NetworkingResourceModel("bigip", "F5 BIG-IP Shell", "CS_Router"),
+                )
+                resources[mib_profile] = sorted(
+                    resource.name for resource in details.resources
+                )
+
+        self.assertEqual(resources[MibProfile.AUTOLOAD], resources[MibProfile.FULL])
+        self.assertEqual(resources[MibProfile.AUTOLOAD], ["1.1", "1.2", "Chassis 0"])
@@ -0,0 +1,85 @@
+import time
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+
+from cloudshell.f5.flows.f5_firmware_flow import F5FirmwareFlow
+
+from tests.f5.replay import replay_configurator
+from tests.f5.snmp.test_volume_status import _set_volume
+
+IMAGE = "BIGIP-16.1.3-0.0.12.iso"
+
+
+@patch("cloudshell.f5.flows.f5_firmware_flow.F5SysActions", Mock())
+@patch("cloudshell.f5.flows.f5_firmware_flow.F5SysConfigActions")
+class TestF5FirmwareFlowSnmp(unittest.TestCase):
+    def setUp(self):
+        self.var_binds = {}
+        _set_volume(self.var_binds, 1, "HD1.1", 1, "BIG-IP", "15.1.0")
+        _set_volume(self.var_binds, 1, "HD1.2", 0)
+
+    def _load_firmware(self, install_steps, filename=IMAGE):
+        """Load the image, every SNMP poll interval moves the install a step."""
+        steps = iter(install_steps)
+
+        def sleep(seconds):
+            if seconds == F5FirmwareFlow.SNMP_POLL_INTERVAL:
+                _set_volume(self.var_binds, 1, "HD1.2", 0, *next(steps))
+
+        with replay_configurator(self.var_binds) as (snmp_configurator, logger):
+            flow = F5FirmwareFlow(Mock(), logger, MagicMock(), snmp_configurator)
+            with patch("cloudshell.f5.flows.f5_firmware_flow.time") as flow_time:
+                flow_time.monotonic = time.monotonic
+                flow_time.sleep.side_effect = sleep
+                flow._load_firmware_flow(Mock(filename=filename), None, 0)
+        return flow_time.sleep
+
+    def test_install_complete(self, sys_config_actions_class):
+        sys_config_actions = sys_config_actions_class.return_value
+        sys_config_actions.show_version_per_volume.side_effect = [
+            {1.1: {"status": "complete", "is_running": "yes"}},
+            {1.2: {"status": "complete", "is_running": "no"}},
+            {1.2: {"status": "complete", "is_running": "yes"}},
+        ]
+        sleep = self._load_firmware(
+            [("BIG-IP", "16.1.3", ""), ("BIG-IP", "16.1.3", "0.0.12")]
+        )
+
+        sys_config_actions.install_firmware.assert_called_once_with(
+            IMAGE, boot_volume="HD1.2"
+        )
+        # the volume isn't complete while the build is missing
+        self.assertEqual(
+            sleep.call_args_list.count(((F5FirmwareFlow.SNMP_POLL_INTERVAL,),)), 2
+        )
+        self.assertNotIn(((F5FirmwareFlow.INSTALL_TIMEOUT,),), sleep.call_args_list)
+        sys_config_actions.reload_device_to_certain_volume.assert_called_once_with(
+            F5FirmwareFlow.RELOAD_TIMEOUT, "HD1.2"
+        )
+
+    def test_install_failed(self, sys_config_actions_class):
+        sys_config_actions = sys_config_actions_class.return_value
+        sys_config_actions.show_version_per_volume.return_value = {
+            1.1: {"status": "complete", "is_running": "yes"}
+        }
+
+        with self.assertRaisesRegex(Exception, f"Failed to load {IMAGE} firmware"):
+            self._load_firmware([("BIG-IP", "16.1.3", "0.0.11")])
+
+        sys_config_actions.reload_device_to_certain_volume.assert_not_called()
+
+    def test_unknown_image_version(self, sys_config_actions_class):
+        sys_config_actions = sys_config_actions_class.return_value
+        sys_config_actions.show_version_per_volume.side_effect = [
+            {1.1: {"status": "complete", "is_running": "yes"}},
+            {1.2: {"status": "complete", "is_running": "no"}},
+            {1.2: {"status": "complete", "is_running": "yes"}},
+        ]
+        sleep = self._load_firmware([], filename="firmware.iso")
+
+        # tmsh reads the install status after the install command timeout
+        self.assertIn(((F5FirmwareFlow.INSTALL_CMD_TIMEOUT,),), sleep.call_args_list)
+        self.assertNotIn(((F5FirmwareFlow.SNMP_POLL_INTERVAL,),), sleep.call_args_list)
+        sys_config_actions.reload_device_to_certain_volume.assert_called_once_with(
+            F5FirmwareFlow.RELOAD_TIMEOUT, "HD1.2"
+        )
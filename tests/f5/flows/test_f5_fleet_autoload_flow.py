@@ -0,0 +1,107 @@
+import threading
+import time
+import unittest
+from collections import Counter
+from unittest.mock import MagicMock, Mock
+
+from cloudshell.f5.flows.f5_fleet_autoload_flow import BigIPFleetAutoloadFlow
+
+
+class _FakeFlow(object):
+    def __init__(self, fleet, resource_config):
+        self._fleet = fleet
+        self._resource_config = resource_config
+        self.walk_summary = None
+
+    def discover(self, supported_os, resource_model):
+        fleet = self._fleet
+        site = self._resource_config.site
+        with fleet.lock:
+            fleet.running[site] += 1
+            fleet.running["*"] += 1
+            fleet.max_running[site] = max(fleet.max_running[site], fleet.running[site])
+            fleet.max_running["*"] = max(fleet.max_running["*"], fleet.running["*"])
+        try:
+            time.sleep(self._resource_config.delay)
+            fleet.attempts[self._resource_config.name] += 1
+            if (
+                fleet.attempts[self._resource_config.name]
+                <= self._resource_config.fails
+            ):
+                raise IOError("timed out")
+            self.walk_summary = "summary"
+            return f"details of {self._resource_config.name}"
+        finally:
+            with fleet.lock:
+                fleet.running[site] -= 1
+                fleet.running["*"] -= 1
+
+
+class TestBigIPFleetAutoloadFlow(unittest.TestCase):
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.running = Counter()
+        self.max_running = Counter()
+        self.attempts = Counter()
+
+    def _get_config(self, name, site, delay=0.02, fails=0):
+        resource_config = Mock(address=name, site=site, delay=delay, fails=fails)
+        # name is the argument of Mock itself
+        resource_config.configure_mock(name=name)
+        return resource_config
+
+    def _get_fleet(self, **kwargs):
+        return BigIPFleetAutoloadFlow(
+            lambda resource_config: _FakeFlow(self, resource_config),
+            MagicMock(),
+            site_key=lambda resource_config: resource_config.site,
+            resource_model_factory=Mock(),
+            **kwargs,
+        )
+
+    def test_concurrency_limits(self):
+        configs = [self._get_config(f"a{index}", "a") for index in range(6)]
+        configs += [self._get_config(f"b{index}", "b") for index in range(6)]
+
+        results = list(
+            self._get_fleet(max_concurrency=3, max_per_site=2).discover(configs, [])
+        )
+
+        self.assertEqual(len(results), 12)
+        self.assertTrue(all(result.is_success for result in results))
+        self.assertEqual(self.max_running["*"], 3)
+        self.assertEqual(self.max_running["a"], 2)
+        self.assertEqual(self.max_running["b"], 2)
+
+    def test_results_as_completed(self):
+        slow = self._get_config("slow", "a", delay=0.3)
+        fast = self._get_config("fast", "b", delay=0.01)
+
+        results = self._get_fleet().discover([slow, fast], [])
+
+        self.assertEqual(next(results).resource_config, fast)
+        self.assertEqual(next(results).resource_config, slow)
+
+    def test_retry_with_backoff(self):
+        flaky = self._get_config("flaky", "a", fails=2)
+        broken = self._get_config("broken", "a", fails=9)
+        progress_callback = Mock()
+
+        results = {
+            result.resource_config.name: result
+            for result in self._get_fleet(
+                retries=2, backoff=0.01, progress_callback=progress_callback
+            ).discover([flaky, broken], [])
+        }
+
+        self.assertTrue(results["flaky"].is_success)
+        self.assertEqual(results["flaky"].attempts, 3)
+        self.assertEqual(results["flaky"].details, "details of flaky")
+        self.assertEqual(results["flaky"].walk_summary, "summary")
+        self.assertFalse(results["broken"].is_success)
+        self.assertIsInstance(results["broken"].error, IOError)
+        self.assertEqual(results["broken"].attempts, 3)
+        self.assertEqual(progress_callback.call_count, 2)
+        progress = progress_callback.call_args[0][1]
+        self.assertEqual((progress.succeeded, progress.failed), (1, 1))
+        self.assertEqual(progress.retries, 4)
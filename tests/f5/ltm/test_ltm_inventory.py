@@ -0,0 +1,114 @@
+import unittest
+
+from pysnmp.proto import rfc1902
+
+from cloudshell.f5.ltm.ltm_inventory import (
+    NODE_INDEX,
+    POOL_INDEX,
+    POOL_MEMBER_INDEX,
+    VIRTUAL_SERVER_INDEX,
+    VIRTUAL_SERVER_POOL_INDEX,
+    F5LtmInventoryDiscovery,
+    decode_name,
+    format_address,
+    get_partition,
+)
+from cloudshell.f5.snmp.index_codec import join_index
+
+from tests.f5.replay import replay_snmp_service
+
+LTM = (1, 3, 6, 1, 4, 1, 3375, 2, 2)
+VIRTUAL_SERVER = LTM + (10, 1, 2, 1)
+VIRTUAL_SERVER_POOL = LTM + (10, 6, 2, 1)
+POOL = LTM + (5, 1, 2, 1)
+POOL_MEMBER = LTM + (5, 3, 2, 1)
+NODE = LTM + (4, 1, 2, 1)
+
+
+def _get_var_binds():
+    var_binds = {}
+    for name, address, pool in (
+        ("/Common/vs_web", bytes([10, 0, 0, 10]), "/Common/web"),
+        ("/Tenant/vs_api", bytes([10, 0, 0, 11, 0, 0, 0, 2]), ""),
+    ):
+        index = join_index((name,), VIRTUAL_SERVER_INDEX)
+        var_binds[VIRTUAL_SERVER + (3,) + index] = rfc1902.OctetString(address)
+        var_binds[VIRTUAL_SERVER + (6,) + index] = rfc1902.Integer32(443)
+        var_binds[VIRTUAL_SERVER + (9,) + index] = rfc1902.Integer32(1)
+        var_binds[VIRTUAL_SERVER + (19,) + index] = rfc1902.OctetString(pool)
+    index = join_index(("/Tenant/vs_api", "/Tenant/api"), VIRTUAL_SERVER_POOL_INDEX)
+    var_binds[VIRTUAL_SERVER_POOL + (2,) + index] = rfc1902.OctetString("/Tenant/api")
+    for name, lb_mode in (
+        ("/Common/web", 2),
+        ("/Tenant/api", 0),
+        (b"/Common/caf\xe9", 0),
+    ):
+        index = join_index((name,), POOL_INDEX)
+        var_binds[POOL + (2,) + index] = rfc1902.Integer32(lb_mode)
+        var_binds[POOL + (8,) + index] = rfc1902.Integer32(2)
+    for pool, address, port in (
+        ("/Common/web", bytes([192, 168, 1, 1]), 80),
+        ("/Common/web", bytes([192, 168, 1, 2]), 80),
+        ("/Tenant/api", bytes([192, 168, 1, 2]), 8080),
+    ):
+        index = join_index((pool, 1, address, port), POOL_MEMBER_INDEX)
+        var_binds[POOL_MEMBER + (6,) + index] = rfc1902.Integer32(1)
+        var_binds[POOL_MEMBER + (8,) + index] = rfc1902.Integer32(port // 1000)
+    for number in (1, 2):
+        index = join_index((1, bytes([192, 168, 1, number])), NODE_INDEX)
+        var_binds[NODE + (17,) + index] = rfc1902.OctetString(f"/Common/node{number}")
+    return var_binds
+
+
+class TestIndexHelpers(unittest.TestCase):
+    def test_format_address(self):
+        self.assertEqual(format_address(bytes([10, 0, 0, 1])), "10.0.0.1")
+        self.assertEqual(format_address(bytes([10, 0, 0, 1, 0, 0, 0, 3])), "10.0.0.1%3")
+        self.assertEqual(format_address(bytes(15) + b"\x01"), "::1")
+
+    def test_decode_name(self):
+        self.assertEqual(decode_name(b"/Common/caf\xe9"), "/Common/caf\ufffd")
+
+    def test_get_partition(self):
+        self.assertEqual(get_partition("/Common/app.app/vs1"), "Common")
+        self.assertEqual(get_partition("vs1"), "")
+
+
+class TestF5LtmInventoryDiscovery(unittest.TestCase):
+    def test_discover(self):
+        with replay_snmp_service(_get_var_binds()) as (snmp_service, logger):
+            inventory = F5LtmInventoryDiscovery(snmp_service, logger).discover()
+
+        self.assertEqual(inventory.partitions, ["Common", "Tenant"])
+        web = inventory.virtual_servers["/Common/vs_web"]
+        self.assertEqual((web.address, web.port, web.enabled), ("10.0.0.10", 443, True))
+        api = inventory.virtual_servers["/Tenant/vs_api"]
+        self.assertEqual(api.address, "10.0.0.11%2")
+        self.assertEqual([pool.name for pool in api.pools], ["/Tenant/api"])
+        self.assertEqual(inventory.pools["/Common/web"].lb_mode, "leastConnMember")
+        self.assertEqual(inventory.pools["/Common/web"].active_members, 2)
+
+        paths = [
+            (vs.name, pool.name, member.name, node.name)
+            for vs, pool, member, node in inventory.iter_paths()
+        ]
+        self.assertEqual(
+            sorted(paths),
+            [
+                ("/Common/vs_web", "/Common/web", "/Common/node1:80", "/Common/node1"),
+                ("/Common/vs_web", "/Common/web", "/Common/node2:80", "/Common/node2"),
+                (
+                    "/Tenant/vs_api",
+                    "/Tenant/api",
+                    "/Common/node2:8080",
+                    "/Common/node2",
+                ),
+            ],
+        )
+        self.assertEqual(len(inventory.nodes["192.168.1.2"].pool_members), 2)
+        # not UTF-8, the invalid octet is replaced
+        self.assertEqual(inventory.pools["/Common/caf\ufffd"].lb_mode, "roundRobin")
+        self.assertEqual(
+            [vs.name for vs in inventory.get_virtual_servers("Tenant")],
+            ["/Tenant/vs_api"],
+        )
@@ -0,0 +1,81 @@
+import unittest
+
+from pysnmp.proto import rfc1902
+
+from cloudshell.f5.poller.health_poller import F5HealthPoller
+from cloudshell.f5.snmp.index_codec import STRING, join_index
+
+from tests.f5.replay import replay_configurator
+
+F5_SYSTEM = (1, 3, 6, 1, 4, 1, 3375, 2, 1)
+HOST_CPU = F5_SYSTEM + (7, 2, 2, 1)
+BLADE1 = join_index(("blade1",), (STRING,))
+TMM = join_index(("tmm",), (STRING,))
+
+
+def _set_cpu_ticks(var_binds, entry, index, user, idle, columns):
+    """Set the ticks of the CPU, columns are the numbers of user .. iowait."""
+    for column, ticks in zip(columns, (user, 0, 0, idle, 0, 0, 0)):
+        var_binds[entry + (column,) + index] = rfc1902.Counter64(ticks)
+
+
+def _get_var_binds():
+    var_binds = {
+        F5_SYSTEM + (3, 1, 2, 1, 2, 1): rfc1902.Integer32(45),
+        F5_SYSTEM + (3, 1, 2, 1, 3, 1): rfc1902.Integer32(9000),
+        F5_SYSTEM + (5, 3, 1, 2) + TMM: rfc1902.Counter64(1000),
+        F5_SYSTEM + (5, 3, 1, 4) + TMM: rfc1902.Counter64(8000),
+        F5_SYSTEM + (3, 2, 1, 2, 1, 2, 1): rfc1902.Integer32(1),
+        F5_SYSTEM + (3, 2, 1, 2, 1, 3, 1): rfc1902.Integer32(12000),
+        F5_SYSTEM + (3, 2, 1, 2, 1, 2, 2): rfc1902.Integer32(0),
+        F5_SYSTEM + (3, 2, 1, 2, 1, 3, 2): rfc1902.Integer32(0),
+        F5_SYSTEM + (3, 2, 2, 2, 1, 2, 1): rfc1902.Integer32(1),
+        F5_SYSTEM + (3, 2, 3, 2, 1, 2, 1): rfc1902.Integer32(38),
+    }
+    _set_cpu_ticks(var_binds, HOST_CPU, (0,), 100, 900, (3, 4, 5, 6, 7, 8, 9))
+    _set_cpu_ticks(
+        var_binds,
+        F5_SYSTEM + (7, 5, 2, 1),
+        BLADE1 + (1,),
+        100,
+        900,
+        (4, 5, 6, 7, 8, 9, 10),
+    )
+    return var_binds
+
+
+class TestF5HealthPoller(unittest.TestCase):
+    def test_poll(self):
+        var_binds = _get_var_binds()
+        with replay_configurator(var_binds) as (snmp_configurator, logger):
+            poller = F5HealthPoller(snmp_configurator, logger)
+            samples = poller.poll(0.01, count=2)
+
+            first = next(samples)
+            _set_cpu_ticks(var_binds, HOST_CPU, (0,), 400, 1600, (3, 4, 5, 6, 7, 8, 9))
+            # the counters of the blade were reset
+            _set_cpu_ticks(
+                var_binds,
+                F5_SYSTEM + (7, 5, 2, 1),
+                BLADE1 + (1,),
+                10,
+                90,
+                (4, 5, 6, 7, 8, 9, 10),
+            )
+            var_binds[F5_SYSTEM + (5, 3, 1, 2) + TMM] = rfc1902.Counter64(3000)
+            second = next(samples)
+            self.assertEqual(list(samples), [])
+
+        self.assertIsNone(first.interval)
+        self.assertEqual(first.cpu_usage, {})
+        self.assertEqual(first.cpu_sensors, {"1": (45, 9000)})
+        self.assertEqual(first.memory, {"tmm": (1000, 8000, None)})
+        self.assertEqual(first.fans, {"1": ("good", 12000), "2": ("bad", 0)})
+        self.assertEqual(first.power_supplies, {"1": "good"})
+        self.assertEqual(first.temperatures, {"1": 38})
+
+        self.assertGreater(second.interval, 0)
+        self.assertEqual(second.cpu_usage, {"0": 30.0})
+        allocated, size, rate = second.memory["tmm"]
+        self.assertEqual((allocated, size), (3000, 8000))
+        self.assertAlmostEqual(rate, 2000 / second.interval)
@@ -0,0 +1,78 @@
+import math
+import unittest
+
+from pysnmp.proto import rfc1902
+
+from cloudshell.f5.poller.interface_stats import (
+    INTERFACE_COUNTERS,
+    INTERFACE_INDEX,
+    F5InterfaceStatsPoller,
+)
+from cloudshell.f5.snmp.index_codec import join_index
+
+from tests.f5.replay import replay_configurator
+
+IFX_STAT = (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 5, 3, 1)
+INTERFACE_STAT = (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 4, 3, 1)
+COLUMNS = {
+    "sysIfxStatHcInOctets": IFX_STAT + (6,),
+    "sysIfxStatHcOutOctets": IFX_STAT + (10,),
+    "sysIfxStatHcInUcastPkts": IFX_STAT + (7,),
+    "sysIfxStatHcInMulticastPkts": IFX_STAT + (8,),
+    "sysIfxStatHcInBroadcastPkts": IFX_STAT + (9,),
+    "sysIfxStatHcOutUcastPkts": IFX_STAT + (11,),
+    "sysIfxStatHcOutMulticastPkts": IFX_STAT + (12,),
+    "sysIfxStatHcOutBroadcastPkts": IFX_STAT + (13,),
+    "sysInterfaceStatErrorsIn": INTERFACE_STAT + (8,),
+    "sysInterfaceStatErrorsOut": INTERFACE_STAT + (9,),
+    "sysInterfaceStatDropsIn": INTERFACE_STAT + (10,),
+    "sysInterfaceStatDropsOut": INTERFACE_STAT + (11,),
+}
+
+
+def _set_interface(var_binds, name, value, **values):
+    index = join_index((name,), INTERFACE_INDEX)
+    for column, _, _ in INTERFACE_COUNTERS:
+        var_binds[COLUMNS[column] + index] = rfc1902.Counter64(
+            values.get(column, value)
+        )
+
+
+class TestF5InterfaceStatsPoller(unittest.TestCase):
+    def test_poll(self):
+        var_binds = {}
+        _set_interface(var_binds, "1.1", 1000)
+        _set_interface(var_binds, "1.2", 2**64 - 10)
+        with replay_configurator(var_binds) as (snmp_configurator, logger):
+            poller = F5InterfaceStatsPoller(snmp_configurator, logger)
+            samples = poller.poll(0.01, count=3)
+
+            first = next(samples)
+            # the counter was reset
+            _set_interface(var_binds, "1.1", 1100, sysInterfaceStatDropsIn=10)
+            # the counters wrapped
+            _set_interface(var_binds, "1.2", 20)
+            second = next(samples)
+            _set_interface(
+                var_binds,
+                "1.1",
+                1100,
+                sysInterfaceStatDropsIn=10,
+                sysIfxStatHcInOctets=0,
+            )
+            third = next(samples)
+
+        self.assertEqual(first.names, ["1.1", "1.2"])
+        self.assertIsNone(first.interval)
+        self.assertTrue(math.isnan(first.get_interface("1.1")["bps_in"]))
+
+        interval = second.interval
+        rates = second.get_interface("1.1")
+        self.assertAlmostEqual(rates["bps_in"] * interval, 800)
+        self.assertAlmostEqual(rates["pps_out"] * interval, 300)
+        self.assertAlmostEqual(rates["errors_in"] * interval, 100)
+        self.assertTrue(math.isnan(rates["drops_in"]))
+        self.assertAlmostEqual(second.get_interface("1.2")["pps_in"] * interval, 90)
+        rates = third.get_interface("1.1")
+        self.assertTrue(math.isnan(rates["bps_in"]))
+        self.assertEqual((rates["bps_out"], rates["drops_in"]), (0, 0))
@@ -0,0 +1,103 @@
+import math
+import unittest
+
+from pysnmp.proto import rfc1902
+
+from cloudshell.f5.ltm.ltm_inventory import POOL_MEMBER_INDEX, VIRTUAL_SERVER_INDEX
+from cloudshell.f5.poller.ltm_stats import F5LtmStatsPoller
+from cloudshell.f5.snmp.index_codec import join_index
+
+from tests.f5.replay import replay_configurator
+
+VIRTUAL_SERVER_STAT = (1, 3, 6, 1, 4, 1, 3375, 2, 2, 10, 2, 3, 1)
+POOL_MEMBER_STAT = (1, 3, 6, 1, 4, 1, 3375, 2, 2, 5, 4, 3, 1)
+CLIENT_BYTES_IN = 7
+CLIENT_CUR_CONNS = 12
+SERVER_BYTES_IN = 6
+
+
+def _set_virtual_server(var_binds, name, bytes_in, connections):
+    index = join_index((name,), VIRTUAL_SERVER_INDEX)
+    var_binds[VIRTUAL_SERVER_STAT + (CLIENT_BYTES_IN,) + index] = rfc1902.Counter64(
+        bytes_in
+    )
+    var_binds[VIRTUAL_SERVER_STAT + (CLIENT_CUR_CONNS,) + index] = rfc1902.Counter64(
+        connections
+    )
+
+
+def _get_var_binds():
+    var_binds = {}
+    _set_virtual_server(var_binds, "/Common/vs1", 1000, 3)
+    _set_virtual_server(var_binds, "/Common/vs2", 2**64 - 100, 4)
+    _set_virtual_server(var_binds, "/Tenant/vs3", 5000, 5)
+    member = join_index(
+        ("/Common/pool1", 1, bytes([10, 0, 0, 1]), 80), POOL_MEMBER_INDEX
+    )
+    var_binds[POOL_MEMBER_STAT + (SERVER_BYTES_IN,) + member] = rfc1902.Counter64(10)
+    # not a string index, the row is named by the index
+    var_binds[POOL_MEMBER_STAT + (SERVER_BYTES_IN, 3, 97, 300)] = rfc1902.Counter64(5)
+    return var_binds
+
+
+class TestF5LtmStatsPoller(unittest.TestCase):
+    def test_poll(self):
+        var_binds = _get_var_binds()
+        with replay_configurator(var_binds) as (snmp_configurator, logger):
+            poller = F5LtmStatsPoller(snmp_configurator, logger)
+            samples = poller.poll(0.01, count=2)
+
+            first = next(samples)
+            _set_virtual_server(var_binds, "/Common/vs1", 3000, 6)
+            # the counter wrapped
+            _set_virtual_server(var_binds, "/Common/vs2", 50, 4)
+            # the counter was reset
+            _set_virtual_server(var_binds, "/Tenant/vs3", 10, 1)
+            second = next(samples)
+            self.assertEqual(list(samples), [])
+
+        virtual_servers = first["ltmVirtualServStatTable"]
+        self.assertIsNone(virtual_servers.interval)
+        self.assertEqual(
+            virtual_servers.names, ["/Common/vs1", "/Common/vs2", "/Tenant/vs3"]
+        )
+        self.assertEqual(virtual_servers.partitions, ["Common", "Tenant"])
+        self.assertTrue(
+            math.isnan(
+                virtual_servers.get_row("/Common/vs1")[
+                    "ltmVirtualServStatClientBytesIn"
+                ]
+            )
+        )
+        self.assertEqual(
+            virtual_servers.get_partition("Common")["ltmVirtualServStatClientCurConns"],
+            7,
+        )
+        members = first["ltmPoolMemberStatTable"]
+        self.assertEqual(members.names, ["3.97.300", "/Common/pool1 10.0.0.1:80"])
+
+        virtual_servers = second["ltmVirtualServStatTable"]
+        interval = virtual_servers.interval
+        self.assertGreater(interval, 0)
+        rates = [
+            virtual_servers.get_row(name)["ltmVirtualServStatClientBytesIn"]
+            for name in virtual_servers.names
+        ]
+        self.assertAlmostEqual(rates[0] * interval, 2000)
+        self.assertAlmostEqual(rates[1] * interval, 150)
+        self.assertTrue(math.isnan(rates[2]))
+        common = virtual_servers.get_partition("Common")
+        self.assertAlmostEqual(
+            common["ltmVirtualServStatClientBytesIn"] * interval, 2150
+        )
+        self.assertEqual(common["ltmVirtualServStatClientCurConns"], 10)
+        tenant = virtual_servers.get_partition("Tenant")
+        self.assertEqual(tenant["ltmVirtualServStatClientBytesIn"], 0)
+        # columns missing on the device
+        self.assertTrue(
+            math.isnan(
+                virtual_servers.get_row("/Common/vs1")["ltmVirtualServStatPvaBytesIn"]
+            )
+        )
+        member = second["ltmPoolMemberStatTable"].get_row("/Common/pool1 10.0.0.1:80")
+        self.assertEqual(member["ltmPoolMemberStatServerBytesIn"], 0)
@@ -0,0 +1,127 @@
+import unittest
+
+from pysnmp.proto import rfc1902
+
+from cloudshell.f5.ltm.ltm_inventory import (
+    NODE_INDEX,
+    POOL_MEMBER_INDEX,
+    VIRTUAL_SERVER_INDEX,
+)
+from cloudshell.f5.poller.ltm_status import F5LtmStatusPoller
+from cloudshell.f5.snmp.index_codec import join_index
+
+from tests.f5.replay import replay_configurator
+
+VS_STATUS = (1, 3, 6, 1, 4, 1, 3375, 2, 2, 10, 13, 2, 1)
+POOL_MEMBER_STATUS = (1, 3, 6, 1, 4, 1, 3375, 2, 2, 5, 6, 2, 1)
+NODE_STATUS = (1, 3, 6, 1, 4, 1, 3375, 2, 2, 4, 3, 2, 1)
+GREEN = 1
+RED = 3
+ENABLED = 1
+DISABLED = 2
+
+
+def _set_status(var_binds, entry, columns, index, availability, enabled, reason):
+    for column, value in zip(
+        columns,
+        (
+            rfc1902.Integer32(availability),
+            rfc1902.Integer32(enabled),
+            rfc1902.OctetString(reason),
+        ),
+    ):
+        var_binds[entry + (column,) + index] = value
+
+
+def _set_virtual_server(var_binds, name, availability, enabled, reason):
+    index = join_index((name,), VIRTUAL_SERVER_INDEX)
+    _set_status(var_binds, VS_STATUS, (2, 3, 5), index, availability, enabled, reason)
+
+
+def _set_pool_member(var_binds, availability, enabled, reason):
+    index = join_index(
+        ("/Common/pool1", 1, bytes([10, 0, 0, 1]), 80), POOL_MEMBER_INDEX
+    )
+    _set_status(
+        var_binds,
+        POOL_MEMBER_STATUS,
+        (5, 6, 8),
+        index,
+        availability,
+        enabled,
+        reason,
+    )
+
+
+def _get_var_binds():
+    var_binds = {}
+    _set_virtual_server(var_binds, "/Common/vs1", GREEN, ENABLED, "available")
+    _set_virtual_server(var_binds, "/Common/vs2", GREEN, ENABLED, "available")
+    _set_pool_member(var_binds, GREEN, ENABLED, "Pool member is available")
+    _set_status(
+        var_binds,
+        NODE_STATUS,
+        (3, 4, 6),
+        join_index((1, bytes([10, 0, 0, 1])), NODE_INDEX),
+        GREEN,
+        ENABLED,
+        "Node address is available",
+    )
+    return var_binds
+
+
+class TestF5LtmStatusPoller(unittest.TestCase):
+    def _poll(self, availability_only):
+        var_binds = _get_var_binds()
+        with replay_configurator(var_binds) as (snmp_configurator, logger):
+            poller = F5LtmStatusPoller(
+                snmp_configurator,
+                logger,
+                availability_only=availability_only,
+            )
+            polls = poller.poll(0.01, count=3)
+            first = next(polls)
+            _set_pool_member(var_binds, RED, ENABLED, "Could not connect")
+            _set_virtual_server(var_binds, "/Common/vs2", GREEN, DISABLED, "disabled")
+            second = next(polls)
+            third = next(polls)
+        return first, second, third
+
+    def test_full_rows(self):
+        first, second, third = self._poll(availability_only=False)
+
+        self.assertEqual(
+            [(event.table.name, event.name, event.kind) for event in first],
+            [
+                ("ltmVsStatusTable", "/Common/vs1", "added"),
+                ("ltmVsStatusTable", "/Common/vs2", "added"),
+                ("ltmPoolMbrStatusTable", "/Common/pool1 10.0.0.1:80", "added"),
+                ("ltmNodeAddrStatusTable", "10.0.0.1", "added"),
+            ],
+        )
+        self.assertEqual(
+            [
+                (event.name, event.kind, event.availability, event.enabled)
+                for event in second
+            ],
+            [
+                ("/Common/vs2", "changed", "green", "disabled"),
+                ("/Common/pool1 10.0.0.1:80", "changed", "red", "enabled"),
+            ],
+        )
+        member = second[1]
+        self.assertEqual(member.previous_availability, "green")
+        self.assertEqual(member.reason, "Could not connect")
+        self.assertEqual(third, [])
+
+    def test_availability_only(self):
+        first, second, third = self._poll(availability_only=True)
+
+        self.assertEqual(len(first), 4)
+        self.assertEqual(first[3].reason, "Node address is available")
+        # the enabled state of vs2 changed alone
+        self.assertEqual(
+            [(event.name, event.availability, event.reason) for event in second],
+            [("/Common/pool1 10.0.0.1:80", "red", "Could not connect")],
+        )
+        self.assertEqual(third, [])
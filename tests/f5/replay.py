@@ -0,0 +1,28 @@
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+from cloudshell.f5.flows.f5_autoload_flow import BigIPAutoloadFlow, prepare_mib_view
+from cloudshell.f5.snmp.mib_profile import MibProfile
+from cloudshell.f5.snmp.replay_agent import ReplaySnmpConfigurator, SnmpReplayAgent
+
+
+@contextmanager
+def replay_configurator(var_binds):
+    """Serve the var-binds, yields the SNMP configurator and the logger.
+
+    Values of the var-binds may be changed while served, the OIDs may not.
+    """
+    logger = MagicMock()
+    with SnmpReplayAgent(var_binds) as agent:
+        yield ReplaySnmpConfigurator(agent, logger), logger
+
+
+@contextmanager
+def replay_snmp_service(var_binds, mib_profile=MibProfile.FULL):
+    """Serve the var-binds, yields the SNMP service with the MIBs and the logger."""
+    with replay_configurator(var_binds) as (snmp_configurator, logger):
+        with snmp_configurator.get_service() as snmp_service:
+            prepare_mib_view(
+                snmp_service, BigIPAutoloadFlow.MIB_CACHES[mib_profile], logger
+            )
+            yield snmp_service, logger
@@ -0,0 +1,80 @@
+import asyncio
+import socket
+import unittest
+
+from pysnmp.proto import rfc1902, rfc1905
+from pysnmp.proto.errind import RequestTimedOut
+
+from cloudshell.f5.snmp.async_snmp import AsyncSnmpClient
+from cloudshell.f5.snmp.replay_agent import SnmpReplayAgent
+
+IF_DESCR = (1, 3, 6, 1, 2, 1, 2, 2, 1, 2)
+IF_TYPE = (1, 3, 6, 1, 2, 1, 2, 2, 1, 3)
+VAR_BINDS = {
+    (1, 3, 6, 1, 2, 1, 1, 5, 0): rfc1902.OctetString("bigip1"),
+    **{IF_DESCR + (index,): rfc1902.OctetString(f"1.{index}") for index in range(1, 8)},
+    IF_TYPE + (1,): rfc1902.Integer32(6),
+}
+
+
+class TestAsyncSnmpClient(unittest.TestCase):
+    def setUp(self):
+        self.agent = SnmpReplayAgent(VAR_BINDS)
+        self.agent.start()
+        self.addCleanup(self.agent.stop)
+
+    def _run(self, request, **kwargs):
+        host, port = self.agent.address
+
+        async def run():
+            async with AsyncSnmpClient(host, "public", port=port, **kwargs) as client:
+                return await request(client)
+
+        return asyncio.run(run())
+
+    def test_get(self):
+        var_binds = self._run(
+            lambda client: client.get(["1.3.6.1.2.1.1.5.0", "1.3.6.1.2.1.1.6.0"])
+        )
+
+        self.assertEqual(var_binds[0][1], rfc1902.OctetString("bigip1"))
+        self.assertEqual(var_binds[1][1].tagSet, rfc1905.NoSuchInstance.tagSet)
+
+    def test_get_next(self):
+        var_binds = self._run(lambda client: client.get_next([IF_DESCR]))
+
+        self.assertEqual(tuple(var_binds[0][0]), IF_DESCR + (1,))
+
+    def test_walk(self):
+        for version, max_repetitions in (("2", 3), ("2", 25), ("1", 25)):
+            var_binds = self._run(
+                lambda client: client.walk(IF_DESCR),
+                version=version,
+                max_repetitions=max_repetitions,
+            )
+            self.assertEqual(
+                [str(value) for _, value in var_binds],
+                [f"1.{index}" for index in range(1, 8)],
+            )
+
+    def test_walk_many(self):
+        columns = self._run(
+            lambda client: client.walk_many([IF_TYPE, IF_DESCR, (1, 3, 7)], 2)
+        )
+
+        self.assertEqual([len(column) for column in columns], [1, 7, 0])
+
+    def test_timeout(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as silent:
+            silent.bind(("127.0.0.1", 0))
+
+            async def run():
+                client = AsyncSnmpClient(
+                    "127.0.0.1", "public", port=silent.getsockname()[1], timeout=0.1
+                )
+                async with client:
+                    with self.assertRaises(RequestTimedOut):
+                        await client.get(["1.3.6.1.2.1.1.5.0"])
+                return client.requests
+
+            self.assertEqual(asyncio.run(run()), 3)
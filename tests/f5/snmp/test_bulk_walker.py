@@ -0,0 +1,97 @@
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+
+from pyasn1.type import univ
+from pysnmp.proto import rfc1902
+from pysnmp.proto.errind import RequestTimedOut, requestTimedOut
+
+from cloudshell.snmp.core.snmp_errors import ReadSNMPException
+
+from cloudshell.f5.snmp.bulk_walker import AdaptiveBulkWalker, _AdaptiveBulkReader
+
+
+class TestAdaptiveBulkWalker(unittest.TestCase):
+    def setUp(self):
+        self.walker = AdaptiveBulkWalker(Mock(_get_bulk_flag=True), MagicMock())
+
+    @staticmethod
+    def _get_var_bind_table(rows):
+        return [
+            [
+                (
+                    rfc1902.ObjectName(f"1.3.6.1.2.1.2.2.1.2.{i}"),
+                    rfc1902.OctetString("1.1"),
+                )
+            ]
+            for i in range(1, rows + 1)
+        ]
+
+    def test_grow_on_fast_full_response(self):
+        self.walker._on_response(0.01, self._get_var_bind_table(25))
+        self.assertEqual(self.walker.max_repetitions, 50)
+
+        self.walker._on_response(1, self._get_var_bind_table(50))
+        self.assertEqual(self.walker.max_repetitions, 50)
+
+    def test_limit_by_pdu_size(self):
+        for _ in range(5):
+            self.walker._on_response(
+                0.01, self._get_var_bind_table(self.walker.max_repetitions)
+            )
+        self.assertLess(self.walker.max_repetitions, AdaptiveBulkWalker.MAX_REPETITIONS)
+        self.assertLessEqual(
+            self.walker.stats.bytes
+            / self.walker.stats.var_binds
+            * self.walker.max_repetitions,
+            AdaptiveBulkWalker.MAX_PDU_SIZE,
+        )
+
+    def test_shrink_on_errors(self):
+        self.walker._on_error(is_timeout=True)
+        self.walker._on_error(is_timeout=False)
+        self.assertEqual(self.walker.max_repetitions, 6)
+        self.walker._on_error(is_timeout=False)
+        self.assertEqual(
+            self.walker.max_repetitions, AdaptiveBulkWalker.MIN_REPETITIONS
+        )
+        self.assertEqual(
+            (self.walker.stats.timeouts, self.walker.stats.too_big), (1, 2)
+        )
+
+    def test_walk_without_bulk(self):
+        snmp_service = Mock(_get_bulk_flag=False)
+        walker = AdaptiveBulkWalker(snmp_service, MagicMock())
+        self.assertIs(walker.walk("oid"), snmp_service.walk.return_value)
+
+    @patch("cloudshell.f5.snmp.bulk_walker.cmdgen")
+    def _get_partial_reader(self, error_indication, error_status, cmdgen):
+        """Get the reader which got a response and then failed for good."""
+        reader = _AdaptiveBulkReader(
+            self.walker, univ.ObjectIdentifier("1.3.6.1.2.1.2.2.1.2")
+        )
+        reader.start()
+        reader.cb_walk_fun(None, None, None, 0, 0, self._get_var_bind_table(3), None)
+        for _ in range(reader._retry_count + 1):
+            reader.cb_walk_fun(None, None, error_indication, error_status, 0, [], None)
+        self.assertEqual(len(reader.result), 3)
+        self.assertEqual(
+            cmdgen.BulkCommandGenerator.return_value.sendVarBinds.call_count,
+            reader._retry_count + 2,
+        )
+        return reader
+
+    def test_partial_walk_failed(self):
+        timed_out = self._get_partial_reader(requestTimedOut, 0)
+        too_big = self._get_partial_reader(None, rfc1902.Integer(1))
+        self.assertIsInstance(timed_out.error, RequestTimedOut)
+        self.assertIsInstance(too_big.error, ReadSNMPException)
+
+        self.walker._run_readers = Mock(return_value=[timed_out])
+        with self.assertRaises(RequestTimedOut):
+            self.walker.walk_many(["oid"])
+        self.walker._run_readers = Mock(return_value=[too_big])
+        with self.assertRaises(ReadSNMPException):
+            self.walker.walk_many(["oid"])
+
+        self.walker._run_readers = Mock(return_value=[timed_out, too_big])
+        self.assertEqual(self.walker.walk_available(["oid", "oid"]), [None, None])
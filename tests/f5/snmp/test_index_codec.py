@@ -0,0 +1,62 @@
+import unittest
+
+from cloudshell.f5.snmp.index_codec import (
+    INTEGER,
+    STRING,
+    IndexCodec,
+    get_index_codec,
+    join_index,
+    split_index,
+)
+
+# pool name, address type, address, port
+POOL_MEMBER_INDEX = (STRING, INTEGER, STRING, INTEGER)
+MEMBER_INDEX = (11,) + tuple(b"/Common/web") + (1,) + (4, 10, 0, 0, 1) + (80,)
+
+
+class TestIndexHelpers(unittest.TestCase):
+    def test_split_index(self):
+        self.assertEqual(
+            split_index(MEMBER_INDEX, ("s", "i", "s", "i")),
+            (b"/Common/web", 1, bytes([10, 0, 0, 1]), 80),
+        )
+
+    def test_split_index_mismatch(self):
+        for index in (
+            # the string is truncated
+            (5, 97, 98),
+            # sub-ids after the index
+            (1, 97, 7, 8),
+            # not an octet
+            (2, 97, 300),
+        ):
+            with self.subTest(index=index), self.assertRaises(IndexError):
+                split_index(index, ("s",))
+        with self.assertRaises(IndexError):
+            split_index(MEMBER_INDEX[:-1], POOL_MEMBER_INDEX)
+
+    def test_join_index(self):
+        self.assertEqual(
+            join_index(("/Common/web", 1, bytes([10, 0, 0, 1]), 80), POOL_MEMBER_INDEX),
+            MEMBER_INDEX,
+        )
+
+    def test_join_index_mismatch(self):
+        with self.assertRaises(ValueError):
+            join_index(("/Common/web", 1), POOL_MEMBER_INDEX)
+
+
+class TestIndexCodec(unittest.TestCase):
+    def test_split_cached(self):
+        codec = IndexCodec(POOL_MEMBER_INDEX, cache_size=1)
+
+        parts = codec.split(list(MEMBER_INDEX))
+        self.assertIs(codec.split(MEMBER_INDEX), parts)
+        self.assertEqual(codec.join(parts), MEMBER_INDEX)
+        with self.assertRaises(IndexError):
+            codec.split(MEMBER_INDEX[:5])
+
+    def test_shared_codec(self):
+        self.assertIs(
+            get_index_codec(list(POOL_MEMBER_INDEX)), get_index_codec(POOL_MEMBER_INDEX)
+        )
@@ -0,0 +1,59 @@
+import os
+import stat
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pysnmp.smi.builder import MibBuilder
+
+from cloudshell.f5.snmp.mib_cache import MIB_CACHE_DIR_ENV, CachedMibSource, F5MibCache
+
+
+class TestF5MibCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.mib_cache = F5MibCache(cache_root=self._tmp_dir.name)
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_build_once(self):
+        self.assertIn("F5-BIGIP-SYSTEM-MIB", self.mib_cache.modules)
+        index_path = os.path.join(self.mib_cache.cache_dir, F5MibCache.INDEX_FILE)
+        self.assertTrue(os.path.exists(index_path))
+        self.assertEqual(stat.S_IMODE(os.stat(self.mib_cache.cache_dir).st_mode), 0o700)
+
+        mib_cache = F5MibCache(cache_root=self._tmp_dir.name)
+        self.assertEqual(mib_cache.index, self.mib_cache.index)
+
+    def test_user_cache_dir(self):
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": self._tmp_dir.name}):
+            os.environ.pop(MIB_CACHE_DIR_ENV, None)
+            self.assertEqual(
+                os.path.dirname(F5MibCache().cache_root), self._tmp_dir.name
+            )
+
+    @unittest.skipUnless(hasattr(os, "getuid"), "POSIX permissions")
+    def test_skip_shared_cache_dir(self):
+        os.chmod(self._tmp_dir.name, 0o777)
+        self.assertFalse(self.mib_cache.is_private)
+        self.assertEqual(self.mib_cache.modules, [])
+        self.assertIsNone(self.mib_cache.get_code("F5-BIGIP-SYSTEM-MIB"))
+        self.assertEqual(os.listdir(self.mib_cache.cache_dir), [])
+
+        mib_builder = MibBuilder()
+        self.mib_cache.attach(mib_builder)
+        mib_builder.loadModules("F5-BIGIP-COMMON-MIB")
+        self.assertIn("F5-BIGIP-COMMON-MIB", mib_builder.mibSymbols)
+
+    def test_attach_loads_only_requested_modules(self):
+        mib_builder = MibBuilder()
+        self.mib_cache.attach(mib_builder)
+        self.mib_cache.attach(mib_builder)
+        sources = mib_builder.getMibSources()
+        self.assertIsInstance(sources[0], CachedMibSource)
+        self.assertNotIsInstance(sources[1], CachedMibSource)
+
+        mib_builder.loadModules("F5-BIGIP-COMMON-MIB")
+        self.assertIn("F5-BIGIP-COMMON-MIB", mib_builder.mibSymbols)
+        self.assertNotIn("F5-BIGIP-LOCAL-MIB", mib_builder.mibSymbols)
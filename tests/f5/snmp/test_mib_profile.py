@@ -0,0 +1,32 @@
+import tempfile
+import unittest
+
+from pysnmp.smi.builder import DirMibSource, MibBuilder
+
+from cloudshell.f5.snmp.mib_profile import MibProfileGenerator
+
+
+class TestMibProfileGenerator(unittest.TestCase):
+    def test_generate(self):
+        with tempfile.TemporaryDirectory() as output_folder:
+            MibProfileGenerator().generate(
+                output_folder, {"F5-BIGIP-SYSTEM-MIB": ["sysInterfaceName"]}
+            )
+            mib_builder = MibBuilder()
+            mib_builder.setMibSources(
+                DirMibSource(output_folder), *mib_builder.getMibSources()
+            )
+            (column,) = mib_builder.importSymbols(
+                "F5-BIGIP-SYSTEM-MIB", "sysInterfaceName"
+            )
+
+            self.assertEqual(
+                column.getName(), (1, 3, 6, 1, 4, 1, 3375, 2, 1, 2, 4, 1, 2, 1, 1)
+            )
+            self.assertIn(
+                "sysInterfaceEntry", mib_builder.mibSymbols["F5-BIGIP-SYSTEM-MIB"]
+            )
+            self.assertNotIn(
+                "sysInterfaceMtu", mib_builder.mibSymbols["F5-BIGIP-SYSTEM-MIB"]
+            )
+            self.assertNotIn("F5-BIGIP-LOCAL-MIB", mib_builder.mibSymbols)
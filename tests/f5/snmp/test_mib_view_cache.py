@@ -0,0 +1,43 @@
+import unittest
+from unittest.mock import Mock
+
+from pysnmp.hlapi import SnmpEngine
+from pysnmp.hlapi.varbinds import CommandGeneratorVarBinds
+from pysnmp.smi.builder import DirMibSource
+from pysnmp.smi.rfc1902 import ObjectIdentity
+
+from cloudshell.f5.snmp.mib_cache import MIBS_FOLDER, get_mib_builder
+from cloudshell.f5.snmp.mib_view_cache import MibViewCache
+
+
+class TestMibViewCache(unittest.TestCase):
+    def _get_snmp_service(self):
+        return Mock(_snmp_engine=SnmpEngine())
+
+    def test_attach(self):
+        mib_view_cache = MibViewCache()
+        first_service = self._get_snmp_service()
+        second_service = self._get_snmp_service()
+
+        view_controller = mib_view_cache.attach(first_service)
+        self.assertIs(mib_view_cache.attach(second_service), view_controller)
+        self.assertIs(
+            CommandGeneratorVarBinds.getMibViewController(second_service._snmp_engine),
+            view_controller,
+        )
+        self.assertEqual((mib_view_cache.hits, mib_view_cache.misses), (1, 1))
+        self.assertEqual(mib_view_cache.hit_rate, 0.5)
+
+    def test_translate(self):
+        snmp_service = self._get_snmp_service()
+        mib_builder = get_mib_builder(snmp_service)
+        mib_builder.addMibSources(DirMibSource(MIBS_FOLDER))
+        view_controller = MibViewCache().attach(snmp_service)
+
+        object_identity = ObjectIdentity("F5-BIGIP-SYSTEM-MIB", "sysInterfaceName")
+        object_identity.resolveWithMib(view_controller)
+
+        self.assertEqual(
+            str(object_identity.getOid()), "1.3.6.1.4.1.3375.2.1.2.4.1.2.1.1"
+        )
+        self.assertNotIn("F5-BIGIP-SYSTEM-MIB", mib_builder.mibSymbols)
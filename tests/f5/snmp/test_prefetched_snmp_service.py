@@ -0,0 +1,45 @@
+import unittest
+from unittest.mock import MagicMock, Mock
+
+from cloudshell.f5.snmp.prefetched_snmp_service import PrefetchedSnmpService
+
+
+def _get_oid_obj(oid):
+    return Mock(get_oid=Mock(return_value=oid))
+
+
+class TestPrefetchedSnmpService(unittest.TestCase):
+    def setUp(self):
+        self.snmp_service = Mock()
+        self.bulk_walker = Mock()
+        self.service = PrefetchedSnmpService(
+            self.snmp_service, MagicMock(), self.bulk_walker
+        )
+        self.response = Mock(_raw_oid="1.3.6.1.2.1.2.2.1.2.1")
+        self.bulk_walker.walk_available.return_value = [[self.response], None]
+        self.service.prefetch(
+            [_get_oid_obj("1.3.6.1.2.1.2.2.1.2"), _get_oid_obj("1.3.6.1.2.1.2.2.1.3")]
+        )
+
+    def test_walk(self):
+        self.assertTrue(self.service.is_prefetched(_get_oid_obj("1.3.6.1.2.1.2.2.1.2")))
+        self.assertEqual(
+            self.service.walk(_get_oid_obj("1.3.6.1.2.1.2.2.1.2")), [self.response]
+        )
+        self.snmp_service.walk.assert_not_called()
+
+        timed_out = _get_oid_obj("1.3.6.1.2.1.2.2.1.3")
+        self.assertFalse(self.service.is_prefetched(timed_out))
+        self.service.walk(timed_out)
+        self.snmp_service.walk.assert_called_once_with(timed_out)
+
+    def test_get_property(self):
+        self.assertIs(
+            self.service.get_property(_get_oid_obj("1.3.6.1.2.1.2.2.1.2.1")),
+            self.response,
+        )
+        self.snmp_service.get_property.assert_not_called()
+
+        other = _get_oid_obj("1.3.6.1.2.1.2.2.1.20.1")
+        self.service.get_property(other)
+        self.snmp_service.get_property.assert_called_once_with(other)
@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from pysnmp.proto import rfc1902
+
+from cloudshell.snmp.cloudshell_snmp import Snmp
+from cloudshell.snmp.core.domain.snmp_oid import SnmpRawOid
+from cloudshell.snmp.snmp_parameters import SNMPReadParameters
+
+from cloudshell.f5.snmp.replay_agent import SnmpReplayAgent
+from cloudshell.f5.snmp.snmp_recording import (
+    SnmpRecorder,
+    format_snmprec_line,
+    parse_snmprec_line,
+    read_snapshot,
+    write_snapshot,
+)
+
+IF_DESCR = (1, 3, 6, 1, 2, 1, 2, 2, 1, 2)
+VAR_BINDS = {
+    (1, 3, 6, 1, 2, 1, 1, 5, 0): rfc1902.OctetString("bigip1"),
+    (1, 3, 6, 1, 2, 1, 1, 3, 0): rfc1902.TimeTicks(1234),
+    IF_DESCR + (1,): rfc1902.OctetString("1.1"),
+    IF_DESCR + (2,): rfc1902.OctetString("1.2"),
+    (1, 3, 6, 1, 2, 1, 2, 2, 1, 6, 1): rfc1902.OctetString(b"\x00\x01\xd7|\n\xff"),
+    (1, 3, 6, 1, 2, 1, 31, 1, 1, 1, 6, 1): rfc1902.Counter64(2**40),
+}
+
+
+class TestSnmprec(unittest.TestCase):
+    def test_line_round_trip(self):
+        for oid, value in VAR_BINDS.items():
+            line = format_snmprec_line(oid, value)
+            self.assertEqual(parse_snmprec_line(line), (oid, value))
+
+    def test_binary_octets_in_hex(self):
+        line = format_snmprec_line((1, 3), rfc1902.OctetString(b"a|\n"))
+        self.assertEqual(line, "1.3|4x|617c0a")
+
+    def test_snapshot_round_trip(self):
+        with tempfile.TemporaryDirectory() as folder:
+            for name in ("device.snmprec", "device.snmprec.gz"):
+                path = os.path.join(folder, name)
+                write_snapshot(path, VAR_BINDS)
+                self.assertEqual(read_snapshot(path), VAR_BINDS)
+
+
+class TestRecordReplay(unittest.TestCase):
+    def test_replay_recorded_walk(self):
+        logger = MagicMock()
+        with SnmpReplayAgent(VAR_BINDS) as agent:
+            host, port = agent.address
+            parameters = SNMPReadParameters(host, "public", port=port)
+            with Snmp().get_snmp_service(parameters, logger) as snmp_service:
+                with SnmpRecorder(snmp_service) as recorder:
+                    responses = snmp_service.walk(
+                        SnmpRawOid(".".join(map(str, IF_DESCR)))
+                    )
+                    sys_name = snmp_service.get_property(
+                        SnmpRawOid("1.3.6.1.2.1.1.5.0")
+                    )
+
+        self.assertEqual(sorted(map(str, responses)), ["1.1", "1.2"])
+        self.assertEqual(sys_name.safe_value, "bigip1")
+        self.assertGreater(agent.requests, 0)
+        for oid in (IF_DESCR + (1,), IF_DESCR + (2,), (1, 3, 6, 1, 2, 1, 1, 5, 0)):
+            self.assertEqual(recorder.var_binds[oid], VAR_BINDS[oid])
@@ -0,0 +1,170 @@
+import socket
+import unittest
+from unittest.mock import MagicMock
+
+from pyasn1.codec.ber import decoder, encoder
+from pyasn1.type import univ
+from pysnmp.proto import api, rfc1902
+
+from cloudshell.f5.snmp.trap_receiver import (
+    SNMP_TRAP_OID,
+    SYS_UP_TIME,
+    F5TrapReceiver,
+    OidTrie,
+)
+
+NOTIFICATIONS = (1, 3, 6, 1, 4, 1, 3375, 2, 4, 0)
+SERVICE_DOWN = NOTIFICATIONS + (10,)
+AGGR_REAPER_STATE_CHANGE = NOTIFICATIONS + (22,)
+NOTIFY_OBJ_MSG = (1, 3, 6, 1, 4, 1, 3375, 2, 4, 1, 1, 0)
+NOTIFY_OBJ_NODE = (1, 3, 6, 1, 4, 1, 3375, 2, 4, 1, 2, 0)
+
+
+def _get_message(oid, var_binds, pdu=None, community="public"):
+    message = api.v2c.Message()
+    api.v2c.apiMessage.setDefaults(message)
+    api.v2c.apiMessage.setCommunity(message, community)
+    if pdu is None:
+        pdu = api.v2c.SNMPv2TrapPDU()
+    api.v2c.apiTrapPDU.setDefaults(pdu)
+    api.v2c.apiTrapPDU.setVarBinds(
+        pdu,
+        [
+            (SYS_UP_TIME, rfc1902.TimeTicks(1234)),
+            (SNMP_TRAP_OID, rfc1902.ObjectName(oid)),
+            *var_binds,
+        ],
+    )
+    api.v2c.apiMessage.setPDU(message, pdu)
+    return encoder.encode(message)
+
+
+def _get_v1_message(enterprise, specific_trap):
+    message = api.v1.Message()
+    api.v1.apiMessage.setDefaults(message)
+    api.v1.apiMessage.setCommunity(message, "public")
+    pdu = api.v1.TrapPDU()
+    api.v1.apiTrapPDU.setDefaults(pdu)
+    api.v1.apiTrapPDU.setEnterprise(pdu, enterprise)
+    api.v1.apiTrapPDU.setGenericTrap(pdu, 6)
+    api.v1.apiTrapPDU.setSpecificTrap(pdu, specific_trap)
+    api.v1.apiTrapPDU.setVarBinds(
+        pdu, [(NOTIFY_OBJ_MSG, rfc1902.OctetString("Reaper state: high"))]
+    )
+    api.v1.apiMessage.setPDU(message, pdu)
+    return encoder.encode(message)
+
+
+class TestOidTrie(unittest.TestCase):
+    def test_longest_prefix(self):
+        trie = OidTrie()
+        trie.add((1, 3), "a")
+        trie.add((1, 3, 6, 1), "b")
+
+        self.assertEqual(trie.find((1, 3, 6, 1, 4)), ("b", 4))
+        self.assertEqual(trie.find((1, 3, 7)), ("a", 2))
+        self.assertEqual(trie.find((2,)), (None, 0))
+        self.assertIsNone(trie.get((1, 3, 6)))
+        self.assertEqual((len(trie), sorted(trie)), (2, ["a", "b"]))
+
+
+class TestF5TrapReceiver(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.receiver = F5TrapReceiver(MagicMock(), "127.0.0.1", 0)
+
+    def test_parse_v2c_trap(self):
+        trap, response = self.receiver.parse(
+            _get_message(
+                SERVICE_DOWN,
+                [
+                    (NOTIFY_OBJ_MSG, rfc1902.OctetString("Pool member down")),
+                    (NOTIFY_OBJ_NODE, rfc1902.OctetString("10.0.0.1")),
+                    ((1, 3, 6, 1, 4, 1, 9999, 1), rfc1902.Integer32(5)),
+                ],
+            ),
+            ("10.0.0.2", 162),
+        )
+
+        self.assertIsNone(response)
+        self.assertEqual(trap.name, "bigipServiceDown")
+        self.assertEqual(trap.symbol.mib, "F5-BIGIP-COMMON-MIB")
+        self.assertEqual(trap.uptime, 1234)
+        self.assertEqual(trap.get("bigipNotifyObjMsg"), "Pool member down")
+        self.assertEqual(
+            trap.var_binds[1:],
+            [
+                ("bigipNotifyObjNode", (0,), "10.0.0.1"),
+                ("1.3.6.1.4.1.9999.1", (), 5),
+            ],
+        )
+
+    def test_parse_v1_trap(self):
+        trap, _ = self.receiver.parse(
+            _get_v1_message(NOTIFICATIONS[:-1], 22), ("10.0.0.2", 162)
+        )
+
+        self.assertEqual(trap.oid, AGGR_REAPER_STATE_CHANGE)
+        self.assertEqual(trap.name, "bigipAggrReaperStateChange")
+        self.assertEqual(trap.get("bigipNotifyObjMsg"), "Reaper state: high")
+
+    def test_dispatch(self):
+        receiver = F5TrapReceiver(MagicMock(), "127.0.0.1", 0)
+        service_down, notifications, everything = MagicMock(), MagicMock(), MagicMock()
+        receiver.subscribe("bigipServiceDown", service_down)
+        receiver.subscribe("bigipNotifications", notifications)
+        receiver.subscribe(None, everything)
+        with self.assertRaises(ValueError):
+            receiver.subscribe("unknownTrap", everything)
+
+        with receiver:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.settimeout(5)
+                sock.sendto(_get_message(SERVICE_DOWN, []), receiver.address)
+                sock.sendto(
+                    _get_message(AGGR_REAPER_STATE_CHANGE, [], community="other"),
+                    receiver.address,
+                )
+                sock.sendto(
+                    _get_message((1, 3, 6, 1, 6, 3, 1, 1, 5, 1), []), receiver.address
+                )
+                # the response to the inform comes after the traps are handled
+                sock.sendto(
+                    _get_message(
+                        AGGR_REAPER_STATE_CHANGE, [], pdu=api.v2c.InformRequestPDU()
+                    ),
+                    receiver.address,
+                )
+                data, _ = sock.recvfrom(65535)
+
+        response, _ = decoder.decode(data, asn1Spec=api.v2c.Message())
+        self.assertTrue(
+            api.v2c.apiMessage.getPDU(response).isSameTypeWith(api.v2c.ResponsePDU())
+        )
+        self.assertEqual(service_down.call_count, 1)
+        self.assertEqual(
+            [call.args[0].name for call in notifications.call_args_list],
+            ["bigipAggrReaperStateChange", "bigipAggrReaperStateChange"],
+        )
+        self.assertEqual(everything.call_args[0][0].name, "coldStart")
+        self.assertEqual(receiver.stats["received"], 4)
+
+    def test_drop_malformed(self):
+        receiver = F5TrapReceiver(MagicMock(), "127.0.0.1", 0)
+        message = _get_message(SERVICE_DOWN, [])
+
+        self.assertIsNone(receiver.receive(message[:-3], ("10.0.0.2", 162)))
+        self.assertIsNone(receiver.receive(b"\x30\x84", ("10.0.0.2", 162)))
+        # OID values with the last sub-id truncated and without a sub-id
+        value = encoder.encode(univ.ObjectIdentifier(NOTIFICATIONS))
+        message = _get_message(
+            SERVICE_DOWN, [(NOTIFY_OBJ_NODE, rfc1902.ObjectName(NOTIFICATIONS))]
+        )
+        for broken_value in (
+            value[:-1] + bytes([value[-1] | 0x80]),
+            value[:2] + b"\x81" * (len(value) - 2),
+        ):
+            broken_message = message.replace(value, broken_value)
+            self.assertNotEqual(broken_message, message)
+            self.assertIsNone(receiver.receive(broken_message, ("10.0.0.2", 162)))
+        self.assertEqual(receiver.stats["dropped"], 4)
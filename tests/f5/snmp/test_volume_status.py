@@ -0,0 +1,96 @@
+import unittest
+
+from pysnmp.proto import rfc1902
+
+from cloudshell.f5.snmp.index_codec import join_index
+from cloudshell.f5.snmp.volume_status import (
+    VOLUME_INDEX,
+    F5SnmpVolumeStatus,
+    get_image_version,
+)
+
+from tests.f5.replay import replay_snmp_service
+
+SW_VOLUME = (1, 3, 6, 1, 4, 1, 3375, 2, 1, 9, 1, 2, 1)
+SW_STATUS = (1, 3, 6, 1, 4, 1, 3375, 2, 1, 9, 4, 2, 1)
+
+
+def _set_volume(var_binds, slot, name, active, product="", version="", build="0.0.6"):
+    index = join_index((slot, name), VOLUME_INDEX)
+    var_binds[SW_VOLUME + (4,) + index] = rfc1902.Integer32(active)
+    if product is None:
+        return
+    for column, value in ((3, product), (4, version), (5, build)):
+        var_binds[SW_STATUS + (column,) + index] = rfc1902.OctetString(value)
+    var_binds[SW_STATUS + (6,) + index] = rfc1902.Integer32(active)
+
+
+class TestF5SnmpVolumeStatus(unittest.TestCase):
+    def test_get_image_version(self):
+        self.assertEqual(
+            get_image_version("BIGIP-16.1.3-0.0.12.iso"), ("16.1.3", "0.0.12")
+        )
+        self.assertEqual(
+            get_image_version("Hotfix-BIGIP-16.1.3.1-0.0.11-ENG.iso"),
+            ("16.1.3.1", "0.0.11"),
+        )
+        self.assertIsNone(get_image_version("firmware.iso"))
+
+    def test_get_install_status(self):
+        var_binds = {}
+        _set_volume(var_binds, 1, "HD1.1", 1, "BIG-IP", "15.1.0")
+        _set_volume(var_binds, 1, "HD1.2", 0, "BIG-IP", "16.1.3", "0.0.12")
+        _set_volume(var_binds, 1, "HD1.3", 0, "BIG-IP", "16.1.3", "")
+        _set_volume(var_binds, 1, "HD1.4", 0)
+        statuses = {}
+
+        with replay_snmp_service(var_binds) as (snmp_service, logger):
+            volume_status = F5SnmpVolumeStatus(snmp_service, logger)
+            for volume in (1.1, 1.2, 1.3, 1.4, 1.5):
+                statuses[volume] = volume_status.get_install_status(
+                    volume, "16.1.3", "0.0.12"
+                )
+
+        self.assertEqual(
+            statuses,
+            {
+                1.1: "failed",
+                1.2: "complete",
+                1.3: "installing",
+                1.4: "installing",
+                1.5: None,
+            },
+        )
+
+    def test_get_volumes(self):
+        var_binds = {}
+        for slot in (1, 2):
+            _set_volume(var_binds, slot, "HD1.1", 1, "BIG-IP", "15.1.0")
+        _set_volume(var_binds, 1, "HD1.2", 0, "BIG-IP", "16.1.3")
+        # still installing on the second slot
+        _set_volume(var_binds, 2, "HD1.2", 0)
+        _set_volume(var_binds, 1, "HD1.3", 0, product=None)
+        _set_volume(var_binds, 1, "MD1.1", 0, "BIG-IP", "16.1.3")
+
+        with replay_snmp_service(var_binds) as (snmp_service, logger):
+            volumes = F5SnmpVolumeStatus(snmp_service, logger).get_volumes()
+
+        self.assertEqual(sorted(volumes), [1.1, 1.2, 1.3])
+        self.assertEqual(
+            volumes[1.1],
+            {
+                "volume": "1.1",
+                "product": "BIG-IP",
+                "version": "15.1.0",
+                "build": "0.0.6",
+                "is_running": "yes",
+                "status": "complete",
+            },
+        )
+        self.assertEqual(
+            (volumes[1.2]["version"], volumes[1.2]["is_running"]), ("16.1.3", "no")
+        )
+        self.assertEqual(volumes[1.2]["status"], "installing")
+        self.assertEqual(
+            (volumes[1.3]["version"], volumes[1.3]["status"]), ("none", "installing")
+        )
@@ -0,0 +1,94 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+
+from pysnmp.proto import rfc1902
+
+from cloudshell.snmp.cloudshell_snmp import Snmp
+from cloudshell.snmp.core.domain.snmp_oid import SnmpMibObject
+from cloudshell.snmp.snmp_parameters import SNMPReadParameters
+
+from cloudshell.f5.snmp.async_snmp import AsyncSnmpClient
+from cloudshell.f5.snmp.bulk_walker import AdaptiveBulkWalker
+from cloudshell.f5.snmp.replay_agent import SnmpReplayAgent
+from cloudshell.f5.snmp.walk_stats import WalkStatsRecorder
+
+IF_DESCR = (1, 3, 6, 1, 2, 1, 2, 2, 1, 2)
+IF_MTU = (1, 3, 6, 1, 2, 1, 2, 2, 1, 4)
+VAR_BINDS = {
+    (1, 3, 6, 1, 2, 1, 1, 5, 0): rfc1902.OctetString("bigip1"),
+    **{
+        IF_DESCR + (index,): rfc1902.OctetString(f"1.{index}") for index in range(1, 41)
+    },
+    **{IF_MTU + (index,): rfc1902.Integer32(1500) for index in range(1, 41)},
+}
+
+
+class TestWalkStatsRecorder(unittest.TestCase):
+    def setUp(self):
+        self.agent = SnmpReplayAgent(VAR_BINDS)
+        self.agent.start()
+        self.addCleanup(self.agent.stop)
+        host, port = self.agent.address
+        self.parameters = SNMPReadParameters(host, "public", port=port)
+
+    def _get_tables(self, summary):
+        return {(stats.operation, stats.name): stats for stats in summary.tables}
+
+    def test_concurrent_walks_and_gets(self):
+        logger = MagicMock()
+        with Snmp().get_snmp_service(self.parameters, logger) as snmp_service:
+            walker = AdaptiveBulkWalker(snmp_service, logger, max_repetitions=5)
+            with WalkStatsRecorder(snmp_service) as recorder:
+                walker.walk_many(
+                    [
+                        SnmpMibObject("IF-MIB", "ifDescr"),
+                        SnmpMibObject("IF-MIB", "ifMtu"),
+                    ],
+                    max_concurrency=2,
+                )
+                for index in (1, 2, 99):
+                    snmp_service.get_property(SnmpMibObject("IF-MIB", "ifMtu", index))
+
+        summary = recorder.summary
+        tables = self._get_tables(summary)
+        self.assertEqual(
+            sorted(tables),
+            [
+                ("get", "IF-MIB::ifMtu"),
+                ("walk", "IF-MIB::ifDescr"),
+                ("walk", "IF-MIB::ifMtu"),
+            ],
+        )
+        self.assertEqual(tables["walk", "IF-MIB::ifDescr"].rows, 40)
+        self.assertEqual(tables["walk", "IF-MIB::ifDescr"].walks, 1)
+        self.assertGreater(tables["walk", "IF-MIB::ifDescr"].requests, 1)
+        self.assertEqual(tables["walk", "IF-MIB::ifMtu"].rows, 40)
+        self.assertEqual(tables["get", "IF-MIB::ifMtu"].rows, 2)
+        self.assertEqual(tables["get", "IF-MIB::ifMtu"].requests, 3)
+        self.assertEqual(summary.total_requests, self.agent.requests)
+        self.assertEqual(summary.total_timeouts, 0)
+        self.assertGreater(summary.total_bytes, 0)
+        self.assertEqual(
+            summary.as_dict()["tables"][0]["requests"], summary.tables[0].requests
+        )
+
+    def test_async_client_requests(self):
+        host, port = self.agent.address
+        with Snmp().get_snmp_service(self.parameters, MagicMock()) as snmp_service:
+            snmp_service.load_mib_tables(["IF-MIB"])
+            recorder = WalkStatsRecorder(snmp_service)
+
+            async def run():
+                client = AsyncSnmpClient(
+                    host, "public", port=port, max_repetitions=7, walk_stats=recorder
+                )
+                async with client:
+                    await client.walk_many([IF_DESCR, IF_MTU], 2)
+
+            with recorder:
+                asyncio.run(run())
+
+        tables = self._get_tables(recorder.summary)
+        self.assertEqual(tables["walk", "IF-MIB::ifDescr"].rows, 40)
+        self.assertEqual(tables["walk", "IF-MIB::ifMtu"].requests, 6)